@@ -2,9 +2,19 @@
 
 __version__ = "0.2.4"
 
+import asyncio
+
 from .server import mcp
 
 
 def main():
     """Run the MCP server."""
+    # uvloop (pip install noapi-google-search-mcp[speedups]) cuts per-callback
+    # overhead on Playwright's many small CDP round trips
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run(transport="stdio")
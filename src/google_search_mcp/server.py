@@ -6,6 +6,7 @@ using headless Chromium (via Playwright) and returns structured results.
 
 Tools provided:
     - google_search: Search with time filtering, site filtering, pagination, language/region
+    - google_search_batch: Run several Google searches in parallel
     - google_news: Search Google News for recent headlines
     - google_scholar: Search Google Scholar for academic papers
     - google_images: Search Google Images for image URLs
@@ -27,6 +28,7 @@ Tools provided:
     - extract_video_clip: Extract a video clip by topic
     - list_images: List image files in a directory for use with google_lens
     - visit_page: Fetch a URL and return its text content
+    - visit_pages: Fetch several URLs in parallel and return their text content
     - subscribe: Subscribe to content sources (news RSS, Reddit, HN, GitHub, arXiv, YouTube, podcasts, Twitter/X)
     - unsubscribe: Remove a subscription and its stored content
     - list_subscriptions: List all active feed subscriptions
@@ -36,27 +38,97 @@ Tools provided:
 """
 
 import asyncio
+import contextvars
+import functools
 import hashlib
 import imaplib
 import json
+import logging
 import os
 import random
 import re
 import sqlite3
 import subprocess
+import sys
+import threading
+import time
+import traceback
 import urllib.request
+import weakref
 import xml.etree.ElementTree as ET
 import zipfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from email import policy as email_policy
 from email.parser import BytesParser as EmailParser
 from pathlib import Path
-from urllib.parse import quote_plus
+from types import MappingProxyType
+from urllib.parse import parse_qs, quote_plus, urlencode, urljoin, urlparse
 
+import httpx
 from mcp.server.fastmcp import Context, FastMCP, Image
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
+from selectolax.lexbor import LexborHTMLParser
 
-mcp = FastMCP("google-search")
+
+def _disable_playwright_stack_capture():
+    """Replace Playwright's per-call Python stack capture with a cheap api-name lookup.
+
+    playwright-python walks every frame (materialising f_locals) and calls
+    traceback.extract_stack() on each API call, purely to attach source
+    locations to traces and errors. We only keep the "Page.goto"-style api
+    name that prefixes error messages. Set PW_INSPECT_STACK=1 to disable.
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return
+
+    internal_prefix = _connection._PLAYWRIGHT_MODULE_PATH
+    mapping_file = _connection.playwright._impl._impl_to_api_mapping.__file__
+
+    def capture_api_name():
+        frame = sys._getframe(2)
+        api_name = ""
+        while frame:
+            code = frame.f_code
+            if code.co_filename.startswith(internal_prefix):
+                if code.co_filename != mapping_file:
+                    api_name = getattr(code, "co_qualname", code.co_name)
+            elif api_name:
+                break
+            frame = frame.f_back
+        return {"frames": [], "apiName": api_name, "title": None}
+
+    class _NoStackTraceback:
+        def __getattr__(self, name):
+            return getattr(traceback, name)
+
+        @staticmethod
+        def extract_stack(*args, **kwargs):
+            return traceback.StackSummary()
+
+    _connection._capture_stack_trace = capture_api_name
+    _connection.traceback = _NoStackTraceback()
+
+
+if os.environ.get("PW_INSPECT_STACK", "0") == "0":
+    _disable_playwright_stack_capture()
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the shared browser and HTTP client when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        await _close_browser()
+        await _http.aclose()
+
+
+mcp = FastMCP("google-search", lifespan=_lifespan)
 
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -124,28 +196,802 @@ TIME_RANGE_MAP = {
     "past_year": "qdr:y",
 }
 
+# Compiled once here so hot paths never go through re's pattern cache
+_WHITESPACE_RE = re.compile(r"\s+")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+_HOTEL_PRICE_RE = re.compile(r"(?:CHF|USD|\$|€|£)\s*[\d,.]+", re.I)
+_HOTEL_PRICE_SUFFIX_RE = re.compile(r"[\d,.]+\s*(?:CHF|USD|EUR|per night)", re.I)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_SCRIPT_BLOCK_RE = re.compile(r"<script\b.*?</script>", re.S | re.I)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\s-]")
+_YT_CHANNEL_ID_RE = re.compile(r"^UC[\w-]{22}$")
+_YT_CHANNEL_REF_RES = (
+    re.compile(r'"channelId"\s*:\s*"(UC[\w-]{22})"'),
+    re.compile(r"channel_id=(UC[\w-]{22})"),
+    re.compile(r"/channel/(UC[\w-]{22})"),
+)
+_YT_NAME_RE = re.compile(r'"name"\s*:\s*"([^"]{1,100})"')
+# Symbols Google Finance has a quote page for: "AAPL:NASDAQ", ".INX:INDEXSP", "BTC-USD"
+_TICKER_RE = re.compile(r"^(?:\.?[A-Z0-9][A-Z0-9.]{0,11}:[A-Z]{2,12}|[A-Z]{3,5}-[A-Z]{3})$", re.I)
+
+# Retries and repeat queries re-encode the same strings; memoise the encoding.  Only for
+# short search queries: free text such as translations would stay pinned in the cache
+_quote_plus = functools.lru_cache(maxsize=512)(quote_plus)
+
+
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-infobars",
+    "--window-size=1280,800",
+]
+
+
+# DOM extractors installed once per pooled context, so each call only sends a short
+# function reference over CDP instead of the full source for V8 to re-parse
+_EXTRACTOR_JS = """
+// Resolves true once selector matches, or false after timeoutMs.  With rowSelector, it
+// also waits until minRows rows have streamed in or the parser has finished,
+// so extraction can start while the rest of the page is still arriving.
+window.__waitFor = (selector, timeoutMs, rowSelector, minRows) => new Promise((resolve) => {
+    const ready = () => !!document.querySelector(selector) && (
+        !rowSelector
+        || document.readyState !== 'loading'
+        || document.querySelectorAll(rowSelector).length >= minRows
+    );
+    if (ready()) { resolve(true); return; }
+    let observer = null;
+    let timer = null;
+    const check = () => { if (ready()) done(true); };
+    const done = (ok) => {
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        document.removeEventListener('readystatechange', check);
+        resolve(ok);
+    };
+    observer = new MutationObserver(check);
+    observer.observe(document, { childList: true, subtree: true });
+    document.addEventListener('readystatechange', check);
+    timer = setTimeout(() => done(false), timeoutMs);
+});
+
+// querySelectorAll scoped to the results container, so the walk skips the header,
+// sidebars and footers.  Falls back to the whole document when nothing matches there.
+window.__queryIn = (rootSelector, selector) => {
+    const root = document.querySelector(rootSelector);
+    const found = root ? root.querySelectorAll(selector) : null;
+    return found && found.length ? found : document.querySelectorAll(selector);
+};
+
+window.__extractPage = (maxChars) => {
+    const remove = document.querySelectorAll(
+        'script, style, nav, footer, header, iframe, noscript, '
+        + 'svg, [role="navigation"], [role="banner"], '
+        + '[role="complementary"], .sidebar, .ad, .ads, .advertisement'
+    );
+    remove.forEach(el => el.remove());
+
+    const article = document.querySelector(
+        'article, main, [role="main"], .post-content, .article-body, '
+        + '.entry-content, .content, #content'
+    );
+    const source = article || document.body;
+    if (!source) return { text: '', truncated: false };
+
+    // Stop collecting once twice the budget is reached; collapsing only shrinks text
+    const budget = maxChars * 2;
+    let cut = false;
+
+    // textContent of block elements avoids the forced layout pass innerText needs.
+    // Nested blocks are covered by their outermost block, so they are skipped.
+    const blocks = 'p, li, h1, h2, h3, h4, h5, h6, pre, blockquote, tr';
+    const parts = [];
+    let length = 0;
+    for (const el of source.querySelectorAll(blocks)) {
+        if (el.parentElement && el.parentElement.closest(blocks)) continue;
+        const t = el.tagName === 'PRE'
+            ? el.textContent.trim()
+            : el.textContent.replace(/\\s+/g, ' ').trim();
+        if (!t) continue;
+        parts.push(t);
+        length += t.length + 1;
+        if (length > budget) { cut = true; break; }
+    }
+    let text = parts.join('\\n');
 
-async def _launch_browser(pw, viewport=None):
-    """Launch a headless Chromium browser with stealth settings to avoid bot detection."""
-    browser = await pw.chromium.launch(
-        headless=True,
-        args=[
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-infobars",
-            "--window-size=1280,800",
-        ],
-    )
-    vp = viewport or {"width": 1280, "height": 800}
+    // Pages without semantic blocks fall back to the layout-aware innerText
+    if (text.length < 200) {
+        const raw = source.innerText;
+        cut = raw.length > budget;
+        text = cut ? raw.slice(0, budget) : raw;
+    }
+
+    // Collapse and truncate here so at most maxChars cross the CDP connection
+    text = text.replace(/\\n{3,}/g, '\\n\\n').trim();
+    const truncated = cut || text.length > maxChars;
+    return { text: truncated ? text.slice(0, maxChars) : text, truncated };
+};
+"""
+
+# Per-tool extractors registered by the scraper sections below.  They are
+# installed next to _EXTRACTOR_JS as window.__scrape_<name>
+_PAGE_EXTRACTORS: dict[str, str] = {}
+
+
+def _page_extractor(name: str, source: str) -> str:
+    """Install ``source``, a JS expression evaluating to a function, in every pooled context.
+
+    An IIFE can hold state built once per document, such as precompiled
+    regexes.  Returns the short call expression to pass to page.evaluate.
+    """
+    _PAGE_EXTRACTORS[name] = source.strip()
+    return f"(arg) => window.__scrape_{name}(arg)"
+
+
+_DEFAULT_VIEWPORT = {"width": 1280, "height": 800}
+# Larger page for the map screenshots returned by the maps tools
+_MAP_VIEWPORT = {"width": 1400, "height": 900}
+
+
+# Cookies and localStorage of the incognito contexts, saved at shutdown and loaded into
+# new ones, so they come back as a returning visitor the way the on-disk profile does.
+# Their HTTP cache can't be persisted: Chromium keeps an incognito context's cache in
+# memory and ignores --disk-cache-dir for it, so only the profile caches Google's
+# script bundles on disk
+STORAGE_STATE_PATH = os.path.join(os.path.expanduser("~"), ".google_mcp_storage_state.json")
+
+
+def _read_storage_state() -> dict | None:
+    """Return the saved incognito storage state, or None if there is none or it is unreadable."""
+    try:
+        with open(STORAGE_STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+async def _new_context(browser, viewport=None):
+    """Create a browser context with the stealth user agent, viewport, saved storage state and init script."""
+    vp = viewport or _DEFAULT_VIEWPORT
     context = await browser.new_context(
         user_agent=USER_AGENT,
         viewport=vp,
         locale="en-US",
+        storage_state=_read_storage_state(),
     )
     # Inject stealth patches before any page loads
     await context.add_init_script(STEALTH_JS)
-    return browser, context
+    return context
+
+
+# ---------------------------------------------------------------------------
+# Shared browser — launched once on first use and reused across tool calls
+# ---------------------------------------------------------------------------
+
+_pw = None
+_browser = None
+_browser_lock = asyncio.Lock()
+
+# A long-lived Chromium slowly accumulates memory, so after this many borrowed pages it
+# is retired: new work goes to a fresh browser and the old one closes once drained.  The
+# persistent-profile context (see PROFILE_DIR) is retired and relaunched the same way
+BROWSER_MAX_USES = int(os.environ.get("GSM_BROWSER_MAX_USES", "200"))
+BROWSER_MAX_RSS_MB = int(os.environ.get("GSM_BROWSER_MAX_RSS_MB", "1024"))
+_RSS_CHECK_EVERY = 20
+_browser_uses = 0
+_browser_active: dict = {}
+_retired_browsers: set = set()
+
+# On-disk Chromium profile. Pooled pages come from one persistent context, so the
+# HTTP cache, HSTS and TLS session state survive between requests and restarts and
+# Google's script bundles are served from disk.  Its pages share the profile's cookie
+# jar; pass isolate=True to the pool for a request that needs its own context.  Set
+# GSM_PROFILE_DIR="" for incognito contexts. Only one server process can use a given
+# profile directory; if it is locked by another process the pool falls back to
+# incognito contexts.
+PROFILE_DIR = os.path.expanduser(
+    os.environ.get("GSM_PROFILE_DIR", str(Path.home() / ".cache" / "gsmcp-chromium"))
+)
+PROFILE_DISK_CACHE_BYTES = 200 * 1024 * 1024
+_profile_context = None
+_profile_uses = 0
+# A retired profile context still finishing requests; the directory stays locked until
+# it closes, so new slots use incognito contexts meanwhile
+_profile_draining = None
+_profile_failed = False
+
+# Attach to an already running Chromium over CDP instead of launching one, so several
+# server processes (one per MCP client) share a single browser, e.g. one started with
+# --remote-debugging-port=9222 and GSM_CDP_URL=http://127.0.0.1:9222.  Pooled pages
+# then use incognito contexts on that browser, and shutdown only disconnects from it.
+CDP_URL = os.environ.get("GSM_CDP_URL", "")
+
+
+async def _get_browser():
+    """Return the shared headless Chromium, launching it on first use, after a crash or retirement.
+
+    With GSM_CDP_URL set, connects to that browser instead, and only launches
+    one locally if it cannot be reached.
+    """
+    global _pw, _browser, _browser_uses
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _pw is None:
+                _pw = await async_playwright().start()
+            _browser = None
+            if CDP_URL:
+                try:
+                    _browser = await _pw.chromium.connect_over_cdp(CDP_URL)
+                except Exception as e:
+                    print(f"Chromium at {CDP_URL} unreachable, launching a local browser: {e}", file=sys.stderr)
+            if _browser is None:
+                _browser = await _pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            _browser_uses = 0
+        return _browser
+
+
+def _child_rss_mb() -> float:
+    """Resident memory of all our child processes (Playwright driver + Chromium), if psutil is installed."""
+    try:
+        import psutil
+    except ImportError:
+        return 0.0
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+
+def _browser_checkout(owner):
+    """Record a page borrowed from ``owner`` and retire it at BROWSER_MAX_USES or BROWSER_MAX_RSS_MB.
+
+    ``owner`` is a browser, or the persistent-profile context, which owns its
+    own Chromium and is retired the same way.
+    """
+    global _browser, _browser_uses, _profile_context, _profile_uses, _profile_draining
+    _browser_active[owner] = _browser_active.get(owner, 0) + 1
+    if owner is _browser:
+        _browser_uses += 1
+        uses = _browser_uses
+    elif owner is _profile_context:
+        _profile_uses += 1
+        uses = _profile_uses
+    else:
+        return
+    if uses >= BROWSER_MAX_USES or (
+        uses % _RSS_CHECK_EVERY == 0 and _child_rss_mb() > BROWSER_MAX_RSS_MB
+    ):
+        _retired_browsers.add(owner)
+        if owner is _browser:
+            _browser = None
+        else:
+            _profile_context = None
+            _profile_draining = owner
+
+
+# Shutdowns of retired browsers and recycled contexts run off the request path.
+# The set keeps the tasks alive until done, and lets _close_browser wait for them
+_background_closes: set = set()
+
+
+def _close_in_background(closable):
+    """Close a browser, context or page without making the current request wait."""
+    async def close():
+        try:
+            await closable.close()
+        except Exception:
+            pass
+
+    task = asyncio.create_task(close())
+    _background_closes.add(task)
+    task.add_done_callback(_background_closes.discard)
+
+
+async def _browser_checkin(owner):
+    """Record a returned page, closing a retired browser or profile context when its last page comes back."""
+    _browser_active[owner] -= 1
+    if _browser_active[owner] == 0:
+        del _browser_active[owner]
+        if owner in _retired_browsers:
+            _retired_browsers.discard(owner)
+            _close_in_background(owner)
+
+
+async def _get_profile_context():
+    """Return the persistent-profile context, launching Chromium on first use or after a crash.
+
+    Returns None if the profile cannot be opened (e.g. another server holds it),
+    or while a retired profile context is still draining.
+    """
+    global _pw, _profile_context, _profile_uses, _profile_failed
+    async with _browser_lock:
+        if _profile_context is None:
+            if _profile_failed or _profile_draining is not None:
+                return None
+            if _pw is None:
+                _pw = await async_playwright().start()
+            try:
+                context = await _pw.chromium.launch_persistent_context(
+                    PROFILE_DIR,
+                    headless=True,
+                    args=CHROMIUM_ARGS + [f"--disk-cache-size={PROFILE_DISK_CACHE_BYTES}"],
+                    user_agent=USER_AGENT,
+                    viewport=_DEFAULT_VIEWPORT,
+                    locale="en-US",
+                )
+            except Exception as e:
+                print(f"Chromium profile {PROFILE_DIR} unavailable, using incognito contexts: {e}", file=sys.stderr)
+                _profile_failed = True
+                return None
+            await context.add_init_script(STEALTH_JS)
+            await _setup_pooled_context(context)
+            context.on("close", _forget_profile_context)
+            _profile_context = context
+            _profile_uses = 0
+        return _profile_context
+
+
+def _forget_profile_context(context):
+    global _profile_context, _profile_draining
+    if _profile_context is context:
+        _profile_context = None
+    if _profile_draining is context:
+        _profile_draining = None
+
+
+async def _close_browser():
+    """Shut down the shared browser and the Playwright driver."""
+    global _pw, _browser, _profile_context, _profile_draining
+    if _background_closes:
+        await asyncio.gather(*_background_closes)
+    await _context_pool.save_storage_state()
+    async with _browser_lock:
+        for browser in list(_retired_browsers):
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        _retired_browsers.clear()
+        _profile_draining = None
+        if _profile_context is not None:
+            try:
+                await _profile_context.close()
+            except Exception:
+                pass
+            _profile_context = None
+        if _browser is not None:
+            try:
+                await _browser.close()
+            except Exception:
+                pass
+            _browser = None
+        if _pw is not None:
+            try:
+                await _pw.stop()
+            except Exception:
+                pass
+            _pw = None
+
+
+# Text-only scrapers never need these; reCAPTCHA assets stay allowed so the solver can see tiles
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# Telemetry beacons and ad/analytics hosts never contribute to what we scrape
+_BLOCKED_URL_PARTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googleadservices.com", "/gen_204", "/client_204",
+)
+
+
+# Minimum spacing, in seconds, between page loads on the same Google host.  Bursts of
+# parallel hits from one IP are what trip the "unusual traffic" interstitial, whose
+# captcha costs far more than the wait.  Set GSM_HOST_MIN_GAP=0 to disable
+HOST_MIN_GAP = float(os.environ.get("GSM_HOST_MIN_GAP", "0.5"))
+_host_next_slot: dict[str, float] = {}
+
+
+async def _throttle_host(host: str):
+    """Wait for ``host``'s next free slot, spacing Google page loads HOST_MIN_GAP apart with jitter."""
+    if HOST_MIN_GAP <= 0 or not (host == "google.com" or host.endswith(".google.com")):
+        return
+    # Reserve the slot before sleeping, so concurrent callers queue up behind each other
+    now = time.monotonic()
+    slot = max(now, _host_next_slot.get(host, 0.0))
+    _host_next_slot[host] = slot + HOST_MIN_GAP * random.uniform(0.8, 1.2)
+    if slot > now:
+        with _Phase("throttle"):
+            await asyncio.sleep(slot - now)
+
+
+async def _block_heavy_resources(route):
+    """Abort image/media/font/stylesheet and analytics requests, letting everything else through."""
+    request = route.request
+    url = request.url
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES and "recaptcha" not in url) or any(
+        part in url for part in _BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        if request.is_navigation_request():
+            await _throttle_host(urlparse(url).hostname or "")
+        await route.continue_()
+
+
+async def _block_beacons(route):
+    """Abort media and analytics requests only, for pages that must render images and styles."""
+    request = route.request
+    if request.resource_type == "media" or any(part in request.url for part in _BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        if request.is_navigation_request():
+            await _throttle_host(urlparse(request.url).hostname or "")
+        await route.continue_()
+
+
+# Pre-accepted consent state, so pooled contexts never get the EU consent interstitial
+_CONSENT_COOKIES = [
+    {"name": "CONSENT", "value": "YES+", "domain": ".google.com", "path": "/"},
+    {"name": "SOCS", "value": "CAI", "domain": ".google.com", "path": "/"},
+]
+
+# How many requests may drive Chromium at once; extra tool calls queue instead of
+# piling more contexts onto the browser
+BROWSER_CONCURRENCY = max(1, int(os.environ.get("GSM_CONCURRENCY", "4")))
+_browser_sem = asyncio.Semaphore(BROWSER_CONCURRENCY)
+
+# Per-context state (cache, JS heap, service workers, cookies) grows with every page
+# load, so a pooled slot is thrown away and rebuilt after this many requests or
+# this many seconds, whichever comes first
+CONTEXT_MAX_USES = max(1, int(os.environ.get("GSM_CONTEXT_MAX_USES", "50")))
+CONTEXT_MAX_AGE = int(os.environ.get("GSM_CONTEXT_MAX_AGE", "900"))
+
+
+async def _setup_pooled_context(context):
+    """Apply extractors and cookies to a context used by the pool."""
+    await context.add_init_script(_EXTRACTOR_JS + "".join(
+        f"\nwindow.__scrape_{name} = {source};\n" for name, source in _PAGE_EXTRACTORS.items()
+    ))
+    await context.add_cookies(_CONSENT_COOKIES)
+    await _load_cookies(context)
+
+
+class _ContextPool:
+    """Warm contexts on the shared browser, each with one open page.
+
+    Requests borrow a (context, page) pair instead of building a new context.
+    Borrowing holds ``_browser_sem``, so the pool never grows beyond
+    ``BROWSER_CONCURRENCY`` slots.  Released pages are reset to about:blank;
+    broken slots, and slots that have served ``CONTEXT_MAX_USES`` requests or
+    lived ``CONTEXT_MAX_AGE`` seconds, are dropped and rebuilt on demand.
+    Normally every slot is a page in the one persistent-profile context (see
+    PROFILE_DIR), and only the page is dropped; the context itself is retired
+    like a browser.  With the profile disabled, locked or draining, each slot
+    is its own incognito context on the shared browser.
+
+    Each slot is a ``[context, page, blocking, uses, created]`` list, where
+    ``blocking`` is the route handler currently installed on the page, ``uses``
+    counts the requests it has served and ``created`` is its time.monotonic()
+    birth time.
+    """
+
+    def __init__(self):
+        self._idle = []
+
+    async def _new_slot(self, isolate=False):
+        context = None
+        if PROFILE_DIR and not CDP_URL and not isolate:
+            context = await _get_profile_context()
+        if context is None:
+            context = await _new_context(await _get_browser())
+            await _setup_pooled_context(context)
+        page = await context.new_page()
+        return [context, page, None, 0, time.monotonic()]
+
+    async def _take_idle(self):
+        while self._idle:
+            slot = self._idle.pop()
+            context, page = slot[0], slot[1]
+            browser = context.browser
+            if (
+                not page.is_closed()
+                and time.monotonic() - slot[4] < CONTEXT_MAX_AGE
+                and (browser or context) not in _retired_browsers
+                and (browser is None or browser.is_connected())
+                # Incognito stand-ins from a profile drain give way once it is back
+                and not (browser is not None and _profile_context is not None)
+            ):
+                return slot
+            await self._discard(context, page)
+        return None
+
+    @asynccontextmanager
+    async def acquire(self, block_resources=True, isolate=False, viewport=None):
+        """Borrow a (context, page) pair for the duration of one request.
+
+        With ``block_resources`` the page aborts image/media/font/stylesheet
+        requests; pass False for scrapers that need images to render, which
+        still drops media and analytics beacons.  With
+        ``isolate`` the request gets a fresh incognito context, outside the
+        persistent profile, that is closed afterwards.  A ``viewport`` resizes
+        the page for this request only, e.g. for larger screenshots.
+        """
+        async with _browser_sem:
+            with _Phase("acquire"):
+                if isolate:
+                    slot = await self._new_slot(isolate=True)
+                else:
+                    slot = await self._take_idle() or await self._new_slot()
+            context, page, blocking = slot[0], slot[1], slot[2]
+            # Persistent-profile contexts have no browser object; they own their Chromium
+            owner = context.browser or context
+            _browser_checkout(owner)
+            try:
+                handler = _block_heavy_resources if block_resources else _block_beacons
+                if blocking is not handler:
+                    if blocking is not None:
+                        await page.unroute("**/*", blocking)
+                    await page.route("**/*", handler)
+                    slot[2] = handler
+                if viewport:
+                    await page.set_viewport_size(viewport)
+                yield context, page
+            finally:
+                slot[3] += 1
+                if (
+                    isolate
+                    or slot[3] >= CONTEXT_MAX_USES
+                    or time.monotonic() - slot[4] >= CONTEXT_MAX_AGE
+                ):
+                    await self._discard(context, page)
+                else:
+                    try:
+                        await page.goto("about:blank", timeout=5000)
+                        if viewport:
+                            await page.set_viewport_size(_DEFAULT_VIEWPORT)
+                    except Exception:
+                        await self._discard(context, page)
+                    else:
+                        self._idle.append(slot)
+                await _browser_checkin(owner)
+
+    async def save_storage_state(self):
+        """Write an idle incognito slot's cookies and localStorage to STORAGE_STATE_PATH."""
+        for context, page, *_ in reversed(self._idle):
+            if context.browser is not None and not page.is_closed():
+                try:
+                    await context.storage_state(path=STORAGE_STATE_PATH)
+                    return
+                except Exception:
+                    pass
+
+    async def _discard(self, context, page):
+        # A persistent-profile context is shared by every slot; only drop the page
+        _close_in_background(page if context.browser is None else context)
+
+
+# Slots are created on demand, since contexts can only be made inside the event loop
+_context_pool = _ContextPool()
+
+
+# ---------------------------------------------------------------------------
+# Perf timings — per-phase durations logged to "gsmcp.perf" at DEBUG level
+# ---------------------------------------------------------------------------
+
+_perf_log = logging.getLogger("gsmcp.perf")
+if os.environ.get("GSM_PERF_LOG"):
+    # stdout carries the MCP protocol, so timings go to stderr
+    _perf_log.addHandler(logging.StreamHandler(sys.stderr))
+    _perf_log.setLevel(logging.DEBUG)
+    _perf_log.propagate = False
+
+# Phase durations (ns) for the scrape running in the current task, or None when not timing
+_perf_phases: contextvars.ContextVar = contextvars.ContextVar("gsmcp_perf_phases", default=None)
+
+
+def _timed(fn):
+    """Log one JSON line of phase timings per call of an async scraper, if DEBUG is enabled."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if not _perf_log.isEnabledFor(logging.DEBUG):
+            return await fn(*args, **kwargs)
+        phases = {}
+        token = _perf_phases.set(phases)
+        start = time.perf_counter_ns()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            phases["total"] = time.perf_counter_ns() - start
+            _perf_phases.reset(token)
+            _perf_log.debug(json.dumps(
+                {"op": fn.__name__, **{f"{k}_ms": round(v / 1e6, 2) for k, v in phases.items()}}
+            ))
+    return wrapper
+
+
+class _Phase:
+    """Context manager adding the block's duration to the current call's timings; a no-op otherwise."""
+
+    __slots__ = ("name", "phases", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.phases = _perf_phases.get()
+        if self.phases is not None:
+            self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        if self.phases is not None:
+            self.phases[self.name] = self.phases.get(self.name, 0) + time.perf_counter_ns() - self.start
+
+
+# ---------------------------------------------------------------------------
+# Result cache — repeated tool calls within the TTL skip the browser entirely
+# ---------------------------------------------------------------------------
+
+class _TTLCache:
+    """Small LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    With ``maxbytes`` the cache is also bounded by the total size of its values
+    (see _result_nbytes), for results that carry inline images.
+    """
+
+    def __init__(self, maxsize=128, ttl=300, maxbytes=0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._data = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value, _ = entry
+        if time.monotonic() > expires:
+            self._pop(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        size = _result_nbytes(value) if self.maxbytes else 0
+        if key in self._data:
+            self._pop(key)
+        if size > self.maxbytes > 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value, size)
+        self._bytes += size
+        while len(self._data) > self.maxsize or (self.maxbytes and self._bytes > self.maxbytes):
+            self._bytes -= self._data.popitem(last=False)[1][2]
+
+    def _pop(self, key):
+        self._bytes -= self._data.pop(key)[2]
+
+
+def _result_nbytes(result) -> int:
+    """Approximate size of a tool result: its text plus any inline image data."""
+    if isinstance(result, list):
+        return sum(
+            len(item.data or b"") if isinstance(item, Image) else len(str(item))
+            for item in result
+        )
+    return len(result) if isinstance(result, str) else 0
+
+
+# Failures, blocks and empty extractions are usually transient, so they are not cached
+_UNCACHEABLE_RE = re.compile(
+    r"^(?:[\w ]* failed\b|Failed to |Could not |No (?:\w+ )?results found|Search blocked"
+    r"|File not found|Google Lens could not )"
+)
+
+
+def _is_cacheable(result) -> bool:
+    """Return True if a tool result is a real answer worth caching.
+
+    Mixed text/image results are judged by their leading text block.
+    """
+    if isinstance(result, list):
+        if not result:
+            return False
+        result = result[0] if isinstance(result[0], str) else ""
+    return not _UNCACHEABLE_RE.match(result)
+
+
+# Calls currently running, keyed like the caches, so concurrent duplicates share one scrape
+_inflight: dict = {}
+
+
+async def _single_flight(key, factory):
+    """Await ``factory()`` once per key; concurrent callers with the same key get its result.
+
+    If the caller running the factory is cancelled, the ones waiting on it
+    are not: they retry, and one of them runs the factory instead.
+    """
+    fut = _inflight.get(key)
+    while fut is not None:
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if not fut.cancelled():  # this caller was cancelled, not the leader
+                raise
+        fut = _inflight.get(key)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved so an unawaited future doesn't log a warning
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+_search_cache = _TTLCache(maxsize=128, ttl=300)
+_page_cache = _TTLCache(maxsize=128, ttl=600)
+_results_cache = _TTLCache(maxsize=512, ttl=300)
+# Image search, news and shopping answers embed downloaded images (up to 5 MB each),
+# so they are kept apart from the text results and bounded by size
+_media_cache = _TTLCache(maxsize=64, ttl=300, maxbytes=64 * 1024 * 1024)
+# Scholar listings barely move within an hour
+_scholar_cache = _TTLCache(maxsize=128, ttl=3600)
+# Quotes move by the second, so finance answers are only reused for repeat asks
+_quote_cache = _TTLCache(maxsize=256, ttl=30)
+_weather_cache = _TTLCache(maxsize=256, ttl=300)
+# Place listings and routes change slowly, and each maps or directions call carries a
+# full-viewport screenshot
+_places_cache = _TTLCache(maxsize=128, ttl=600, maxbytes=128 * 1024 * 1024)
+# A translation of the same text stays valid all day
+_translate_cache = _TTLCache(maxsize=512, ttl=86400)
+# Lens answers for the same image don't change within the hour
+_lens_cache = _TTLCache(maxsize=128, ttl=3600)
+# Fares and room rates move, so travel answers are only reused briefly.  Hotel
+# answers carry photos, hence the size bound
+_travel_cache = _TTLCache(maxsize=256, ttl=600, maxbytes=64 * 1024 * 1024)
+
+
+def _cached(cache, key_of=None):
+    """Decorate an async scraper so cacheable results are reused, keyed on its name and arguments.
+
+    A ``key_of`` function, called with the same arguments, replaces them
+    in the cache key.  Concurrent calls with the same key share one run
+    through _single_flight, and the cache is filled before those waiters are
+    released.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if key_of is None:
+                key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            else:
+                key = (fn.__name__, key_of(*args, **kwargs))
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+            async def run():
+                result = await fn(*args, **kwargs)
+                if _is_cacheable(result):
+                    cache.set(key, result)
+                return result
+
+            return await _single_flight(key, run)
+        return wrapper
+    return decorator
 
 
 COOKIE_PATH = os.path.join(os.path.expanduser("~"), ".google_mcp_cookies.json")
@@ -178,16 +1024,19 @@ async def _load_cookies(context):
         pass
 
 
+_CAPTCHA_SELECTOR = (
+    "iframe[src*='recaptcha'], #captcha-form, "
+    "form[action*='sorry'], div.g-recaptcha"
+)
+
+
 async def _is_blocked(page) -> bool:
     """Check if the current page is a Google CAPTCHA or rate-limit block."""
     url = page.url
     if "/sorry/" in url:
         return True
     try:
-        captcha = await page.locator(
-            "iframe[src*='recaptcha'], #captcha-form, "
-            "form[action*='sorry'], div.g-recaptcha"
-        ).count()
+        captcha = await page.locator(_CAPTCHA_SELECTOR).count()
         if captcha > 0:
             return True
     except Exception:
@@ -455,37 +1304,271 @@ async def _solve_image_challenge(page) -> bool:
         return False
 
 
+# Contexts where a consent banner has been clicked away; later pages in them skip the
+# banner probe until _goto_until_target sees a consent form again
+_consented_contexts = weakref.WeakSet()
+
+# Consent banner button labels in the languages Google most often serves
+_CONSENT_TEXTS = (
+    "Accept all", "Accept All", "I agree", "Reject all", "Reject All",
+    "Alle akzeptieren", "Alle ablehnen", "Tout accepter", "Tout refuser",
+    "Aceptar todo", "Rechazar todo", "Accetta tutto", "Rifiuta tutto",
+)
+
+# One pass over the page's buttons, clicking the first whose label matches
+_CONSENT_CLICK_JS = _page_extractor("consent", """
+(() => {
+    const TEXTS = %s;
+    return () => {
+        for (const b of document.querySelectorAll('button')) {
+            const label = b.innerText;
+            if (TEXTS.some(t => label.includes(t))) { b.click(); return true; }
+        }
+        return false;
+    };
+})()
+""" % json.dumps(_CONSENT_TEXTS))
+
+
 async def _dismiss_consent(page):
     """Dismiss Google consent banner if present (supports multiple languages)."""
+    if page.context in _consented_contexts:
+        await _human_delay(page)
+        return
     try:
-        consent_btn = page.locator(
-            "button:has-text('Accept all'), "
-            "button:has-text('Accept All'), "
-            "button:has-text('I agree'), "
-            "button:has-text('Reject all'), "
-            "button:has-text('Reject All'), "
-            "button:has-text('Alle akzeptieren'), "
-            "button:has-text('Alle ablehnen'), "
-            "button:has-text('Tout accepter'), "
-            "button:has-text('Tout refuser'), "
-            "button:has-text('Aceptar todo'), "
-            "button:has-text('Rechazar todo'), "
-            "button:has-text('Accetta tutto'), "
-            "button:has-text('Rifiuta tutto')"
-        )
-        if await consent_btn.count() > 0:
-            await consent_btn.first.click()
-            await page.wait_for_load_state("domcontentloaded", timeout=5000)
+        with _Phase("consent"):
+            if await page.evaluate(_CONSENT_CLICK_JS):
+                await page.wait_for_load_state("domcontentloaded", timeout=5000)
+                _consented_contexts.add(page.context)
     except Exception:
         pass
     # Small random delay to mimic human interaction timing
     await _human_delay(page)
 
 
+# ---------------------------------------------------------------------------
+# HTTP fast path — server-rendered SERPs are parsed without a browser
+# ---------------------------------------------------------------------------
+
+# Shared plain HTTP client for SERP fetches and pages that render fine without a browser.
+# Keep-alive and HTTP/2 multiplexing amortize TCP/TLS handshakes across tool calls.
+_http = httpx.AsyncClient(
+    http2=True,
+    headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+    follow_redirects=True,
+    timeout=15,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
+# Set GSM_SERP_HTTP=0 to always render result pages (and translations) in Chromium
+SERP_HTTP = os.environ.get("GSM_SERP_HTTP", "1") != "0"
+
+# After Google answers a host with a consent wall, captcha or JS-only page, go straight
+# to the browser for that host for this many seconds instead of paying two round trips
+SERP_HTTP_COOLDOWN = 600
+_serp_http_cooldown: dict[str, float] = {}
+
+_SERP_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml",
+    "Cookie": "; ".join(f"{c['name']}={c['value']}" for c in _CONSENT_COOKIES),
+}
+_SERP_WALL_SELECTOR = "form[action*='consent'], form#captcha-form, div#recaptcha"
+_SERP_SNIPPET_SELECTOR = 'div[data-sncf], div.VwiC3b, span.aCOpRe, div[style*="-webkit-line-clamp"]'
+
+
+class _NeedsBrowser(Exception):
+    """Raised when a result page cannot be served over plain HTTP."""
+
+
+def _node_text(node) -> str:
+    """Whitespace-collapsed text of a selectolax node, close to innerText for inline content."""
+    if node is None:
+        return ""
+    return _WHITESPACE_RE.sub(" ", node.text(separator=" ")).strip()
+
+
+def _node_lines(node) -> str:
+    """Text of a selectolax node with one line per text node, close to innerText for card layouts."""
+    if node is None:
+        return ""
+    return "\n".join(line for line in (
+        _WHITESPACE_RE.sub(" ", part).strip() for part in node.text(separator="\n").split("\n")
+    ) if line)
+
+
+def _result_href(node) -> str:
+    """Absolute target of the first result link under ``node``, unwrapping /url?q= redirects."""
+    for a in node.css("a[href]"):
+        href = a.attributes.get("href") or ""
+        if href.startswith("/url?"):
+            params = parse_qs(urlparse(href).query)
+            href = (params.get("q") or params.get("url") or [""])[0]
+        if href.startswith("http"):
+            return href
+    return ""
+
+
+def _labelled_block(head: str, fields) -> str:
+    """``head`` followed by one indented ``Label: value`` line per non-empty value.
+
+    An empty label emits the bare value, as used for snippets.
+    """
+    return "\n".join([head, *(
+        f"   {label}: {value}" if label else f"   {value}"
+        for label, value in fields
+        if value
+    )])
+
+
+def _parse_search_results(tree, num_results: int) -> list[list]:
+    """Extract [title, url, snippet] rows from a Google results page."""
+    results = []
+    for el in tree.css("div#search div.g"):
+        if len(results) >= num_results:
+            break
+        url = _result_href(el)
+        title = el.css_first("h3")
+        if url and title is not None:
+            results.append([_node_text(title), url, _node_text(el.css_first(_SERP_SNIPPET_SELECTOR))])
+    if not results:
+        for a in tree.css("div#search a[href]"):
+            if len(results) >= num_results:
+                break
+            h3 = a.css_first("h3")
+            url = _result_href(a)
+            if h3 is not None and url:
+                parent = a.parent.parent if a.parent is not None and a.parent.parent is not None else a
+                results.append([_node_text(h3), url, _node_text(parent.css_first(_SERP_SNIPPET_SELECTOR))])
+    return results
+
+
+async def _serp_via_http(url: str, ready_selector: str, parse, num_results: int):
+    """Fetch a result page over HTTP and run ``parse(tree, num_results)`` on it.
+
+    Raises _NeedsBrowser when the fast path is disabled or cooling down, when
+    Google serves anything but the expected results layout, or when nothing
+    was extracted, so the caller can fall back to Chromium.
+    """
+    host = urlparse(url).hostname or ""
+    if not SERP_HTTP or time.monotonic() < _serp_http_cooldown.get(host, 0):
+        raise _NeedsBrowser(url)
+    await _throttle_host(host)
+    try:
+        with _Phase("http_fetch"):
+            resp = await _http.get(url, headers=_SERP_HEADERS)
+    except httpx.HTTPError as e:
+        raise _NeedsBrowser(url) from e
+
+    def parse_html(html):
+        tree = LexborHTMLParser(html)
+        if tree.css_first(_SERP_WALL_SELECTOR) is not None or tree.css_first(ready_selector) is None:
+            return None
+        return parse(tree, num_results)
+
+    results = None
+    if resp.status_code == 200 and not resp.url.path.startswith("/sorry"):
+        with _Phase("http_parse"):
+            results = await asyncio.to_thread(parse_html, resp.text)
+    if results is None:
+        _serp_http_cooldown[host] = time.monotonic() + SERP_HTTP_COOLDOWN
+        raise _NeedsBrowser(url)
+    if not results:
+        raise _NeedsBrowser(url)
+    return results
+
+
+# First node each browser scraper extracts from; its arrival replaces a fixed sleep
+_WAIT_SELECTORS = {
+    "images": 'div[data-id] a[href^="/imgres"], #islrg img[src^="http"], #search img[src^="http"]',
+    "finance": "[data-last-price], .zzDege",
+    "finance_search": '[data-attrid*="Price"], .YMlKec, .kp-wholepage, .knowledge-panel',
+    "weather": "#wob_tm, #wob_loc",
+    "shopping": ".sh-dgr__content, .sh-dlr__list-result, .KZmu8e, .i0X6df, .xcR77, "
+                "[data-docid], .sh-pr__product-result",
+    "books": "#search h3",
+    "trends": "fe-line-chart-directive, .fe-line-chart, fe-related-queries, .fe-atoms-generic-list",
+    "maps": 'div.Nv2PK, h1.DUwDvf, [role="main"] h1',
+    "directions": '#section-directions-trip-0, [data-trip-index="0"], .MespJc',
+    "translate": '.ryNqvb, [data-result-index] .HwtZe, span[jsname="W297wb"]',
+    "flights": '.OgdJid, .zBTtmb, [data-attrid*="flight"], .fltt-card, .gws-flights__result, .gws-flights',
+    "hotels": '.BTPx6e, [data-attrid*="hotel"]',
+    "twitter": 'article[data-testid="tweet"]',
+}
+
+
+async def _wait_for_target(page, tool: str, timeout_ms: int = 4000, rows=None, min_rows=0) -> bool:
+    """Wait until the tool's target node is attached, or give up after ``timeout_ms``.
+
+    With ``rows``, also wait for ``min_rows`` of those nodes or the end of
+    parsing, for pages navigated with wait_until="commit" that are still
+    streaming in.  Never raises: a timed-out wait just lets the caller's
+    extractor and its fallbacks run against whatever has rendered.
+    """
+    with _Phase("wait_selector"):
+        try:
+            return await page.evaluate(
+                "([sel, ms, rows, n]) => window.__waitFor(sel, ms, rows, n)",
+                [_WAIT_SELECTORS[tool], timeout_ms, rows, min_rows],
+            )
+        except Exception:
+            return False
+
+
+async def _wait_for_map_tiles(page, timeout_ms: int):
+    """Give the map canvas up to ``timeout_ms`` to finish fetching tiles before a screenshot."""
+    with _Phase("wait_tiles"):
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        except Exception:
+            pass
+
+
+async def _goto_until_target(page, url: str, tool: str, timeout_ms: int = 5000) -> bool:
+    """Navigate to ``url`` without waiting for DOMContentLoaded.
+
+    Returns once the tool's target node or a consent form is attached, so
+    extraction can start while Google's scripts and subresources still load,
+    or False after ``timeout_ms`` without either.  A consent form in a context
+    marked as consented clears the mark, so _dismiss_consent probes again.
+    """
+    with _Phase("goto"):
+        await page.goto(url, wait_until="commit", timeout=30000)
+    try:
+        await page.wait_for_selector(
+            f"{_WAIT_SELECTORS[tool]}, form[action*='consent']", state="attached", timeout=timeout_ms
+        )
+    except PlaywrightTimeoutError:
+        return False
+    if page.context in _consented_contexts and await page.query_selector("form[action*='consent']"):
+        _consented_contexts.discard(page.context)
+    return True
+
+
+async def _serp_via_page(page, ready_selector: str, row_selector: str, parse, num_results: int) -> list[list]:
+    """Wait for results in a browser page, then parse its HTML with the HTTP path's parser.
+
+    One page.content() call replaces a CDP round trip per extracted field, and
+    both paths share a single extractor per result type.
+    """
+    with _Phase("wait_selector"):
+        ready = await page.evaluate(
+            "([sel, ms, rows, n]) => window.__waitFor(sel, ms, rows, n)",
+            [ready_selector, 15000, row_selector, num_results],
+        )
+    if not ready:
+        raise PlaywrightTimeoutError(f"Timed out waiting for {ready_selector}")
+    with _Phase("content"):
+        html = await page.content()
+    with _Phase("parse"):
+        return await asyncio.to_thread(lambda: parse(LexborHTMLParser(html), num_results))
+
+
 # ---------------------------------------------------------------------------
 # google_search
 # ---------------------------------------------------------------------------
 
+@_cached(_search_cache)
+@_timed
 async def _do_google_search(
     query: str,
     num_results: int = 5,
@@ -495,134 +1578,98 @@ async def _do_google_search(
     language: str | None = None,
     region: str | None = None,
 ) -> str:
-    """Launch headless Chromium, search Google, and scrape results."""
+    """Search Google over plain HTTP, falling back to a pooled browser page, and format results."""
     search_query = query
     if site:
         search_query = f"site:{site} {search_query}"
 
-    encoded_query = quote_plus(search_query)
     start = (page - 1) * num_results
-    url = f"https://www.google.com/search?q={encoded_query}&num={num_results + 5}"
-
-    # Language and region
+    # udm=14 is the plain "Web" results view: no AI overview, ads or widget cards to render
+    params = {"q": search_query, "num": num_results, "udm": 14}
     if language:
-        url += f"&lr=lang_{language}&hl={language}"
+        params["lr"] = f"lang_{language}"
+        params["hl"] = language
     else:
-        url += "&hl=en"
+        params["hl"] = "en"
     if region:
-        url += f"&gl={region}"
-
+        params["gl"] = region
     if start > 0:
-        url += f"&start={start}"
+        params["start"] = start
     if time_range and time_range in TIME_RANGE_MAP:
-        url += f"&tbs={TIME_RANGE_MAP[time_range]}"
+        params["tbs"] = TIME_RANGE_MAP[time_range]
+    # urlencode escapes every value, including language and region from the tool call
+    url = "https://www.google.com/search?" + urlencode(params)
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        await _load_cookies(context)
-        browser_page = await context.new_page()
+    try:
+        results = await _serp_via_http(url, "div#search", _parse_search_results, num_results)
+    except _NeedsBrowser:
+        results = None
 
-        try:
-            await browser_page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(browser_page)
+    if results is None:
+        async with _context_pool.acquire() as (context, browser_page):
+            try:
+                # Return as soon as the navigation commits; the selector wait below is the real gate
+                with _Phase("goto"):
+                    await browser_page.goto(url, wait_until="commit", timeout=30000)
+                try:
+                    await browser_page.wait_for_selector(
+                        f"div#search, form[action*='consent'], {_CAPTCHA_SELECTOR}", timeout=15000
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+                await _dismiss_consent(browser_page)
+
+                # Detect and handle CAPTCHA/rate-limit blocks
+                if await _is_blocked(browser_page):
+                    solved = await _try_solve_captcha(browser_page)
+                    if not solved:
+                        await _save_cookies(context)
+                        return (
+                            "Search blocked by Google bot detection. "
+                            "Your IP may be temporarily rate-limited. "
+                            "Try again in a few minutes or from a different network."
+                        )
+
+                results = await _serp_via_page(
+                    browser_page, "div#search", "div#search div.g", _parse_search_results, num_results
+                )
 
-            # Detect and handle CAPTCHA/rate-limit blocks
-            if await _is_blocked(browser_page):
-                solved = await _try_solve_captcha(browser_page)
-                if not solved:
+            except Exception as e:
+                # Check if the exception was due to bot detection
+                if await _is_blocked(browser_page):
                     await _save_cookies(context)
                     return (
                         "Search blocked by Google bot detection. "
                         "Your IP may be temporarily rate-limited. "
                         "Try again in a few minutes or from a different network."
                     )
+                return f"Search failed: {e}"
 
-            await browser_page.wait_for_selector("div#search", timeout=15000)
-
-            results = await browser_page.evaluate(
-                """
-                (numResults) => {
-                    const results = [];
-                    const containers = document.querySelectorAll('div#search div.g');
-                    for (const el of containers) {
-                        if (results.length >= numResults) break;
-                        const linkEl = el.querySelector('a[href^="http"]');
-                        const titleEl = el.querySelector('h3');
-                        const snippetEl = el.querySelector(
-                            'div[data-sncf], div.VwiC3b, span.aCOpRe, div[style*="-webkit-line-clamp"]'
-                        );
-                        if (linkEl && titleEl) {
-                            results.push({
-                                title: titleEl.innerText.trim(),
-                                url: linkEl.href,
-                                snippet: snippetEl ? snippetEl.innerText.trim() : ''
-                            });
-                        }
-                    }
-                    if (results.length === 0) {
-                        const allLinks = document.querySelectorAll('div#search a[href^="http"]');
-                        for (const a of allLinks) {
-                            if (results.length >= numResults) break;
-                            const h3 = a.querySelector('h3');
-                            if (h3) {
-                                const parent = a.closest('div.g') || a.parentElement?.parentElement;
-                                const snippetEl = parent?.querySelector(
-                                    'div[data-sncf], div.VwiC3b, span.aCOpRe, div[style*="-webkit-line-clamp"]'
-                                );
-                                results.push({
-                                    title: h3.innerText.trim(),
-                                    url: a.href,
-                                    snippet: snippetEl ? snippetEl.innerText.trim() : ''
-                                });
-                            }
-                        }
-                    }
-                    return results;
-                }
-                """,
-                num_results,
-            )
-
-            if not results:
-                return f"No results found for: {query}"
-
-            header = f"Google Search Results for: {query}"
-            if time_range:
-                header += f" (filtered: {time_range.replace('_', ' ')})"
-            if site:
-                header += f" (site: {site})"
-            if language:
-                header += f" (lang: {language})"
-            if region:
-                header += f" (region: {region})"
-            if page > 1:
-                header += f" (page {page})"
-
-            lines = [header + "\n"]
-            offset = (page - 1) * num_results
-            for i, r in enumerate(results[:num_results], offset + 1):
-                lines.append(f"{i}. {r['title']}")
-                lines.append(f"   URL: {r['url']}")
-                if r.get("snippet"):
-                    lines.append(f"   {r['snippet']}")
-                lines.append("")
-
-            return "\n".join(lines)
-
-        except Exception as e:
-            # Check if the exception was due to bot detection
-            if await _is_blocked(browser_page):
+            finally:
                 await _save_cookies(context)
-                return (
-                    "Search blocked by Google bot detection. "
-                    "Your IP may be temporarily rate-limited. "
-                    "Try again in a few minutes or from a different network."
-                )
-            return f"Search failed: {e}"
 
-        finally:
-            await _save_cookies(context)
-            await browser.close()
+    if not results:
+        return f"No results found for: {query}"
+
+    header = f"Google Search Results for: {query}"
+    if time_range:
+        header += f" (filtered: {time_range.replace('_', ' ')})"
+    if site:
+        header += f" (site: {site})"
+    if language:
+        header += f" (lang: {language})"
+    if region:
+        header += f" (region: {region})"
+    if page > 1:
+        header += f" (page {page})"
+
+    with _Phase("format"):
+        offset = (page - 1) * num_results
+        blocks = [
+            f"{i}. {title}\n   URL: {url}" + (f"\n   {snippet}" if snippet else "")
+            for i, (title, url, snippet) in enumerate(results[:num_results], offset + 1)
+        ]
+        return header + "\n\n" + "\n\n".join(blocks) + "\n"
 
 
 @mcp.tool()
@@ -668,155 +1715,226 @@ async def google_search(
     )
 
 
-# ---------------------------------------------------------------------------
-# google_news
-# ---------------------------------------------------------------------------
+MAX_BATCH_QUERIES = 10
 
-async def _do_google_news(query: str, num_results: int = 5) -> list:
-    """Launch headless Chromium, search Google News, and scrape results."""
-    encoded_query = quote_plus(query)
-    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=nws&num={num_results + 5}"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        await _load_cookies(context)
-        page = await context.new_page()
+@mcp.tool()
+async def google_search_batch(
+    queries: list[str],
+    num_results: int = 5,
+    time_range: str = "",
+    site: str = "",
+    language: str = "",
+    region: str = "",
+    kind: str = "web",
+) -> list:
+    """Run several Google searches at once and return the results of each. Use this instead of calling google_search, google_news or google_scholar repeatedly, e.g. to compare topics or try query variations.
 
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
+    Sample prompts that trigger this tool:
+        - "Search for FastAPI, Django and Flask benchmarks"
+        - "Look up the population of Tokyo, Paris and New York"
+        - "Find Reddit threads about each of these three laptops"
+        - "Get the latest news on Nvidia, AMD and Intel"
+        - "Find papers on each of these three topics"
 
-            if await _is_blocked(page):
-                solved = await _try_solve_captcha(page)
-                if not solved:
-                    await _save_cookies(context)
-                    return []
-
-            await page.wait_for_selector("div#search", timeout=15000)
-
-            results = await page.evaluate(
-                """
-                (numResults) => {
-                    const results = [];
-                    const containers = document.querySelectorAll('div#search div.SoaBEf, div#search div.g');
-                    for (const el of containers) {
-                        if (results.length >= numResults) break;
-                        const linkEl = el.querySelector('a[href^="http"]');
-                        const titleEl = el.querySelector('div[role="heading"], h3');
-                        const sourceEl = el.querySelector('.NUnG9d, .CEMjEf, .UPmit');
-                        const timeEl = el.querySelector('.OSrXXb, .WG9SHc, .ZE0LJd span, time, [datetime]');
-                        const snippetEl = el.querySelector('.GI74Re, .Y3v8qd, div.VwiC3b');
-                        if (linkEl && titleEl) {
-                            // Extract article thumbnail
-                            let thumbnail = '';
-                            const imgs = el.querySelectorAll('img');
-                            for (const img of imgs) {
-                                const s = img.src || img.dataset?.src || '';
-                                if (!s) continue;
-                                if (s.startsWith('data:image') && s.length > 500) { thumbnail = s; break; }
-                                if (s.startsWith('http') && !s.includes('gstatic.com/s/i/')) { thumbnail = s; break; }
-                                if (s.startsWith('//')) { thumbnail = 'https:' + s; break; }
-                            }
-                            results.push({
-                                title: titleEl.innerText.trim(),
-                                url: linkEl.href,
-                                source: sourceEl ? sourceEl.innerText.trim() : '',
-                                time: timeEl ? timeEl.innerText.trim() : '',
-                                snippet: snippetEl ? snippetEl.innerText.trim() : '',
-                                thumbnail: thumbnail,
-                            });
-                        }
-                    }
-                    if (results.length === 0) {
-                        const allLinks = document.querySelectorAll('div#search a[href^="http"]');
-                        for (const a of allLinks) {
-                            if (results.length >= numResults) break;
-                            const heading = a.querySelector('div[role="heading"], h3');
-                            if (heading) {
-                                results.push({
-                                    title: heading.innerText.trim(),
-                                    url: a.href,
-                                    source: '', time: '', snippet: ''
-                                });
-                            }
-                        }
-                    }
-                    return results;
-                }
-                """,
+    Args:
+        queries: List of search queries (max 10). Searches run in parallel on shared browser tabs.
+        num_results: Number of results per query (default 5, max 10).
+        kind: What to search: "web" (default), "news" or "scholar". The filters below apply to web searches only.
+        time_range: Filter by time. One of: "past_hour", "past_day", "past_week", "past_month", "past_year". Leave empty for no filter.
+        site: Limit every query to a specific domain (e.g. "reddit.com"). Leave empty for all sites.
+        language: Language code for results (e.g. "en", "de", "fr"). Leave empty for English.
+        region: Country/region code (e.g. "us", "gb", "de"). Leave empty for default.
+    """
+    queries = [q for q in queries if q][:MAX_BATCH_QUERIES]
+    if not queries:
+        return ["No queries provided."]
+    num_results = max(1, min(num_results, 10))
+    if kind == "news":
+        runs = (_do_google_news(q, num_results) for q in queries)
+    elif kind == "scholar":
+        runs = (_do_google_scholar(q, num_results) for q in queries)
+    else:
+        runs = (
+            _do_google_search(
+                q,
                 num_results,
+                time_range=time_range or None,
+                site=site or None,
+                page=1,
+                language=language or None,
+                region=region or None,
             )
+            for q in queries
+        )
+    results = await asyncio.gather(*runs, return_exceptions=True)
+
+    # Always a list of content blocks: news answers mix text with inline thumbnails and
+    # are concatenated block by block; all-text answers are joined into one block
+    content = []
+    for q, r in zip(queries, results):
+        if content:
+            content.append("===")
+        if isinstance(r, BaseException):
+            content.append(f"Search failed for {q}: {r}")
+        elif isinstance(r, list):
+            content.extend(r)
+        else:
+            content.append(r)
+    if all(isinstance(c, str) for c in content):
+        return ["\n\n".join(content)]
+    return content
 
-            if not results:
-                return f"No news results found for: {query}"
 
-            # Download article thumbnail images
-            import base64 as b64mod
-            for r in results[:num_results]:
-                thumb_url = r.get("thumbnail", "")
-                if not thumb_url:
-                    continue
-                if thumb_url.startswith("data:image"):
-                    try:
-                        header, b64data = thumb_url.split(",", 1)
-                        body = b64mod.b64decode(b64data)
-                        if len(body) < 500 or len(body) > 5_000_000:
-                            continue
-                        r["image_bytes"] = body
-                        ct = header.split(";")[0].replace("data:", "")
-                        r["content_type"] = ct or "image/jpeg"
-                    except Exception:
-                        pass
-                    continue
-                if not thumb_url.startswith("http"):
-                    continue
+# ---------------------------------------------------------------------------
+# google_news
+# ---------------------------------------------------------------------------
+
+def _parse_news_results(tree, num_results: int) -> list[list]:
+    """Extract [title, url, source, time, snippet, thumbnail] rows from a Google News page."""
+    results = []
+    for el in tree.css("div#search div.SoaBEf, div#search div.g"):
+        if len(results) >= num_results:
+            break
+        url = _result_href(el)
+        title = el.css_first('div[role="heading"], h3')
+        if url and title is not None:
+            thumbnail = ""
+            for img in el.css("img"):
+                src = img.attributes.get("src") or img.attributes.get("data-src") or ""
+                if src.startswith("data:image") and len(src) > 500:
+                    thumbnail = src
+                    break
+                if src.startswith("http") and "gstatic.com/s/i/" not in src:
+                    thumbnail = src
+                    break
+                if src.startswith("//"):
+                    thumbnail = "https:" + src
+                    break
+            results.append([
+                _node_text(title),
+                url,
+                _node_text(el.css_first(".NUnG9d, .CEMjEf, .UPmit")),
+                _node_text(el.css_first(".OSrXXb, .WG9SHc, .ZE0LJd span, time, [datetime]")),
+                _node_text(el.css_first(".GI74Re, .Y3v8qd, div.VwiC3b")),
+                thumbnail,
+            ])
+    if not results:
+        for a in tree.css("div#search a[href]"):
+            if len(results) >= num_results:
+                break
+            heading = a.css_first('div[role="heading"], h3')
+            url = _result_href(a)
+            if heading is not None and url:
+                results.append([_node_text(heading), url, "", "", "", ""])
+    return results
+
+
+@_cached(_media_cache)
+@_timed
+async def _do_google_news(query: str, num_results: int = 5) -> list:
+    """Search Google News over plain HTTP, falling back to a pooled browser page, and scrape results."""
+    encoded_query = _quote_plus(query)
+    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=nws"
+
+    # Over HTTP ask for exactly num_results; the browser gets a small margin for tiles
+    # its extractor skips, without rendering a page full of unused results
+    try:
+        results = await _serp_via_http(
+            f"{url}&num={num_results}", "div#search", _parse_news_results, num_results
+        )
+    except _NeedsBrowser:
+        results = None
+
+    if results is None:
+        async with _context_pool.acquire() as (context, page):
+            try:
+                # Extraction starts as soon as result rows stream in, not at DOMContentLoaded
+                with _Phase("goto"):
+                    await page.goto(f"{url}&num={num_results + 2}", wait_until="commit", timeout=30000)
                 try:
-                    resp = await context.request.get(thumb_url, timeout=8000)
-                    if resp.ok:
-                        body = await resp.body()
-                        if len(body) < 1000 or len(body) > 5_000_000:
-                            continue
-                        r["image_bytes"] = body
-                        ct = resp.headers.get("content-type", "image/jpeg")
-                        r["content_type"] = ct.split(";")[0].strip()
-                except Exception:
-                    continue
+                    await page.wait_for_selector(
+                        f"div#search, form[action*='consent'], {_CAPTCHA_SELECTOR}", timeout=15000
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+                await _dismiss_consent(page)
 
-            # Build mixed content: text + inline images
-            content: list = [f"Google News Results for: {query}\n"]
-            for i, r in enumerate(results[:num_results], 1):
-                desc = f"{i}. {r['title']}"
-                desc += f"\n   URL: {r['url']}"
-                source_info = []
-                if r.get("source"):
-                    source_info.append(r["source"])
-                if r.get("time"):
-                    source_info.append(r["time"])
-                if source_info:
-                    desc += f"\n   Source: {' - '.join(source_info)}"
-                if r.get("snippet"):
-                    desc += f"\n   {r['snippet']}"
-                content.append(desc)
+                if await _is_blocked(page):
+                    solved = await _try_solve_captcha(page)
+                    if not solved:
+                        await _save_cookies(context)
+                        return []
 
-                if r.get("image_bytes"):
-                    try:
-                        ct = r.get("content_type", "image/jpeg")
-                        fmt_map = {
-                            "image/jpeg": "jpeg", "image/png": "png",
-                            "image/gif": "gif", "image/webp": "webp",
-                        }
-                        fmt = fmt_map.get(ct, "jpeg")
-                        content.append(Image(data=r["image_bytes"], format=fmt))
-                    except Exception:
-                        pass
+                results = await _serp_via_page(
+                    page, "div#search", "div#search div.SoaBEf, div#search div.g",
+                    _parse_news_results, num_results,
+                )
 
-            return content
+            except Exception as e:
+                return f"News search failed: {e}"
 
-        except Exception as e:
-            return f"News search failed: {e}"
+    if not results:
+        return f"No news results found for: {query}"
 
-        finally:
-            await browser.close()
+    try:
+        # Download article thumbnail images
+        import base64 as b64mod
+        images = {}
+        remote = []
+        for idx, row in enumerate(results[:num_results]):
+            thumb_url = row[5]
+            if not thumb_url:
+                continue
+            if thumb_url.startswith("data:image"):
+                try:
+                    header, b64data = thumb_url.split(",", 1)
+                    body = b64mod.b64decode(b64data)
+                    if len(body) < 500 or len(body) > 5_000_000:
+                        continue
+                    ct = header.split(";")[0].replace("data:", "")
+                    images[idx] = (body, ct or "image/jpeg")
+                except Exception:
+                    pass
+            elif thumb_url.startswith("http"):
+                remote.append(idx)
+
+        # Remote thumbnails download all at once rather than one slow host after another
+        with _Phase("images"):
+            fetched = await asyncio.gather(*(
+                _fetch_image(None, (results[idx][5],)) for idx in remote
+            ))
+        for idx, img in zip(remote, fetched):
+            if img:
+                images[idx] = img
+
+        # Build mixed content: text + inline images
+        content: list = [f"Google News Results for: {query}\n"]
+        fmt_map = {
+            "image/jpeg": "jpeg", "image/png": "png",
+            "image/gif": "gif", "image/webp": "webp",
+        }
+        for idx, (title, url, source, when, snippet, _) in enumerate(results[:num_results]):
+            desc = f"{idx + 1}. {title}"
+            desc += f"\n   URL: {url}"
+            source_info = [part for part in (source, when) if part]
+            if source_info:
+                desc += f"\n   Source: {' - '.join(source_info)}"
+            if snippet:
+                desc += f"\n   {snippet}"
+            content.append(desc)
+
+            if idx in images:
+                try:
+                    body, ct = images[idx]
+                    content.append(Image(data=body, format=fmt_map.get(ct, "jpeg")))
+                except Exception:
+                    pass
+
+        return content
+
+    except Exception as e:
+        return f"News search failed: {e}"
 
 
 @mcp.tool()
@@ -842,82 +1960,85 @@ async def google_news(query: str, num_results: int = 5) -> list:
 # google_scholar
 # ---------------------------------------------------------------------------
 
-async def _do_google_scholar(query: str, num_results: int = 5) -> str:
-    """Launch headless Chromium, search Google Scholar, and scrape results."""
-    encoded_query = quote_plus(query)
-    url = f"https://scholar.google.com/scholar?q={encoded_query}&hl=en&num={num_results + 5}"
-
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
-
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            await page.wait_for_selector("#gs_res_ccl", timeout=15000)
-
-            results = await page.evaluate(
-                """
-                (numResults) => {
-                    const results = [];
-                    const entries = document.querySelectorAll('.gs_r.gs_or.gs_scl, .gs_ri');
-                    for (const el of entries) {
-                        if (results.length >= numResults) break;
-
-                        const titleEl = el.querySelector('.gs_rt a, .gs_rt');
-                        const linkEl = el.querySelector('.gs_rt a');
-                        const authorsEl = el.querySelector('.gs_a');
-                        const snippetEl = el.querySelector('.gs_rs');
-                        const citedEl = el.querySelector('.gs_fl a');
-
-                        let citedBy = '';
-                        const flLinks = el.querySelectorAll('.gs_fl a');
-                        for (const fl of flLinks) {
-                            if (fl.textContent.includes('Cited by')) {
-                                citedBy = fl.textContent.trim();
-                                break;
-                            }
-                        }
+def _parse_scholar_results(tree, num_results: int) -> list[list]:
+    """Extract [title, url, authors, snippet, cited_by] rows from a Google Scholar page."""
+    results = []
+    seen = set()
+    for el in tree.css(".gs_r.gs_or.gs_scl, .gs_ri"):
+        if len(results) >= num_results:
+            break
+        title = el.css_first(".gs_rt a, .gs_rt")
+        if title is None:
+            continue
+        link = el.css_first(".gs_rt a")
+        # .gs_ri sits inside .gs_r, so the same entry can match twice
+        key = (_node_text(title), link.attributes.get("href") if link is not None else "")
+        if key in seen:
+            continue
+        seen.add(key)
+        cited_by = ""
+        for fl in el.css(".gs_fl a"):
+            if "Cited by" in fl.text():
+                cited_by = fl.text().strip()
+                break
+        results.append([
+            key[0],
+            key[1] or "",
+            _node_text(el.css_first(".gs_a")),
+            _node_text(el.css_first(".gs_rs")),
+            cited_by,
+        ])
+    return results
 
-                        if (titleEl) {
-                            results.push({
-                                title: titleEl.innerText.trim(),
-                                url: linkEl ? linkEl.href : '',
-                                authors: authorsEl ? authorsEl.innerText.trim() : '',
-                                snippet: snippetEl ? snippetEl.innerText.trim() : '',
-                                cited_by: citedBy
-                            });
-                        }
-                    }
-                    return results;
-                }
-                """,
-                num_results,
-            )
 
-            if not results:
-                return f"No scholar results found for: {query}"
+@_cached(_scholar_cache)
+@_timed
+async def _do_google_scholar(query: str, num_results: int = 5) -> str:
+    """Search Google Scholar over plain HTTP, falling back to a pooled browser page, and scrape results."""
+    encoded_query = _quote_plus(query)
+    url = f"https://scholar.google.com/scholar?q={encoded_query}&hl=en"
 
-            lines = [f"Google Scholar Results for: {query}\n"]
-            for i, r in enumerate(results[:num_results], 1):
-                lines.append(f"{i}. {r['title']}")
-                if r.get("url"):
-                    lines.append(f"   URL: {r['url']}")
-                if r.get("authors"):
-                    lines.append(f"   Authors: {r['authors']}")
-                if r.get("cited_by"):
-                    lines.append(f"   {r['cited_by']}")
-                if r.get("snippet"):
-                    lines.append(f"   {r['snippet']}")
-                lines.append("")
+    # Over HTTP ask for exactly num_results; the browser gets a small margin for tiles
+    # its extractor skips, without rendering a page full of unused results
+    try:
+        results = await _serp_via_http(
+            f"{url}&num={num_results}", "#gs_res_ccl", _parse_scholar_results, num_results
+        )
+    except _NeedsBrowser:
+        results = None
 
-            return "\n".join(lines)
+    if results is None:
+        async with _context_pool.acquire() as (context, page):
+            try:
+                with _Phase("goto"):
+                    await page.goto(f"{url}&num={num_results + 2}", wait_until="commit", timeout=30000)
+                try:
+                    await page.wait_for_selector(
+                        f"#gs_res_ccl, form[action*='consent'], {_CAPTCHA_SELECTOR}", timeout=15000
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+                await _dismiss_consent(page)
 
-        except Exception as e:
-            return f"Scholar search failed: {e}"
+                results = await _serp_via_page(
+                    page, "#gs_res_ccl", ".gs_r.gs_or.gs_scl", _parse_scholar_results, num_results
+                )
 
-        finally:
-            await browser.close()
+            except Exception as e:
+                return f"Scholar search failed: {e}"
+
+    if not results:
+        return f"No scholar results found for: {query}"
+
+    blocks = [
+        f"{i}. {title}"
+        + (f"\n   URL: {url}" if url else "")
+        + (f"\n   Authors: {authors}" if authors else "")
+        + (f"\n   {cited_by}" if cited_by else "")
+        + (f"\n   {snippet}" if snippet else "")
+        for i, (title, url, authors, snippet, cited_by) in enumerate(results[:num_results], 1)
+    ]
+    return f"Google Scholar Results for: {query}\n\n" + "\n\n".join(blocks) + "\n"
 
 
 @mcp.tool()
@@ -943,109 +2064,114 @@ async def google_scholar(query: str, num_results: int = 5) -> str:
 # google_images
 # ---------------------------------------------------------------------------
 
-@mcp.tool()
-async def google_images(query: str, num_results: int = 5) -> list:
-    """Search Google Images and return images inline in chat.
+async def _fetch_image(context, urls) -> tuple[bytes, str] | None:
+    """Download the first of ``urls`` that returns a plausible image.
 
-    Returns image thumbnails directly in the conversation so you can see them.
-    Also provides source URLs for each image.
+    Goes through the context's request API so Google's cookies apply, or the
+    shared HTTP client when ``context`` is None, and returns (body,
+    content_type), or None when every candidate fails.
+    """
+    for url in urls:
+        if not url or not url.startswith("http"):
+            continue
+        try:
+            if context is None:
+                resp = await _http.get(url, timeout=8)
+                if not resp.is_success:
+                    continue
+                body = resp.content
+            else:
+                resp = await context.request.get(url, timeout=8000)
+                if not resp.ok:
+                    continue
+                body = await resp.body()
+        except Exception:
+            continue
+        # Skip if too small (likely broken) or too large (>5MB)
+        if 1000 <= len(body) <= 5_000_000:
+            ct = resp.headers.get("content-type", "image/jpeg")
+            return body, ct.split(";")[0].strip()
+    return None
 
-    Sample prompts that trigger this tool:
-        - "Show me images of the Northern Lights"
-        - "Find pictures of modern kitchen designs"
-        - "Search for diagrams of neural network architecture"
-        - "Show me what a DGX Spark looks like"
 
-    Args:
-        query: The image search query string.
-        num_results: Number of image results to return (default 5, max 10).
-    """
+_IMAGES_JS = _page_extractor("images", """
+(numResults) => {
+    const results = [];
+    const imgurlRe = /[?&]imgurl=([^&]+)/;
+
+    const imgLinks = window.__queryIn('#islrg, #search', 'div[data-id] a[href^="/imgres"], a[jsname]');
+    for (const a of imgLinks) {
+        if (results.length >= numResults) break;
+
+        const img = a.querySelector('img[src^="http"], img[data-src^="http"]');
+        if (!img) continue;
+
+        const thumbnail = img.src || img.dataset.src || '';
+        if (!thumbnail || thumbnail.startsWith('data:')) continue;
+
+        let fullUrl = '';
+        const m = imgurlRe.exec(a.href || '');
+        if (m) {
+            try { fullUrl = decodeURIComponent(m[1]); } catch (e) {}
+        }
+
+        results.push({
+            title: img.alt || '',
+            thumbnail: thumbnail,
+            url: fullUrl || thumbnail,
+        });
+    }
+
+    if (results.length === 0) {
+        const allImgs = document.querySelectorAll('#search img[src^="http"], #islrg img[src^="http"]');
+        for (const img of allImgs) {
+            if (results.length >= numResults) break;
+            if (img.width < 50 || img.height < 50) continue;
+            results.push({
+                title: img.alt || '',
+                thumbnail: img.src,
+                url: img.src,
+            });
+        }
+    }
+
+    return results;
+}
+""")
+
+
+@_cached(_media_cache)
+@_timed
+async def _do_google_images(query: str, num_results: int = 5) -> list:
+    """Search Google Images on a pooled browser page and download the results for inline display."""
     import base64 as b64mod
 
     num_results = max(1, min(num_results, 10))
-    encoded_query = quote_plus(query)
+    encoded_query = _quote_plus(query)
     url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=isch"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
-
+    async with _context_pool.acquire(block_resources=False) as (context, page):
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await _dismiss_consent(page)
-            await page.wait_for_timeout(2000)
-
-            results = await page.evaluate(
-                """
-                (numResults) => {
-                    const results = [];
-
-                    const imgLinks = document.querySelectorAll('div[data-id] a[href^="/imgres"], a[jsname]');
-                    for (const a of imgLinks) {
-                        if (results.length >= numResults) break;
-
-                        const img = a.querySelector('img[src^="http"], img[data-src^="http"]');
-                        if (!img) continue;
-
-                        const thumbnail = img.src || img.dataset.src || '';
-                        if (!thumbnail || thumbnail.startsWith('data:')) continue;
-
-                        let fullUrl = '';
-                        try {
-                            const href = a.href || '';
-                            const params = new URLSearchParams(href.split('?')[1] || '');
-                            fullUrl = params.get('imgurl') || '';
-                        } catch(e) {}
-
-                        results.push({
-                            title: img.alt || '',
-                            thumbnail: thumbnail,
-                            url: fullUrl || thumbnail,
-                        });
-                    }
+            await _wait_for_target(page, "images")
 
-                    if (results.length === 0) {
-                        const allImgs = document.querySelectorAll('#search img[src^="http"], #islrg img[src^="http"]');
-                        for (const img of allImgs) {
-                            if (results.length >= numResults) break;
-                            if (img.width < 50 || img.height < 50) continue;
-                            results.push({
-                                title: img.alt || '',
-                                thumbnail: img.src,
-                                url: img.src,
-                            });
-                        }
-                    }
-
-                    return results;
-                }
-                """,
-                num_results,
-            )
+            results = await page.evaluate(_IMAGES_JS, num_results)
 
             if not results:
                 return f"No image results found for: {query}"
 
-            # Download full-size images for inline display (fall back to thumbnail)
-            for r in results[:num_results]:
-                full_url = r.get("url", "")
-                thumb_url = r.get("thumbnail", "")
-                for img_url in [full_url, thumb_url]:
-                    if not img_url or not img_url.startswith("http"):
-                        continue
-                    try:
-                        resp = await context.request.get(img_url, timeout=8000)
-                        if resp.ok:
-                            body = await resp.body()
-                            # Skip if too small (likely broken) or too large (>5MB)
-                            if len(body) < 1000 or len(body) > 5_000_000:
-                                continue
-                            r["image_bytes"] = body
-                            ct = resp.headers.get("content-type", "image/jpeg")
-                            r["content_type"] = ct.split(";")[0].strip()
-                            break
-                    except Exception:
-                        continue
+            # Download full-size images for inline display (fall back to thumbnail),
+            # all results at once rather than one slow host after another
+            results = results[:num_results]
+            with _Phase("images"):
+                fetched = await asyncio.gather(*(
+                    _fetch_image(context, (r.get("url", ""), r.get("thumbnail", "")))
+                    for r in results
+                ))
+            for r, img in zip(results, fetched):
+                if img:
+                    r["image_bytes"], r["content_type"] = img
 
             # Build mixed content: text descriptions + inline images
             content = [f"Google Image Results for: {query}\n"]
@@ -1073,75 +2199,92 @@ async def google_images(query: str, num_results: int = 5) -> list:
         except Exception as e:
             return f"Image search failed: {e}"
 
-        finally:
-            await browser.close()
+
+@mcp.tool()
+async def google_images(query: str, num_results: int = 5) -> list:
+    """Search Google Images and return images inline in chat.
+
+    Returns image thumbnails directly in the conversation so you can see them.
+    Also provides source URLs for each image.
+
+    Sample prompts that trigger this tool:
+        - "Show me images of the Northern Lights"
+        - "Find pictures of modern kitchen designs"
+        - "Search for diagrams of neural network architecture"
+        - "Show me what a DGX Spark looks like"
+
+    Args:
+        query: The image search query string.
+        num_results: Number of image results to return (default 5, max 10).
+    """
+    return await _do_google_images(query, num_results)
 
 
 # ---------------------------------------------------------------------------
 # google_trends
 # ---------------------------------------------------------------------------
 
-async def _do_google_trends(query: str) -> str:
-    """Launch headless Chromium, check Google Trends, and scrape interest data."""
-    encoded_query = quote_plus(query)
-    url = f"https://trends.google.com/trends/explore?q={encoded_query}&hl=en"
+_TRENDS_JS = _page_extractor("trends", """
+() => {
+    const data = { interest: [], related_topics: [], related_queries: [] };
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    // Interest over time - try to get the widget content
+    const timeWidget = document.querySelector('fe-line-chart-directive, .fe-line-chart');
+    if (timeWidget) {
+        data.interest_note = 'Interest over time data available (see Google Trends for chart)';
+    }
 
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=45000)
-            # Trends takes longer to load its widgets
-            await page.wait_for_timeout(5000)
-
-            data = await page.evaluate(
-                """
-                () => {
-                    const data = { interest: [], related_topics: [], related_queries: [] };
-
-                    // Interest over time - try to get the widget content
-                    const timeWidget = document.querySelector('fe-line-chart-directive, .fe-line-chart');
-                    if (timeWidget) {
-                        data.interest_note = 'Interest over time data available (see Google Trends for chart)';
-                    }
+    // Related topics
+    const topicWidgets = document.querySelectorAll('fe-related-queries .comparison-item, .fe-atoms-generic-list .item');
+    for (const el of topicWidgets) {
+        const label = el.querySelector('.label-text, .item-text, a');
+        const value = el.querySelector('.progress-bar-wrapper, .bar');
+        if (label) {
+            data.related_topics.push({
+                topic: label.innerText.trim(),
+                value: value ? value.getAttribute('aria-label') || value.innerText.trim() : ''
+            });
+        }
+    }
 
-                    // Related topics
-                    const topicWidgets = document.querySelectorAll('fe-related-queries .comparison-item, .fe-atoms-generic-list .item');
-                    for (const el of topicWidgets) {
-                        const label = el.querySelector('.label-text, .item-text, a');
-                        const value = el.querySelector('.progress-bar-wrapper, .bar');
-                        if (label) {
-                            data.related_topics.push({
-                                topic: label.innerText.trim(),
-                                value: value ? value.getAttribute('aria-label') || value.innerText.trim() : ''
-                            });
-                        }
-                    }
+    // Related queries - look for the queries widget
+    const queryCards = document.querySelectorAll('.fe-related-queries-wrapper .comparison-item, [class*="related"] .item');
+    for (const el of queryCards) {
+        const label = el.querySelector('.label-text, .item-text, a');
+        const value = el.querySelector('.progress-bar-wrapper, .bar');
+        if (label) {
+            data.related_queries.push({
+                query: label.innerText.trim(),
+                value: value ? value.getAttribute('aria-label') || value.innerText.trim() : ''
+            });
+        }
+    }
 
-                    // Related queries - look for the queries widget
-                    const queryCards = document.querySelectorAll('.fe-related-queries-wrapper .comparison-item, [class*="related"] .item');
-                    for (const el of queryCards) {
-                        const label = el.querySelector('.label-text, .item-text, a');
-                        const value = el.querySelector('.progress-bar-wrapper, .bar');
-                        if (label) {
-                            data.related_queries.push({
-                                query: label.innerText.trim(),
-                                value: value ? value.getAttribute('aria-label') || value.innerText.trim() : ''
-                            });
-                        }
-                    }
+    // Fallback: get all visible text from the trends page
+    const mainContent = document.querySelector('.trends-wrapper, main, [role="main"]');
+    if (mainContent) {
+        data.page_text = mainContent.innerText.substring(0, 3000);
+    }
 
-                    // Fallback: get all visible text from the trends page
-                    const mainContent = document.querySelector('.trends-wrapper, main, [role="main"]');
-                    if (mainContent) {
-                        data.page_text = mainContent.innerText.substring(0, 3000);
-                    }
+    return data;
+}
+""")
 
-                    return data;
-                }
-                """
-            )
+
+@_cached(_results_cache)
+@_timed
+async def _do_google_trends(query: str) -> str:
+    """Check Google Trends on a pooled browser page and scrape interest data."""
+    encoded_query = _quote_plus(query)
+    url = f"https://trends.google.com/trends/explore?q={encoded_query}&hl=en"
+
+    async with _context_pool.acquire(block_resources=False) as (context, page):
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+            # Trends renders its widgets client-side, well after DOMContentLoaded
+            await _wait_for_target(page, "trends", timeout_ms=8000)
+
+            data = await page.evaluate(_TRENDS_JS)
 
             lines = [f"Google Trends for: {query}\n"]
 
@@ -1167,7 +2310,7 @@ async def _do_google_trends(query: str) -> str:
                 page_text = data.get("page_text", "")
                 if page_text:
                     # Clean up the text
-                    page_text = re.sub(r'\n{3,}', '\n\n', page_text).strip()
+                    page_text = _MULTI_NL_RE.sub('\n\n', page_text).strip()
                     lines.append(page_text)
                 else:
                     lines.append("Could not extract structured trends data.")
@@ -1178,9 +2321,6 @@ async def _do_google_trends(query: str) -> str:
         except Exception as e:
             return f"Trends lookup failed: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_trends(query: str) -> str:
@@ -1202,21 +2342,181 @@ async def google_trends(query: str) -> str:
 # google_maps
 # ---------------------------------------------------------------------------
 
+_MAPS_JS = _page_extractor("maps", r"""
+(() => {
+    // Regexes are compiled once per document instead of on every card line
+    const LINE_RE = /\S(?:[^\n]*\S)?/g;
+    const RATING_LINE_RE = /^\d\.\d/;
+    const REVIEWS_RE = /\(([\d,]+)\)/;
+    const TRAILING_PRICE_RE = /([\$\u0024€£]{1,4})\s*$/;
+    const PRICE_RE = /([\$€£]{1,4})/;
+    const CHF_RE = /CHF\s*[\d,.]+/i;
+    const STATUS_RE = /^(Closed|Open\b|Temporarily closed)/i;
+    const ACTION_RE = /^(Reserve|Order online|Dine-in|Takeout|Delivery)/i;
+    const SEPARATOR_RE = /[·\u00B7]/;
+    const PRICE_ONLY_RE = /^[\$€£]{1,4}$/;
+    const DIGIT_RE = /\d/;
+    const LEADING_DIGIT_RE = /^\d/;
+
+    return (numResults) => {
+        const results = [];
+        const seen = new Set();
+
+        // Use div.Nv2PK (the main card container) to avoid
+        // duplicates from nested a.hfpxzc links.
+        // Duplicates and nameless cards are skipped, so allow some slack, but never
+        // walk the whole feed on a dense results page
+        const cards = Array.prototype.slice.call(
+            window.__queryIn('[role="feed"]', 'div.Nv2PK'), 0, numResults * 3
+        );
+
+        for (const card of cards) {
+            if (results.length >= numResults) break;
+
+            // --- Name ---
+            const nameEl = card.querySelector(
+                '.qBF1Pd, .fontHeadlineSmall, [role="heading"]'
+            );
+            let name = nameEl ? nameEl.innerText.trim() : '';
+            if (!name) {
+                const link = card.querySelector('a.hfpxzc');
+                if (link) name = (link.getAttribute('aria-label') || '').trim();
+            }
+            if (!name || name.length < 2 || seen.has(name)) continue;
+            seen.add(name);
+
+            // --- Rating from selector ---
+            let rating = '';
+            const rEl = card.querySelector('.MW4etd, .yi40Hd');
+            if (rEl) rating = rEl.innerText.trim();
+
+            // --- Parse card text lines for all fields ---
+            // Card text layout:
+            //   Cantinetta Antinori
+            //   4.4(2,486) · $$$       ← reviews + price here
+            //   Italian · (icon) · Augustinergasse 25
+            //   Seasonal Tuscan cuisine with fine wines
+            //   Closed · Opens 11:30 am
+            //   "Review quote..."
+            // One regex pass yields the trimmed non-blank lines (\S also excludes nbsp)
+            const allText = card.innerText || '';
+            const lines = allText.match(LINE_RE) || [];
+
+            let reviews = '', priceRange = '';
+            let category = '', address = '';
+            let description = '', status = '';
+
+            for (const line of lines) {
+                if (line === name) continue;
+                if (line.length <= 2) continue;
+
+                // Rating line: "4.4(2,486) · $$$" or just "4.6"
+                if (RATING_LINE_RE.test(line)) {
+                    // Reviews in parentheses: (2,486)
+                    const revMatch = line.match(REVIEWS_RE);
+                    if (revMatch && !reviews) reviews = revMatch[1];
+                    // Price: $, $$, $$$, $$$$
+                    const pm = line.match(TRAILING_PRICE_RE);
+                    if (pm && !priceRange) priceRange = pm[1];
+                    if (!priceRange) {
+                        const pm2 = line.match(PRICE_RE);
+                        if (pm2) priceRange = pm2[1];
+                    }
+                    // CHF price pattern
+                    if (!priceRange) {
+                        const chf = line.match(CHF_RE);
+                        if (chf) priceRange = chf[0];
+                    }
+                    continue;
+                }
+
+                // Status: "Closed · Opens ..." or "Open · Closes ..."
+                if (STATUS_RE.test(line)) {
+                    status = line;
+                    continue;
+                }
+
+                // Quote lines
+                if (line.startsWith('"') || line.startsWith('\u201c')) continue;
+                // Action buttons
+                if (ACTION_RE.test(line)) continue;
+
+                // Category · address line (contains separator)
+                // "Italian · (icon) · Augustinergasse 25"
+                if (line.includes('\u00B7') || line.includes('·')) {
+                    if (!category) {
+                        const segs = line.split(SEPARATOR_RE).map(s => s.trim())
+                            .filter(s => s && s.length > 1);
+                        for (const seg of segs) {
+                            if (PRICE_ONLY_RE.test(seg)) {
+                                if (!priceRange) priceRange = seg;
+                            } else if (!category && !DIGIT_RE.test(seg) &&
+                                       seg.length < 50) {
+                                category = seg;
+                            } else if (!address && DIGIT_RE.test(seg) &&
+                                       seg.length < 80) {
+                                address = seg;
+                            }
+                        }
+                    }
+                    continue;
+                }
+
+                // Description/tagline
+                if (!description && line.length > 10 &&
+                    line.length < 150 && !LEADING_DIGIT_RE.test(line)) {
+                    description = line;
+                }
+            }
+
+            // Place URL
+            let placeUrl = '';
+            const link = card.querySelector('a.hfpxzc, a[data-item-id]');
+            if (link && link.href) placeUrl = link.href;
+
+            results.push({
+                name, rating, reviews, priceRange,
+                category, address, description, status,
+                url: placeUrl,
+            });
+        }
+
+        // Fallback: parse raw text from results panel
+        if (results.length === 0) {
+            const panel = document.querySelector(
+                '[role="feed"], [role="main"], .m6QErb'
+            );
+            if (panel) {
+                return [{
+                    name: '__raw__',
+                    raw_text: panel.innerText.substring(0, 3000),
+                    rating: '', reviews: '', category: '',
+                    priceRange: '', address: '', description: '',
+                    status: '', url: ''
+                }];
+            }
+        }
+
+        return results;
+    };
+})()
+""")
+
+
+@_cached(_places_cache)
+@_timed
 async def _do_google_maps(query: str, num_results: int = 5) -> list:
     """Search Google Maps for places and return results with a map screenshot."""
-    encoded_query = quote_plus(query)
+    encoded_query = _quote_plus(query)
     # Navigate directly to Google Maps search (shows map with pins)
     url = f"https://www.google.com/maps/search/{encoded_query}/?hl=en"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw, viewport={"width": 1400, "height": 900})
-        page = await context.new_page()
-
+    async with _context_pool.acquire(block_resources=False, viewport=_MAP_VIEWPORT) as (context, page):
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await _dismiss_consent(page)
             # Wait for results panel to appear
-            await page.wait_for_timeout(3000)
+            await _wait_for_target(page, "maps", timeout_ms=5000)
             # Wait for the map canvas to render (tiles need time to load)
             try:
                 await page.wait_for_selector(
@@ -1224,152 +2524,10 @@ async def _do_google_maps(query: str, num_results: int = 5) -> list:
                 )
             except Exception:
                 pass
-            # Extra time for map tiles to fully render
-            await page.wait_for_timeout(4000)
+            await _wait_for_map_tiles(page, 4000)
 
             # Extract place data from Google Maps results panel
-            results = await page.evaluate(
-                r"""
-                (numResults) => {
-                    const results = [];
-                    const seen = new Set();
-
-                    // Use div.Nv2PK (the main card container) to avoid
-                    // duplicates from nested a.hfpxzc links.
-                    const cards = document.querySelectorAll('div.Nv2PK');
-
-                    for (const card of cards) {
-                        if (results.length >= numResults) break;
-
-                        // --- Name ---
-                        const nameEl = card.querySelector(
-                            '.qBF1Pd, .fontHeadlineSmall, [role="heading"]'
-                        );
-                        let name = nameEl ? nameEl.innerText.trim() : '';
-                        if (!name) {
-                            const link = card.querySelector('a.hfpxzc');
-                            if (link) name = (link.getAttribute('aria-label') || '').trim();
-                        }
-                        if (!name || name.length < 2 || seen.has(name)) continue;
-                        seen.add(name);
-
-                        // --- Rating from selector ---
-                        let rating = '';
-                        const rEl = card.querySelector('.MW4etd, .yi40Hd');
-                        if (rEl) rating = rEl.innerText.trim();
-
-                        // --- Parse card text lines for all fields ---
-                        // Card text layout:
-                        //   Cantinetta Antinori
-                        //   4.4(2,486) · $$$       ← reviews + price here
-                        //   Italian · (icon) · Augustinergasse 25
-                        //   Seasonal Tuscan cuisine with fine wines
-                        //   Closed · Opens 11:30 am
-                        //   "Review quote..."
-                        const allText = card.innerText || '';
-                        const lines = allText.split('\n').map(s => s.trim())
-                            .filter(s => s && s !== '\xa0');
-
-                        let reviews = '', priceRange = '';
-                        let category = '', address = '';
-                        let description = '', status = '';
-
-                        for (const line of lines) {
-                            if (line === name) continue;
-                            if (line.length <= 2) continue;
-
-                            // Rating line: "4.4(2,486) · $$$" or just "4.6"
-                            if (/^\d\.\d/.test(line)) {
-                                // Reviews in parentheses: (2,486)
-                                const revMatch = line.match(/\(([\d,]+)\)/);
-                                if (revMatch && !reviews) reviews = revMatch[1];
-                                // Price: $, $$, $$$, $$$$
-                                const pm = line.match(/([\$\u0024€£]{1,4})\s*$/);
-                                if (pm && !priceRange) priceRange = pm[1];
-                                if (!priceRange) {
-                                    const pm2 = line.match(/([\$€£]{1,4})/);
-                                    if (pm2) priceRange = pm2[1];
-                                }
-                                // CHF price pattern
-                                if (!priceRange) {
-                                    const chf = line.match(/CHF\s*[\d,.]+/i);
-                                    if (chf) priceRange = chf[0];
-                                }
-                                continue;
-                            }
-
-                            // Status: "Closed · Opens ..." or "Open · Closes ..."
-                            if (/^(Closed|Open\b|Temporarily closed)/i.test(line)) {
-                                status = line;
-                                continue;
-                            }
-
-                            // Quote lines
-                            if (line.startsWith('"') || line.startsWith('\u201c')) continue;
-                            // Action buttons
-                            if (/^(Reserve|Order online|Dine-in|Takeout|Delivery)/i.test(line)) continue;
-
-                            // Category · address line (contains separator)
-                            // "Italian · (icon) · Augustinergasse 25"
-                            if (line.includes('\u00B7') || line.includes('·')) {
-                                if (!category) {
-                                    const segs = line.split(/[·\u00B7]/).map(s => s.trim())
-                                        .filter(s => s && s.length > 1);
-                                    for (const seg of segs) {
-                                        if (/^[\$€£]{1,4}$/.test(seg)) {
-                                            if (!priceRange) priceRange = seg;
-                                        } else if (!category && !/\d/.test(seg) &&
-                                                   seg.length < 50) {
-                                            category = seg;
-                                        } else if (!address && /\d/.test(seg) &&
-                                                   seg.length < 80) {
-                                            address = seg;
-                                        }
-                                    }
-                                }
-                                continue;
-                            }
-
-                            // Description/tagline
-                            if (!description && line.length > 10 &&
-                                line.length < 150 && !/^\d/.test(line)) {
-                                description = line;
-                            }
-                        }
-
-                        // Place URL
-                        let placeUrl = '';
-                        const link = card.querySelector('a.hfpxzc, a[data-item-id]');
-                        if (link && link.href) placeUrl = link.href;
-
-                        results.push({
-                            name, rating, reviews, priceRange,
-                            category, address, description, status,
-                            url: placeUrl,
-                        });
-                    }
-
-                    // Fallback: parse raw text from results panel
-                    if (results.length === 0) {
-                        const panel = document.querySelector(
-                            '[role="feed"], [role="main"], .m6QErb'
-                        );
-                        if (panel) {
-                            return [{
-                                name: '__raw__',
-                                raw_text: panel.innerText.substring(0, 3000),
-                                rating: '', reviews: '', category: '',
-                                priceRange: '', address: '', description: '',
-                                status: '', url: ''
-                            }];
-                        }
-                    }
-
-                    return results;
-                }
-                """,
-                num_results,
-            )
+            results = await page.evaluate(_MAPS_JS, num_results)
 
             # Take a viewport screenshot showing the map with pins
             screenshot_bytes = await page.screenshot(full_page=False, type="png")
@@ -1387,26 +2545,20 @@ async def _do_google_maps(query: str, num_results: int = 5) -> list:
 
             # Build mixed content: text descriptions first, then map screenshot
             content: list = [f"Google Maps Results for: {query}\n"]
-            for i, r in enumerate(results[:num_results], 1):
-                desc = f"{i}. {r['name']}"
-                if r.get("rating"):
-                    rating_str = f"   Rating: {r['rating']}"
-                    if r.get("reviews"):
-                        rating_str += f" ({r['reviews']} reviews)"
-                    desc += f"\n{rating_str}"
-                if r.get("priceRange"):
-                    desc += f"\n   Price: {r['priceRange']}"
-                if r.get("category"):
-                    desc += f"\n   Type: {r['category']}"
-                if r.get("address"):
-                    desc += f"\n   Address: {r['address']}"
-                if r.get("description"):
-                    desc += f"\n   Note: {r['description']}"
-                if r.get("status"):
-                    desc += f"\n   Hours: {r['status']}"
-                if r.get("url"):
-                    desc += f"\n   Link: {r['url']}"
-                content.append(desc)
+            content.extend(
+                _labelled_block(f"{i}. {r['name']}", (
+                    ("Rating", r["rating"] and (
+                        f"{r['rating']} ({r['reviews']} reviews)" if r["reviews"] else r["rating"]
+                    )),
+                    ("Price", r["priceRange"]),
+                    ("Type", r["category"]),
+                    ("Address", r["address"]),
+                    ("Note", r["description"]),
+                    ("Hours", r["status"]),
+                    ("Link", r["url"]),
+                ))
+                for i, r in enumerate(results[:num_results], 1)
+            )
 
             # Map screenshot at the end (shows all pins)
             content.append(Image(data=screenshot_bytes, format="png"))
@@ -1416,9 +2568,6 @@ async def _do_google_maps(query: str, num_results: int = 5) -> list:
         except Exception as e:
             return [f"Maps search failed: {e}"]
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_maps(query: str, num_results: int = 5) -> list:
@@ -1444,6 +2593,92 @@ async def google_maps(query: str, num_results: int = 5) -> list:
 # ---------------------------------------------------------------------------
 
 
+_DIRECTIONS_JS = _page_extractor("directions", """
+() => {
+    const data = {distance: '', duration: '', steps: [], summary: ''};
+
+    // Try to get distance and duration from the trip info
+    const tripEl = document.querySelector(
+        '#section-directions-trip-0, ' +
+        '[data-trip-index="0"], ' +
+        '.MespJc'
+    );
+
+    if (tripEl) {
+        const text = tripEl.innerText;
+        // Extract distance and duration patterns
+        const distMatch = text.match(/(\\d[\\d,.]+\\s*(?:km|mi|m|miles|ft))/i);
+        const durMatch = text.match(/(\\d+\\s*(?:hr|hour|min|h|d|day)s?(?:\\s*\\d+\\s*(?:min|hr|h)s?)?)/i);
+        if (distMatch) data.distance = distMatch[1];
+        if (durMatch) data.duration = durMatch[1];
+    }
+
+    // Broader fallback: search entire page for distance/duration
+    if (!data.distance || !data.duration) {
+        const allText = document.body.innerText;
+        if (!data.distance) {
+            const dm = allText.match(/(\\d[\\d,.]+\\s*(?:km|mi|miles))\\b/i);
+            if (dm) data.distance = dm[1];
+        }
+        if (!data.duration) {
+            const tm = allText.match(/(\\d+\\s*(?:hr|hour|h)s?\\s*\\d*\\s*(?:min)?s?)/i);
+            if (!tm) {
+                const tm2 = allText.match(/(\\d+\\s*min)/i);
+                if (tm2) data.duration = tm2[1];
+            } else {
+                data.duration = tm[1];
+            }
+        }
+    }
+
+    // Try to get route summary (e.g. "via A9")
+    const summaryEl = document.querySelector(
+        '.r4nke, .LjGbjd, span[jstcache]'
+    );
+    if (summaryEl) {
+        const st = summaryEl.innerText.trim();
+        if (st.toLowerCase().startsWith('via')) {
+            data.summary = st;
+        }
+    }
+
+    // Get step-by-step directions
+    const stepEls = document.querySelectorAll(
+        '[data-legid] .directions-mode-step, ' +
+        '.directions-mode-step, ' +
+        'div[jstcache] span.XoKrad, ' +
+        '.T2yjMc'
+    );
+    for (const step of stepEls) {
+        const t = step.innerText.trim();
+        if (t && t.length > 2 && t.length < 300) {
+            data.steps.push(t);
+        }
+    }
+
+    // Fallback: get the directions panel raw text
+    if (data.steps.length === 0) {
+        const panel = document.querySelector(
+            '#directions-searchbox-0, ' +
+            '.directions-renderer, ' +
+            '#section-directions-trip-0, ' +
+            '[role="main"]'
+        );
+        if (panel) {
+            const lines = (panel.innerText.match(/\\S(?:[^\\n]*\\S)?/g) || [])
+                .filter(l => l.length > 2 && l.length < 300);
+            // Take first 30 non-empty lines as raw directions
+            data.raw_panel = lines.slice(0, 30).join('\\n');
+        }
+    }
+
+    return data;
+}
+""")
+
+
+@_cached(_places_cache)
+@_timed
 async def _do_google_maps_directions(
     origin: str, destination: str, mode: str = "driving"
 ) -> list:
@@ -1452,109 +2687,23 @@ async def _do_google_maps_directions(
     mode_map = {"cycling": "bicycling"}
     gm_mode = mode_map.get(mode, mode)
 
-    encoded_origin = quote_plus(origin)
-    encoded_dest = quote_plus(destination)
+    encoded_origin = _quote_plus(origin)
+    encoded_dest = _quote_plus(destination)
     url = (
         f"https://www.google.com/maps/dir/{encoded_origin}/{encoded_dest}"
         f"/?travelmode={gm_mode}&hl=en"
     )
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw, viewport={"width": 1400, "height": 900})
-        page = await context.new_page()
-
+    async with _context_pool.acquire(block_resources=False, viewport=_MAP_VIEWPORT) as (context, page):
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await _dismiss_consent(page)
-            # Wait for the map canvas and route to render
-            await page.wait_for_timeout(5000)
+            # Wait for the route panel, then for the map tiles to render
+            await _wait_for_target(page, "directions", timeout_ms=5000)
+            await _wait_for_map_tiles(page, 3000)
 
             # Scrape route info from the directions panel
-            route_data = await page.evaluate(
-                """
-                () => {
-                    const data = {distance: '', duration: '', steps: [], summary: ''};
-
-                    // Try to get distance and duration from the trip info
-                    const tripEl = document.querySelector(
-                        '#section-directions-trip-0, ' +
-                        '[data-trip-index="0"], ' +
-                        '.MespJc'
-                    );
-
-                    if (tripEl) {
-                        const text = tripEl.innerText;
-                        // Extract distance and duration patterns
-                        const distMatch = text.match(/(\\d[\\d,.]+\\s*(?:km|mi|m|miles|ft))/i);
-                        const durMatch = text.match(/(\\d+\\s*(?:hr|hour|min|h|d|day)s?(?:\\s*\\d+\\s*(?:min|hr|h)s?)?)/i);
-                        if (distMatch) data.distance = distMatch[1];
-                        if (durMatch) data.duration = durMatch[1];
-                    }
-
-                    // Broader fallback: search entire page for distance/duration
-                    if (!data.distance || !data.duration) {
-                        const allText = document.body.innerText;
-                        if (!data.distance) {
-                            const dm = allText.match(/(\\d[\\d,.]+\\s*(?:km|mi|miles))\\b/i);
-                            if (dm) data.distance = dm[1];
-                        }
-                        if (!data.duration) {
-                            const tm = allText.match(/(\\d+\\s*(?:hr|hour|h)s?\\s*\\d*\\s*(?:min)?s?)/i);
-                            if (!tm) {
-                                const tm2 = allText.match(/(\\d+\\s*min)/i);
-                                if (tm2) data.duration = tm2[1];
-                            } else {
-                                data.duration = tm[1];
-                            }
-                        }
-                    }
-
-                    // Try to get route summary (e.g. "via A9")
-                    const summaryEl = document.querySelector(
-                        '.r4nke, .LjGbjd, span[jstcache]'
-                    );
-                    if (summaryEl) {
-                        const st = summaryEl.innerText.trim();
-                        if (st.toLowerCase().startsWith('via')) {
-                            data.summary = st;
-                        }
-                    }
-
-                    // Get step-by-step directions
-                    const stepEls = document.querySelectorAll(
-                        '[data-legid] .directions-mode-step, ' +
-                        '.directions-mode-step, ' +
-                        'div[jstcache] span.XoKrad, ' +
-                        '.T2yjMc'
-                    );
-                    for (const step of stepEls) {
-                        const t = step.innerText.trim();
-                        if (t && t.length > 2 && t.length < 300) {
-                            data.steps.push(t);
-                        }
-                    }
-
-                    // Fallback: get the directions panel raw text
-                    if (data.steps.length === 0) {
-                        const panel = document.querySelector(
-                            '#directions-searchbox-0, ' +
-                            '.directions-renderer, ' +
-                            '#section-directions-trip-0, ' +
-                            '[role="main"]'
-                        );
-                        if (panel) {
-                            const lines = panel.innerText.split('\\n')
-                                .map(l => l.trim())
-                                .filter(l => l.length > 2 && l.length < 300);
-                            // Take first 30 non-empty lines as raw directions
-                            data.raw_panel = lines.slice(0, 30).join('\\n');
-                        }
-                    }
-
-                    return data;
-                }
-                """
-            )
+            route_data = await page.evaluate(_DIRECTIONS_JS)
 
             # Take a full page screenshot
             screenshot_bytes = await page.screenshot(full_page=False, type="png")
@@ -1588,9 +2737,6 @@ async def _do_google_maps_directions(
         except Exception as e:
             return [f"Directions lookup failed: {e}"]
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_maps_directions(
@@ -1622,146 +2768,150 @@ async def google_maps_directions(
 # google_finance
 # ---------------------------------------------------------------------------
 
-async def _do_google_finance(query: str) -> str:
-    """Search Google Finance for stock/market data."""
-    encoded_query = quote_plus(query)
-    url = f"https://www.google.com/finance/quote/{encoded_query}"
+_FINANCE_QUOTE_JS = _page_extractor("finance_quote", """
+() => {
+    const data = {};
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    // Price - use data attribute (most reliable)
+    const dataEl = document.querySelector('[data-last-price]');
+    if (dataEl) {
+        data.price = dataEl.getAttribute('data-last-price');
+    }
 
-        try:
-            # First try direct quote URL
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            await page.wait_for_timeout(2000)
+    // Currency and exchange from data attributes
+    const currencyEl = document.querySelector('[data-currency-code]');
+    data.currency = currencyEl ? currencyEl.getAttribute('data-currency-code') : 'USD';
+
+    const exchangeEl = document.querySelector('[data-exchange]');
+    data.exchange = exchangeEl ? exchangeEl.getAttribute('data-exchange') : '';
+
+    // Displayed price with currency symbol
+    const displayEl = document.querySelector('.fxKbKc, .kf1m0');
+    data.display_price = displayEl ? displayEl.innerText.trim() : '';
+
+    // Change percentage and absolute
+    const rPF6Lc = document.querySelector('.rPF6Lc');
+    if (rPF6Lc) {
+        const text = rPF6Lc.innerText.trim();
+        const lines = text.split('\\n');
+        if (lines.length >= 2) {
+            data.change_pct = lines[1] ? lines[1].trim() : '';
+            data.change_abs = lines[2] ? lines[2].trim() : '';
+        }
+    }
 
-            data = await page.evaluate(
-                """
-                () => {
-                    const data = {};
+    // Company name
+    const nameEl = document.querySelector('.zzDege');
+    data.name = nameEl ? nameEl.innerText.trim() : '';
+
+    // Key stats - use first line only (labels include tooltip descriptions)
+    const stats = {};
+    const statRows = document.querySelectorAll('.gyFHrc .P6K39c, .eYanAe .P6K39c, table.slpEwd tr');
+    for (const row of statRows) {
+        const label = row.querySelector('.mfs7Fc, td:first-child');
+        const value = row.querySelector('.QXDnM, td:last-child');
+        if (label && value) {
+            const k = label.innerText.trim().split('\\n')[0];
+            const v = value.innerText.trim().split('\\n')[0];
+            if (k && v) stats[k] = v;
+        }
+    }
+    data.stats = stats;
 
-                    // Price - use data attribute (most reliable)
-                    const dataEl = document.querySelector('[data-last-price]');
-                    if (dataEl) {
-                        data.price = dataEl.getAttribute('data-last-price');
-                    }
+    // About/description
+    const aboutEl = document.querySelector('.bLLb2d, .Yfwt5');
+    data.about = aboutEl ? aboutEl.innerText.trim().substring(0, 500) : '';
 
-                    // Currency and exchange from data attributes
-                    const currencyEl = document.querySelector('[data-currency-code]');
-                    data.currency = currencyEl ? currencyEl.getAttribute('data-currency-code') : 'USD';
-
-                    const exchangeEl = document.querySelector('[data-exchange]');
-                    data.exchange = exchangeEl ? exchangeEl.getAttribute('data-exchange') : '';
-
-                    // Displayed price with currency symbol
-                    const displayEl = document.querySelector('.fxKbKc, .kf1m0');
-                    data.display_price = displayEl ? displayEl.innerText.trim() : '';
-
-                    // Change percentage and absolute
-                    const rPF6Lc = document.querySelector('.rPF6Lc');
-                    if (rPF6Lc) {
-                        const text = rPF6Lc.innerText.trim();
-                        const lines = text.split('\\n');
-                        if (lines.length >= 2) {
-                            data.change_pct = lines[1] ? lines[1].trim() : '';
-                            data.change_abs = lines[2] ? lines[2].trim() : '';
-                        }
-                    }
+    return data;
+}
+""")
 
-                    // Company name
-                    const nameEl = document.querySelector('.zzDege');
-                    data.name = nameEl ? nameEl.innerText.trim() : '';
-
-                    // Key stats - use first line only (labels include tooltip descriptions)
-                    const stats = {};
-                    const statRows = document.querySelectorAll('.gyFHrc .P6K39c, .eYanAe .P6K39c, table.slpEwd tr');
-                    for (const row of statRows) {
-                        const label = row.querySelector('.mfs7Fc, td:first-child');
-                        const value = row.querySelector('.QXDnM, td:last-child');
-                        if (label && value) {
-                            const k = label.innerText.trim().split('\\n')[0];
-                            const v = value.innerText.trim().split('\\n')[0];
-                            if (k && v) stats[k] = v;
-                        }
-                    }
-                    data.stats = stats;
 
-                    // About/description
-                    const aboutEl = document.querySelector('.bLLb2d, .Yfwt5');
-                    data.about = aboutEl ? aboutEl.innerText.trim().substring(0, 500) : '';
+_FINANCE_SEARCH_JS = _page_extractor("finance_search", """
+() => {
+    const data = {};
+    const priceEl = document.querySelector('[data-attrid*="Price"], .YMlKec, .kCrYT .IsqQVc');
+    data.price = priceEl ? priceEl.innerText.trim() : '';
 
-                    return data;
-                }
-                """
-            )
+    const nameEl = document.querySelector('.oPhL2e .PZPZlf, [data-attrid*="title"]');
+    data.name = nameEl ? nameEl.innerText.trim() : '';
+
+    const changeEl = document.querySelector('[data-attrid*="change"], .JwB6zf');
+    data.change_abs = changeEl ? changeEl.innerText.trim() : '';
+
+    return data;
+}
+""")
+
+
+@_cached(_quote_cache)
+@_timed
+async def _do_google_finance(query: str) -> str:
+    """Search Google Finance for stock/market data."""
+    encoded_query = _quote_plus(query)
+    url = f"https://www.google.com/finance/quote/{_quote_plus(query.strip())}"
+
+    async with _context_pool.acquire() as (context, page):
+        try:
+            data = {}
+            # Only symbols have a quote page; a company name would just cost a wasted navigation
+            is_symbol = bool(_TICKER_RE.match(query.strip()))
+            if is_symbol:
+                # The price is in the server-rendered HTML
+                await _goto_until_target(page, url, "finance")
+                await _dismiss_consent(page)
+                # Key stats stream in after the price; the quote page lists about eight
+                await _wait_for_target(page, "finance", rows=".gyFHrc", min_rows=8)
+
+                data = await page.evaluate(_FINANCE_QUOTE_JS)
 
             if not data.get("price") and not data.get("name"):
-                # Fallback: try Google search for finance info
+                # Company names, and symbols without a quote page, go through Google search
                 search_url = f"https://www.google.com/search?q={encoded_query}+stock+price&hl=en"
                 await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(2000)
-
-                data = await page.evaluate(
-                    """
-                    () => {
-                        const data = {};
-                        const priceEl = document.querySelector('[data-attrid*="Price"], .YMlKec, .kCrYT .IsqQVc');
-                        data.price = priceEl ? priceEl.innerText.trim() : '';
-
-                        const nameEl = document.querySelector('.oPhL2e .PZPZlf, [data-attrid*="title"]');
-                        data.name = nameEl ? nameEl.innerText.trim() : '';
+                if not is_symbol:
+                    await _dismiss_consent(page)
+                await _wait_for_target(page, "finance_search")
 
-                        const changeEl = document.querySelector('[data-attrid*="change"], .JwB6zf');
-                        data.change = changeEl ? changeEl.innerText.trim() : '';
+                data = await page.evaluate(_FINANCE_SEARCH_JS)
 
-                        // Get the knowledge panel text as fallback
-                        const panel = document.querySelector('.kp-wholepage, .knowledge-panel');
-                        data.panel_text = panel ? panel.innerText.substring(0, 1500) : '';
+            # The quote page and the search fallback fill different subsets of keys
+            name, price, display_price = data.get("name"), data.get("price"), data.get("display_price")
+            change_abs, change_pct = data.get("change_abs"), data.get("change_pct")
+            exchange, stats, about = data.get("exchange"), data.get("stats"), data.get("about")
 
-                        return data;
-                    }
-                    """
+            # Misses start with "Could not" so they are not cached
+            if not price and not display_price:
+                return (
+                    f"Could not find financial data for: {query}\n"
+                    "Try a stock ticker like 'AAPL:NASDAQ' or 'TSLA:NASDAQ'."
                 )
 
             lines = [f"Google Finance: {query}\n"]
 
-            if data.get("name"):
-                lines.append(f"Company: {data['name']}")
-            if data.get("display_price"):
-                lines.append(f"Price: {data['display_price']}")
-            elif data.get("price"):
-                currency = data.get("currency", "USD")
-                lines.append(f"Price: {data['price']} {currency}")
-            if data.get("exchange"):
-                lines.append(f"Exchange: {data['exchange']}")
-            if data.get("change_pct") or data.get("change_abs"):
-                change_parts = []
-                if data.get("change_abs"):
-                    change_parts.append(data["change_abs"])
-                if data.get("change_pct"):
-                    change_parts.append(f"({data['change_pct']})")
-                lines.append(f"Change: {' '.join(change_parts)}")
-            if data.get("stats"):
+            if name:
+                lines.append(f"Company: {name}")
+            if display_price:
+                lines.append(f"Price: {display_price}")
+            elif price:
+                lines.append(f"Price: {price} {data.get('currency', 'USD')}")
+            if exchange:
+                lines.append(f"Exchange: {exchange}")
+            if change_abs or change_pct:
+                change = " ".join(filter(None, (change_abs, change_pct and f"({change_pct})")))
+                lines.append(f"Change: {change}")
+            if stats:
                 lines.append("\nKey Stats:")
-                for k, v in data["stats"].items():
-                    lines.append(f"  {k}: {v}")
-
-            if data.get("about"):
-                lines.append(f"\nAbout: {data['about']}")
+                lines.extend(f"  {k}: {v}" for k, v in stats.items())
 
-            if not data.get("price"):
-                lines.append("Could not find financial data. Try a stock ticker like 'AAPL:NASDAQ' or 'TSLA:NASDAQ'.")
+            if about:
+                lines.append(f"\nAbout: {about}")
 
             return "\n".join(lines)
 
         except Exception as e:
             return f"Finance lookup failed: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_finance(query: str) -> str:
@@ -1784,134 +2934,100 @@ async def google_finance(query: str) -> str:
 # google_weather
 # ---------------------------------------------------------------------------
 
+def _parse_weather(tree) -> dict:
+    """Pull the current conditions and daily forecast out of Google's weather card."""
+    data = {
+        key: _node_text(tree.css_first(sel))
+        for key, sel in (
+            ("location", "#wob_loc"),
+            ("temp_c", "#wob_tm"),
+            ("temp_f", "#wob_ttm"),
+            ("condition", "#wob_dc"),
+            ("precipitation", "#wob_pp"),
+            ("humidity", "#wob_hm"),
+            ("wind", "#wob_ws"),
+            ("time", "#wob_dts"),
+        )
+    }
+    forecast = []
+    for day in tree.css(".wob_df"):
+        day_name = day.css_first(".Z1VzSb, .QrNVmd")
+        if day_name is None:
+            continue
+        # Each .wob_t holds a Celsius and a Fahrenheit span; the first is Celsius
+        temps = day.css(".wob_t span:first-child")
+        icon = day.css_first("img")
+        forecast.append({
+            "day": _node_text(day_name),
+            "high": _node_text(temps[0]) if len(temps) >= 2 else "",
+            "low": _node_text(temps[1]) if len(temps) >= 2 else "",
+            "condition": (icon.attributes.get("alt") or "") if icon is not None else "",
+        })
+    data["forecast"] = forecast
+    return data
+
+
+@_cached(_weather_cache)
+@_timed
 async def _do_google_weather(location: str) -> str:
     """Get weather data from Google's weather card."""
-    encoded_location = quote_plus(f"weather {location}")
+    encoded_location = _quote_plus(f"weather {location}")
     url = f"https://www.google.com/search?q={encoded_location}&hl=en"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
-
+    async with _context_pool.acquire() as (context, page):
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            # The weather card is server-rendered; start once its forecast row is in
+            await _goto_until_target(page, url, "weather")
             await _dismiss_consent(page)
-            await page.wait_for_timeout(2000)
-
-            data = await page.evaluate(
-                """
-                () => {
-                    const data = {};
-
-                    // Location
-                    const locEl = document.querySelector('#wob_loc');
-                    data.location = locEl ? locEl.innerText.trim() : '';
-
-                    // Current temperature
-                    const tempEl = document.querySelector('#wob_tm');
-                    data.temp_c = tempEl ? tempEl.innerText.trim() : '';
-
-                    const tempFEl = document.querySelector('#wob_ttm');
-                    data.temp_f = tempFEl ? tempFEl.innerText.trim() : '';
-
-                    // Condition (e.g. "Sunny", "Partly cloudy")
-                    const condEl = document.querySelector('#wob_dc');
-                    data.condition = condEl ? condEl.innerText.trim() : '';
-
-                    // Precipitation
-                    const precipEl = document.querySelector('#wob_pp');
-                    data.precipitation = precipEl ? precipEl.innerText.trim() : '';
-
-                    // Humidity
-                    const humidEl = document.querySelector('#wob_hm');
-                    data.humidity = humidEl ? humidEl.innerText.trim() : '';
-
-                    // Wind
-                    const windEl = document.querySelector('#wob_ws');
-                    data.wind = windEl ? windEl.innerText.trim() : '';
-
-                    // Day/time
-                    const timeEl = document.querySelector('#wob_dts');
-                    data.time = timeEl ? timeEl.innerText.trim() : '';
-
-                    // Forecast days
-                    data.forecast = [];
-                    const forecastDays = document.querySelectorAll('.wob_df');
-                    for (const day of forecastDays) {
-                        const dayName = day.querySelector('.Z1VzSb, .QrNVmd');
-                        const highEl = day.querySelector('.wob_t:first-of-type .wob_t');
-                        const lowEl = day.querySelector('.wob_t:last-of-type .wob_t');
-                        const iconEl = day.querySelector('img');
-
-                        // Get high and low from the spans
-                        const temps = day.querySelectorAll('.wob_t span:first-child');
-                        let high = '', low = '';
-                        if (temps.length >= 2) {
-                            high = temps[0].innerText.trim();
-                            low = temps[1].innerText.trim();
-                        }
+            await _wait_for_target(page, "weather", rows=".wob_df", min_rows=8)
 
-                        if (dayName) {
-                            data.forecast.push({
-                                day: dayName.innerText.trim(),
-                                high: high,
-                                low: low,
-                                condition: iconEl ? iconEl.alt || '' : ''
-                            });
-                        }
-                    }
+            with _Phase("content"):
+                html = await page.content()
+            with _Phase("parse"):
+                data = await asyncio.to_thread(lambda: _parse_weather(LexborHTMLParser(html)))
 
-                    return data;
-                }
-                """
-            )
-
-            if not data.get("temp_c") and not data.get("location"):
+            # _parse_weather always fills every key, with "" when a field is missing
+            display_location, temp_c, temp_f = data["location"], data["temp_c"], data["temp_f"]
+            if not temp_c and not display_location:
                 return f"Could not find weather data for: {location}"
 
             # Use the provided location name if Google's #wob_loc is generic
-            display_location = data.get("location", location)
-            if not display_location or display_location.lower() in ("weather", ""):
+            if not display_location or display_location.lower() == "weather":
                 display_location = location
 
             lines = [f"Weather for: {display_location}\n"]
 
-            if data.get("time"):
+            if data["time"]:
                 lines.append(f"As of: {data['time']}")
 
-            if data.get("temp_c"):
-                temp_str = f"Temperature: {data['temp_c']}°C"
-                if data.get("temp_f"):
-                    temp_str += f" ({data['temp_f']}°F)"
-                lines.append(temp_str)
-
-            if data.get("condition"):
-                lines.append(f"Condition: {data['condition']}")
-            if data.get("precipitation"):
-                lines.append(f"Precipitation: {data['precipitation']}")
-            if data.get("humidity"):
-                lines.append(f"Humidity: {data['humidity']}")
-            if data.get("wind"):
-                lines.append(f"Wind: {data['wind']}")
-
-            if data.get("forecast"):
+            if temp_c:
+                lines.append(f"Temperature: {temp_c}°C" + (f" ({temp_f}°F)" if temp_f else ""))
+
+            lines.extend(
+                f"{label}: {data[key]}"
+                for label, key in (
+                    ("Condition", "condition"),
+                    ("Precipitation", "precipitation"),
+                    ("Humidity", "humidity"),
+                    ("Wind", "wind"),
+                )
+                if data[key]
+            )
+
+            if data["forecast"]:
                 lines.append("\nForecast:")
-                for f in data["forecast"][:7]:
-                    day_str = f"  {f['day']}"
-                    if f.get("high") and f.get("low"):
-                        day_str += f": {f['high']}° / {f['low']}°"
-                    if f.get("condition"):
-                        day_str += f" - {f['condition']}"
-                    lines.append(day_str)
+                lines.extend(
+                    f"  {f['day']}"
+                    + (f": {f['high']}° / {f['low']}°" if f["high"] and f["low"] else "")
+                    + (f" - {f['condition']}" if f["condition"] else "")
+                    for f in data["forecast"][:7]
+                )
 
             return "\n".join(lines)
 
         except Exception as e:
             return f"Weather lookup failed: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_weather(location: str) -> str:
@@ -1934,136 +3050,145 @@ async def google_weather(location: str) -> str:
 # google_shopping
 # ---------------------------------------------------------------------------
 
+_SHOPPING_JS = _page_extractor("shopping", r"""
+(() => {
+    // Built once per document, not on every extraction
+    const PRICE_RE = /(?:[$£€]|CHF|USD|EUR)\s*[\d,.]+/;
+
+    return (numResults) => {
+        const results = [];
+        const seen = new Set();
+
+        // Google Shopping uses various container classes
+        const items = window.__queryIn(
+            '#search',
+            '.sh-dgr__content, .sh-dlr__list-result, ' +
+            '.KZmu8e, .i0X6df, .xcR77, ' +
+            '[data-docid], .sh-pr__product-result'
+        );
+
+        for (const el of items) {
+            if (results.length >= numResults) break;
+
+            const titleEl = el.querySelector('h3, h4, .tAxDx, .Xjkr3b, .EI11Pd');
+            const priceEl = el.querySelector('.a8Pemb, .HRLxBb, .kHxwFf, .T14wmb, b');
+            const storeEl = el.querySelector('.aULzUe, .IuHnof, .E5ocAb, .dD8iuc');
+            const ratingEl = el.querySelector('.Rsc7Yb, .QIrs8, .yi40Hd');
+
+            const title = titleEl ? titleEl.innerText.trim() : '';
+            if (!title) continue;
+            // The container classes nest, so one product can match twice
+            const store = storeEl ? storeEl.innerText.trim() : '';
+            const key = title + '\n' + store;
+            if (seen.has(key)) continue;
+            seen.add(key);
+
+            // Extract clean product URL from Google redirect wrappers
+            let productUrl = '';
+            // 1. Check data-merchant-url attribute on links
+            const merchantLink = el.querySelector('a[data-merchant-url]');
+            if (merchantLink) {
+                productUrl = merchantLink.getAttribute('data-merchant-url');
+            }
+            if (!productUrl) {
+                // 2. Try links with url?q= redirect pattern
+                const redirectLink = el.querySelector('a[href*="/url?"]');
+                if (redirectLink) {
+                    try {
+                        const u = new URL(redirectLink.href);
+                        productUrl = u.searchParams.get('q') || u.searchParams.get('url') || '';
+                    } catch(e) {}
+                }
+            }
+            if (!productUrl) {
+                // 3. Try links with aclk (Google Ads click tracker)
+                //    Extract adurl param which contains the real destination
+                const aclkLink = el.querySelector('a[href*="aclk?"]');
+                if (aclkLink) {
+                    try {
+                        const u = new URL(aclkLink.href);
+                        productUrl = u.searchParams.get('adurl') || '';
+                    } catch(e) {}
+                }
+            }
+            if (!productUrl) {
+                // 4. Fallback: any link with an external href
+                const allLinks = el.querySelectorAll('a[href]');
+                for (const a of allLinks) {
+                    const h = a.href;
+                    if (h && h.startsWith('http') &&
+                        !h.includes('google.com/aclk') &&
+                        !h.includes('google.com/url') &&
+                        !h.includes('google.com/search') &&
+                        !h.includes('google.com/shopping')) {
+                        productUrl = h;
+                        break;
+                    }
+                }
+            }
+            if (!productUrl) {
+                // 5. Last resort: use raw href
+                const linkEl = el.querySelector('a[href]');
+                productUrl = linkEl ? linkEl.href : '';
+            }
+
+            // Extract product thumbnail
+            let thumbnail = '';
+            const imgs = el.querySelectorAll('img');
+            for (const img of imgs) {
+                const s = img.src || img.dataset?.src || '';
+                if (!s) continue;
+                if (s.startsWith('data:image') && s.length > 500) { thumbnail = s; break; }
+                if (s.startsWith('http') && !s.includes('gstatic.com/s/i/')) { thumbnail = s; break; }
+                if (s.startsWith('//')) { thumbnail = 'https:' + s; break; }
+            }
+
+            results.push({
+                title: title,
+                price: priceEl ? priceEl.innerText.trim() : '',
+                store: store,
+                rating: ratingEl ? ratingEl.innerText.trim() : '',
+                url: productUrl,
+                thumbnail: thumbnail,
+            });
+        }
+
+        // Fallback: parse the visible text on shopping results
+        if (results.length === 0) {
+            const body = document.querySelector('#search, #rso, main');
+            if (body) {
+                // Only the first 3000 chars are returned, so only they need a price
+                const text = body.innerText.substring(0, 3000);
+                if (PRICE_RE.test(text)) {
+                    return [{
+                        title: '__raw__',
+                        raw_text: text,
+                        price: '', store: '', rating: '', url: ''
+                    }];
+                }
+            }
+        }
+
+        return results;
+    };
+})()
+""")
+
+
+@_cached(_media_cache)
+@_timed
 async def _do_google_shopping(query: str, num_results: int = 5) -> list:
     """Search Google Shopping for products and prices."""
-    encoded_query = quote_plus(query)
-    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=shop&num={num_results + 5}"
-
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    encoded_query = _quote_plus(query)
+    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=shop&num={num_results + 2}"
 
+    async with _context_pool.acquire() as (context, page):
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             await _dismiss_consent(page)
-            await page.wait_for_timeout(2000)
-
-            results = await page.evaluate(
-                r"""
-                (numResults) => {
-                    const results = [];
-
-                    // Google Shopping uses various container classes
-                    const items = document.querySelectorAll(
-                        '.sh-dgr__content, .sh-dlr__list-result, ' +
-                        '.KZmu8e, .i0X6df, .xcR77, ' +
-                        '[data-docid], .sh-pr__product-result'
-                    );
-
-                    for (const el of items) {
-                        if (results.length >= numResults) break;
-
-                        const titleEl = el.querySelector('h3, h4, .tAxDx, .Xjkr3b, .EI11Pd');
-                        const priceEl = el.querySelector('.a8Pemb, .HRLxBb, .kHxwFf, .T14wmb, b');
-                        const storeEl = el.querySelector('.aULzUe, .IuHnof, .E5ocAb, .dD8iuc');
-                        const ratingEl = el.querySelector('.Rsc7Yb, .QIrs8, .yi40Hd');
-
-                        const title = titleEl ? titleEl.innerText.trim() : '';
-                        if (!title) continue;
-
-                        // Extract clean product URL from Google redirect wrappers
-                        let productUrl = '';
-                        // 1. Check data-merchant-url attribute on links
-                        const merchantLink = el.querySelector('a[data-merchant-url]');
-                        if (merchantLink) {
-                            productUrl = merchantLink.getAttribute('data-merchant-url');
-                        }
-                        if (!productUrl) {
-                            // 2. Try links with url?q= redirect pattern
-                            const redirectLink = el.querySelector('a[href*="/url?"]');
-                            if (redirectLink) {
-                                try {
-                                    const u = new URL(redirectLink.href);
-                                    productUrl = u.searchParams.get('q') || u.searchParams.get('url') || '';
-                                } catch(e) {}
-                            }
-                        }
-                        if (!productUrl) {
-                            // 3. Try links with aclk (Google Ads click tracker)
-                            //    Extract adurl param which contains the real destination
-                            const aclkLink = el.querySelector('a[href*="aclk?"]');
-                            if (aclkLink) {
-                                try {
-                                    const u = new URL(aclkLink.href);
-                                    productUrl = u.searchParams.get('adurl') || '';
-                                } catch(e) {}
-                            }
-                        }
-                        if (!productUrl) {
-                            // 4. Fallback: any link with an external href
-                            const allLinks = el.querySelectorAll('a[href]');
-                            for (const a of allLinks) {
-                                const h = a.href;
-                                if (h && h.startsWith('http') &&
-                                    !h.includes('google.com/aclk') &&
-                                    !h.includes('google.com/url') &&
-                                    !h.includes('google.com/search') &&
-                                    !h.includes('google.com/shopping')) {
-                                    productUrl = h;
-                                    break;
-                                }
-                            }
-                        }
-                        if (!productUrl) {
-                            // 5. Last resort: use raw href
-                            const linkEl = el.querySelector('a[href]');
-                            productUrl = linkEl ? linkEl.href : '';
-                        }
+            await _wait_for_target(page, "shopping")
 
-                        // Extract product thumbnail
-                        let thumbnail = '';
-                        const imgs = el.querySelectorAll('img');
-                        for (const img of imgs) {
-                            const s = img.src || img.dataset?.src || '';
-                            if (!s) continue;
-                            if (s.startsWith('data:image') && s.length > 500) { thumbnail = s; break; }
-                            if (s.startsWith('http') && !s.includes('gstatic.com/s/i/')) { thumbnail = s; break; }
-                            if (s.startsWith('//')) { thumbnail = 'https:' + s; break; }
-                        }
-
-                        results.push({
-                            title: title,
-                            price: priceEl ? priceEl.innerText.trim() : '',
-                            store: storeEl ? storeEl.innerText.trim() : '',
-                            rating: ratingEl ? ratingEl.innerText.trim() : '',
-                            url: productUrl,
-                            thumbnail: thumbnail,
-                        });
-                    }
-
-                    // Fallback: parse the visible text on shopping results
-                    if (results.length === 0) {
-                        const body = document.querySelector('#search, #rso, main');
-                        if (body) {
-                            const text = body.innerText;
-                            // Look for price patterns to split products
-                            const pricePattern = /(?:[$£€]|CHF|USD|EUR)\s*[\d,.]+/g;
-                            const matches = [...text.matchAll(pricePattern)];
-                            if (matches.length > 0) {
-                                return [{
-                                    title: '__raw__',
-                                    raw_text: text.substring(0, 3000),
-                                    price: '', store: '', rating: '', url: ''
-                                }];
-                            }
-                        }
-                    }
-
-                    return results;
-                }
-                """,
-                num_results,
-            )
+            results = await page.evaluate(_SHOPPING_JS, num_results)
 
             if not results:
                 return f"No shopping results found for: {query}"
@@ -2071,11 +3196,12 @@ async def _do_google_shopping(query: str, num_results: int = 5) -> list:
             # Handle raw text fallback
             if len(results) == 1 and results[0].get("title") == "__raw__":
                 raw = results[0].get("raw_text", "")
-                raw = re.sub(r'\n{3,}', '\n\n', raw).strip()
+                raw = _MULTI_NL_RE.sub('\n\n', raw).strip()
                 return [f"Google Shopping Results for: {query}\n\n{raw}"]
 
             # Download product thumbnail images
             import base64 as b64mod
+            remote = []
             for r in results[:num_results]:
                 thumb_url = r.get("thumbnail", "")
                 if not thumb_url:
@@ -2092,33 +3218,25 @@ async def _do_google_shopping(query: str, num_results: int = 5) -> list:
                     except Exception:
                         pass
                     continue
-                if not thumb_url.startswith("http"):
-                    continue
-                try:
-                    resp = await context.request.get(thumb_url, timeout=8000)
-                    if resp.ok:
-                        body = await resp.body()
-                        if len(body) < 1000 or len(body) > 5_000_000:
-                            continue
-                        r["image_bytes"] = body
-                        ct = resp.headers.get("content-type", "image/jpeg")
-                        r["content_type"] = ct.split(";")[0].strip()
-                except Exception:
-                    continue
+                if thumb_url.startswith("http"):
+                    remote.append(r)
+            with _Phase("images"):
+                fetched = await asyncio.gather(*(
+                    _fetch_image(context, (r["thumbnail"],)) for r in remote
+                ))
+            for r, img in zip(remote, fetched):
+                if img:
+                    r["image_bytes"], r["content_type"] = img
 
             # Build mixed content: text + inline images
             content: list = [f"Google Shopping Results for: {query}\n"]
             for i, r in enumerate(results[:num_results], 1):
-                desc = f"{i}. {r['title']}"
-                if r.get("price"):
-                    desc += f"\n   Price: {r['price']}"
-                if r.get("store"):
-                    desc += f"\n   Store: {r['store']}"
-                if r.get("rating"):
-                    desc += f"\n   Rating: {r['rating']}"
-                if r.get("url"):
-                    desc += f"\n   URL: {r['url']}"
-                content.append(desc)
+                content.append(_labelled_block(f"{i}. {r['title']}", (
+                    ("Price", r.get("price")),
+                    ("Store", r.get("store")),
+                    ("Rating", r.get("rating")),
+                    ("URL", r.get("url")),
+                )))
 
                 if r.get("image_bytes"):
                     try:
@@ -2137,9 +3255,6 @@ async def _do_google_shopping(query: str, num_results: int = 5) -> list:
         except Exception as e:
             return f"Shopping search failed: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_shopping(query: str, num_results: int = 5) -> list:
@@ -2164,125 +3279,123 @@ async def google_shopping(query: str, num_results: int = 5) -> list:
 # google_books
 # ---------------------------------------------------------------------------
 
-async def _do_google_books(query: str, num_results: int = 5) -> str:
-    """Search Google Books for books and publications."""
-    encoded_query = quote_plus(query)
-    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=bks&num={num_results + 5}"
+_BOOKS_JS = _page_extractor("books", r"""
+(numResults) => {
+    const results = [];
+    const seen = new Set();
+
+    // Find all h3 elements that are book results
+    const allH3 = window.__queryIn('#search', 'h3');
+    for (const h3 of allH3) {
+        if (results.length >= numResults) break;
+
+        const title = h3.innerText.trim();
+        if (!title || title.length < 3) continue;
+        // Skip navigation/header h3s
+        if (title === 'Search Results' || title === 'Filters and topics') continue;
+
+        // Walk up to find the result container
+        let container = h3.closest('.g') || h3.parentElement?.parentElement?.parentElement;
+        if (!container) continue;
+
+        // Get the link
+        const linkEl = container.querySelector('a[href*="books.google"], a[href^="http"]');
+        const url = linkEl ? linkEl.href : '';
+
+        // Get snippet
+        const snippetEl = container.querySelector('.VwiC3b, .cmlJmd, [data-sncf]');
+        const snippet = snippetEl ? snippetEl.innerText.trim() : '';
+
+        // Get author - look for text between the title and snippet
+        let author = '';
+        const metaEls = container.querySelectorAll('span, cite');
+        for (const el of metaEls) {
+            const t = el.innerText.trim();
+            if (t && t !== title && !t.includes('http') &&
+                (t.includes(',') || t.includes('·') || /\d{4}/.test(t)) &&
+                t.length < 200) {
+                author = t;
+                break;
+            }
+        }
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+        // Several h3s can point at the same book; checked before the costly ISBN scan
+        const key = title + '\n' + author;
+        if (seen.has(key)) continue;
+        seen.add(key);
+
+        // Extract ISBN from container text or URL
+        let isbn = '';
+        const containerText = container.innerText || '';
+        const containerHtml = container.innerHTML || '';
+        const searchText = containerText + ' ' + containerHtml;
+        // ISBN-13 with optional hyphens (starts with 978 or 979)
+        const isbn13Match = searchText.match(/97[89][\d-]{10,16}/);
+        if (isbn13Match) {
+            isbn = isbn13Match[0].replace(/-/g, '');
+            if (isbn.length !== 13) isbn = '';  // validate length
+        }
+        // ISBN-10 with optional hyphens
+        if (!isbn) {
+            const isbn10Match = searchText.match(/ISBN[:\s]*([\d][\d\-]{8,12}[\dXx])/i);
+            if (isbn10Match) {
+                const cleaned = isbn10Match[1].replace(/-/g, '');
+                if (cleaned.length === 10 || cleaned.length === 13) isbn = cleaned;
+            }
+        }
+        // Also check the URL for ISBN param
+        if (!isbn && url) {
+            try {
+                const u = new URL(url);
+                const vid = u.searchParams.get('vid') || '';
+                const isbnFromVid = vid.match(/ISBN[:\s]*([\d-]{10,17})/i);
+                if (isbnFromVid) isbn = isbnFromVid[1].replace(/-/g, '');
+                if (!isbn) {
+                    const isbnFromUrl = url.match(/isbn[=:]([\d-]{10,17})/i);
+                    if (isbnFromUrl) isbn = isbnFromUrl[1].replace(/-/g, '');
+                }
+            } catch(e) {}
+        }
 
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            await page.wait_for_timeout(2000)
-
-            results = await page.evaluate(
-                r"""
-                (numResults) => {
-                    const results = [];
-
-                    // Find all h3 elements that are book results
-                    const allH3 = document.querySelectorAll('h3');
-                    for (const h3 of allH3) {
-                        if (results.length >= numResults) break;
-
-                        const title = h3.innerText.trim();
-                        if (!title || title.length < 3) continue;
-                        // Skip navigation/header h3s
-                        if (title === 'Search Results' || title === 'Filters and topics') continue;
-
-                        // Walk up to find the result container
-                        let container = h3.closest('.g') || h3.parentElement?.parentElement?.parentElement;
-                        if (!container) continue;
-
-                        // Get the link
-                        const linkEl = container.querySelector('a[href*="books.google"], a[href^="http"]');
-                        const url = linkEl ? linkEl.href : '';
-
-                        // Get snippet
-                        const snippetEl = container.querySelector('.VwiC3b, .cmlJmd, [data-sncf]');
-                        const snippet = snippetEl ? snippetEl.innerText.trim() : '';
-
-                        // Get author - look for text between the title and snippet
-                        let author = '';
-                        const metaEls = container.querySelectorAll('span, cite');
-                        for (const el of metaEls) {
-                            const t = el.innerText.trim();
-                            if (t && t !== title && !t.includes('http') &&
-                                (t.includes(',') || t.includes('·') || /\d{4}/.test(t)) &&
-                                t.length < 200) {
-                                author = t;
-                                break;
-                            }
-                        }
+        results.push({ title, url, author, snippet, isbn });
+    }
+    return results;
+}
+""")
 
-                        // Extract ISBN from container text or URL
-                        let isbn = '';
-                        const containerText = container.innerText || '';
-                        const containerHtml = container.innerHTML || '';
-                        const searchText = containerText + ' ' + containerHtml;
-                        // ISBN-13 with optional hyphens (starts with 978 or 979)
-                        const isbn13Match = searchText.match(/97[89][\d-]{10,16}/);
-                        if (isbn13Match) {
-                            isbn = isbn13Match[0].replace(/-/g, '');
-                            if (isbn.length !== 13) isbn = '';  // validate length
-                        }
-                        // ISBN-10 with optional hyphens
-                        if (!isbn) {
-                            const isbn10Match = searchText.match(/ISBN[:\s]*([\d][\d\-]{8,12}[\dXx])/i);
-                            if (isbn10Match) {
-                                const cleaned = isbn10Match[1].replace(/-/g, '');
-                                if (cleaned.length === 10 || cleaned.length === 13) isbn = cleaned;
-                            }
-                        }
-                        // Also check the URL for ISBN param
-                        if (!isbn && url) {
-                            try {
-                                const u = new URL(url);
-                                const vid = u.searchParams.get('vid') || '';
-                                const isbnFromVid = vid.match(/ISBN[:\s]*([\d-]{10,17})/i);
-                                if (isbnFromVid) isbn = isbnFromVid[1].replace(/-/g, '');
-                                if (!isbn) {
-                                    const isbnFromUrl = url.match(/isbn[=:]([\d-]{10,17})/i);
-                                    if (isbnFromUrl) isbn = isbnFromUrl[1].replace(/-/g, '');
-                                }
-                            } catch(e) {}
-                        }
 
-                        results.push({ title, url, author, snippet, isbn });
-                    }
-                    return results;
-                }
-                """,
-                num_results,
-            )
+@_cached(_results_cache)
+@_timed
+async def _do_google_books(query: str, num_results: int = 5) -> str:
+    """Search Google Books for books and publications."""
+    encoded_query = _quote_plus(query)
+    url = f"https://www.google.com/search?q={encoded_query}&hl=en&tbm=bks&num={num_results + 2}"
+
+    async with _context_pool.acquire() as (context, page):
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            await _dismiss_consent(page)
+            await _wait_for_target(page, "books")
+
+            results = await page.evaluate(_BOOKS_JS, num_results)
 
             if not results:
                 return f"No book results found for: {query}"
 
-            lines = [f"Google Books Results for: {query}\n"]
-            for i, r in enumerate(results[:num_results], 1):
-                lines.append(f"{i}. {r['title']}")
-                if r.get("author"):
-                    lines.append(f"   Author: {r['author']}")
-                if r.get("isbn"):
-                    lines.append(f"   ISBN: {r['isbn']}")
-                if r.get("url"):
-                    lines.append(f"   URL: {r['url']}")
-                if r.get("snippet"):
-                    lines.append(f"   {r['snippet']}")
-                lines.append("")
-
-            return "\n".join(lines)
+            blocks = [
+                _labelled_block(f"{i}. {r['title']}", (
+                    ("Author", r["author"]),
+                    ("ISBN", r["isbn"]),
+                    ("URL", r["url"]),
+                    ("", r["snippet"]),
+                ))
+                for i, r in enumerate(results[:num_results], 1)
+            ]
+            return f"Google Books Results for: {query}\n\n" + "\n\n".join(blocks) + "\n"
 
         except Exception as e:
             return f"Book search failed: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def google_books(query: str, num_results: int = 5) -> str:
@@ -2307,7 +3420,7 @@ async def google_books(query: str, num_results: int = 5) -> str:
 # google_translate
 # ---------------------------------------------------------------------------
 
-LANGUAGE_CODES = {
+LANGUAGE_CODES = MappingProxyType({
     "english": "en", "spanish": "es", "french": "fr", "german": "de",
     "italian": "it", "portuguese": "pt", "japanese": "ja", "korean": "ko",
     "chinese": "zh-CN", "arabic": "ar", "russian": "ru", "hindi": "hi",
@@ -2315,78 +3428,118 @@ LANGUAGE_CODES = {
     "thai": "th", "vietnamese": "vi", "indonesian": "id", "greek": "el",
     "hebrew": "he", "czech": "cs", "danish": "da", "finnish": "fi",
     "norwegian": "no", "romanian": "ro", "hungarian": "hu", "ukrainian": "uk",
-}
+})
 
 
-async def _do_google_translate(text: str, to_language: str, from_language: str = "") -> str:
-    """Translate text using Google Translate directly."""
-    # Resolve language names to codes
-    tl = LANGUAGE_CODES.get(to_language.lower(), to_language.lower())
-    sl = LANGUAGE_CODES.get(from_language.lower(), from_language.lower()) if from_language else "auto"
+@functools.lru_cache(maxsize=128)
+def _resolve_lang(name: str) -> str:
+    """Map a language name ("German") to its Translate code, passing codes through."""
+    key = name.lower()
+    return LANGUAGE_CODES.get(key, key)
 
-    encoded_text = quote_plus(text)
-    url = f"https://translate.google.com/?sl={sl}&tl={tl}&text={encoded_text}&op=translate"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+_TRANSLATE_JS = _page_extractor("translate", r"""
+() => {
+    const data = {};
 
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            # Wait for translation to load
-            await page.wait_for_timeout(3000)
-
-            data = await page.evaluate(
-                r"""
-                () => {
-                    const data = {};
-
-                    // Translation output is in spans with lang attribute inside the result container
-                    const resultContainer = document.querySelector('[data-result-index] .HwtZe, .lRu31, [jsname="W297wb"]');
-                    if (resultContainer) {
-                        data.translation = resultContainer.innerText.trim();
-                    }
+    // Translation output is in spans with lang attribute inside the result container
+    const resultContainer = document.querySelector('[data-result-index] .HwtZe, .lRu31, [jsname="W297wb"]');
+    if (resultContainer) {
+        data.translation = resultContainer.innerText.trim();
+    }
 
-                    // Fallback: look for the output textarea or contenteditable
-                    if (!data.translation) {
-                        const outputArea = document.querySelector(
-                            '.J0lOec, [aria-label*="Translation"], ' +
-                            'span[jsname="W297wb"], .ryNqvb, ' +
-                            '[data-language-to-translate-into] .Y2IQFc'
-                        );
-                        if (outputArea) {
-                            data.translation = outputArea.innerText.trim();
-                        }
-                    }
+    // Fallback: look for the output textarea or contenteditable
+    if (!data.translation) {
+        const outputArea = document.querySelector(
+            '.J0lOec, [aria-label*="Translation"], ' +
+            'span[jsname="W297wb"], .ryNqvb, ' +
+            '[data-language-to-translate-into] .Y2IQFc'
+        );
+        if (outputArea) {
+            data.translation = outputArea.innerText.trim();
+        }
+    }
 
-                    // Last resort: get all text containers and find the non-source one
-                    if (!data.translation) {
-                        const containers = document.querySelectorAll('.Y2IQFc');
-                        if (containers.length >= 2) {
-                            data.translation = containers[containers.length - 1].innerText.trim();
-                        }
-                    }
+    // Last resort: get all text containers and find the non-source one
+    if (!data.translation) {
+        const containers = document.querySelectorAll('.Y2IQFc');
+        if (containers.length >= 2) {
+            data.translation = containers[containers.length - 1].innerText.trim();
+        }
+    }
 
-                    return data;
-                }
-                """
-            )
+    return data;
+}
+""")
 
-            if not data.get("translation") or data["translation"] == text:
-                return f"Could not translate: {text}"
 
-            lines = ["Google Translate\n"]
-            lines.append(f"Original: {text}")
-            lines.append(f"Translation ({to_language}): {data['translation']}")
+async def _translate_via_http(text: str, sl: str, tl: str) -> str:
+    """Translate through the endpoint the Translate web app itself calls, without a browser.
 
-            return "\n".join(lines)
+    Raises _NeedsBrowser when the fast path is disabled or cooling down, or
+    when the endpoint errors, blocks us or returns nothing.
+    """
+    url = "https://translate.googleapis.com/translate_a/single?" + urlencode(
+        {"client": "gtx", "sl": sl, "tl": tl, "dt": "t", "q": text}
+    )
+    host = "translate.googleapis.com"
+    if not SERP_HTTP or time.monotonic() < _serp_http_cooldown.get(host, 0):
+        raise _NeedsBrowser(url)
+    try:
+        with _Phase("http_fetch"):
+            resp = await _http.get(url)
+    except httpx.HTTPError as e:
+        raise _NeedsBrowser(url) from e
+    try:
+        if resp.status_code != 200:
+            raise ValueError(f"HTTP {resp.status_code}")
+        # [[["translated", "original", ...], ...], ...]; one entry per sentence
+        translation = "".join(seg[0] for seg in resp.json()[0] if seg and seg[0])
+    except (ValueError, TypeError, IndexError) as e:
+        # Blocked or changed: stop trying this endpoint for a while
+        _serp_http_cooldown[host] = time.monotonic() + SERP_HTTP_COOLDOWN
+        raise _NeedsBrowser(url) from e
+    if not translation:
+        raise _NeedsBrowser(url)
+    return translation
+
+
+@_cached(_translate_cache)
+@_timed
+async def _do_google_translate(text: str, to_language: str, from_language: str = "") -> str:
+    """Translate text using Google Translate directly."""
+    # Resolve language names to codes
+    tl = _resolve_lang(to_language)
+    sl = _resolve_lang(from_language) if from_language else "auto"
 
-        except Exception as e:
-            return f"Translation failed: {e}"
+    try:
+        translation = await _translate_via_http(text, sl, tl)
+    except _NeedsBrowser:
+        url = "https://translate.google.com/?" + urlencode(
+            {"sl": sl, "tl": tl, "text": text, "op": "translate"}
+        )
 
-        finally:
-            await browser.close()
+        async with _context_pool.acquire() as (context, page):
+            try:
+                # The translation is fetched after the app boots, so wait for it
+                # rather than for DOMContentLoaded
+                await _goto_until_target(page, url, "translate", timeout_ms=6000)
+                await _dismiss_consent(page)
+                await _wait_for_target(page, "translate", timeout_ms=3000)
+
+                data = await page.evaluate(_TRANSLATE_JS)
+                translation = data.get("translation")
+            except Exception as e:
+                return f"Translation failed: {e}"
+
+    if not translation or translation == text:
+        return f"Could not translate: {text}"
+
+    lines = ["Google Translate\n"]
+    lines.append(f"Original: {text}")
+    lines.append(f"Translation ({to_language}): {translation}")
+
+    return "\n".join(lines)
 
 
 @mcp.tool()
@@ -2412,6 +3565,87 @@ async def google_translate(text: str, to_language: str, from_language: str = "")
 # google_flights
 # ---------------------------------------------------------------------------
 
+_FLIGHTS_JS = _page_extractor("flights", """
+() => {
+    const data = { flights: [] };
+
+    // Google's flight card in search results
+    const flightCards = window.__queryIn(
+        '#search',
+        '.OgdJid, ' +
+        '.zBTtmb, ' +
+        '[data-attrid*="flight"] .wUrVib, ' +
+        '.fltt-card, ' +
+        '.gws-flights__result'
+    );
+
+    for (const card of flightCards) {
+        const text = card.innerText.trim();
+        if (text && text.length > 10) {
+            data.flights.push({ raw: text });
+        }
+    }
+
+    // Try the flights widget
+    if (data.flights.length === 0) {
+        const widget = document.querySelector(
+            '[data-attrid*="flight"], ' +
+            '.gws-flights, ' +
+            '.VkpGBb[data-attrid*="flight"]'
+        );
+        if (widget) {
+            data.widget_text = widget.innerText.substring(0, 3000);
+        }
+    }
+
+    // Also grab the "View all flights" link if present
+    const viewAll = document.querySelector('a[href*="google.com/travel/flights"]');
+    data.flights_url = viewAll ? viewAll.href : '';
+
+    // Knowledge panel or featured snippet - only shown when
+    // neither the cards nor the widget turned anything up
+    const panel = (data.flights.length === 0 && !data.widget_text)
+        ? document.querySelector('.kp-wholepage, .liYKde, .ULSxyf')
+        : null;
+    if (panel) {
+        const flightInfo = panel.innerText.substring(0, 2000);
+        if (flightInfo.toLowerCase().includes('flight') || flightInfo.includes('$') || flightInfo.includes('hr')) {
+            data.panel_text = flightInfo;
+        }
+    }
+
+    return data;
+}
+""")
+
+
+def _parse_flights(tree, num_results: int) -> dict:
+    """Extract flight cards and the flights widget from a server-rendered results page.
+
+    Mirrors _FLIGHTS_JS.  Returns {} when neither is in the HTML, so the
+    caller falls back to the browser, where they may still render.
+    """
+    root = tree.css_first("div#search") or tree.body
+    data = {"flights": []}
+    for card in root.css(
+        '.OgdJid, .zBTtmb, [data-attrid*="flight"] .wUrVib, .fltt-card, .gws-flights__result'
+    ):
+        text = _node_lines(card)
+        if len(text) > 10:
+            data["flights"].append({"raw": text})
+    if not data["flights"]:
+        widget = tree.css_first('[data-attrid*="flight"], .gws-flights, .VkpGBb[data-attrid*="flight"]')
+        if widget is not None:
+            data["widget_text"] = _node_lines(widget)[:3000]
+    if not data["flights"] and not data.get("widget_text"):
+        return {}
+    view_all = tree.css_first('a[href*="google.com/travel/flights"], a[href^="/travel/flights"]')
+    data["flights_url"] = urljoin("https://www.google.com/", view_all.attributes.get("href") or "") if view_all is not None else ""
+    return data
+
+
+@_cached(_travel_cache)
+@_timed
 async def _do_google_flights(
     origin: str, destination: str, date: str = "", return_date: str = ""
 ) -> str:
@@ -2423,111 +3657,65 @@ async def _do_google_flights(
         query_parts.append(f"return {return_date}")
 
     search_query = " ".join(query_parts)
-    encoded_query = quote_plus(search_query)
+    encoded_query = _quote_plus(search_query)
     url = f"https://www.google.com/search?q={encoded_query}&hl=en"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
-
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            await page.wait_for_timeout(3000)
-
-            data = await page.evaluate(
-                """
-                () => {
-                    const data = { flights: [] };
-
-                    // Google's flight card in search results
-                    const flightCards = document.querySelectorAll(
-                        '.OgdJid, ' +
-                        '.zBTtmb, ' +
-                        '[data-attrid*="flight"] .wUrVib, ' +
-                        '.fltt-card, ' +
-                        '.gws-flights__result'
-                    );
-
-                    for (const card of flightCards) {
-                        const text = card.innerText.trim();
-                        if (text && text.length > 10) {
-                            data.flights.push({ raw: text });
-                        }
-                    }
+    try:
+        data = await _serp_via_http(url, "div#search", _parse_flights, 0)
+    except _NeedsBrowser:
+        data = None
 
-                    // Try the flights widget
-                    if (data.flights.length === 0) {
-                        const widget = document.querySelector(
-                            '[data-attrid*="flight"], ' +
-                            '.gws-flights, ' +
-                            '.VkpGBb[data-attrid*="flight"]'
-                        );
-                        if (widget) {
-                            data.widget_text = widget.innerText.substring(0, 3000);
-                        }
-                    }
+    if data is None:
+        async with _context_pool.acquire() as (context, page):
+            try:
+                await _goto_until_target(page, url, "flights")
+                await _dismiss_consent(page)
+                # Cards keep streaming in after the first one; five are shown
+                await _wait_for_target(
+                    page, "flights", timeout_ms=3000,
+                    rows=".OgdJid, .zBTtmb, .fltt-card, .gws-flights__result", min_rows=5,
+                )
 
-                    // Also grab the "View all flights" link if present
-                    const viewAll = document.querySelector('a[href*="google.com/travel/flights"]');
-                    data.flights_url = viewAll ? viewAll.href : '';
+                data = await page.evaluate(_FLIGHTS_JS)
+            except Exception as e:
+                return f"Flight search failed: {e}"
 
-                    // Get the knowledge panel or featured snippet about flights
-                    const panel = document.querySelector('.kp-wholepage, .liYKde, .ULSxyf');
-                    if (panel) {
-                        const flightInfo = panel.innerText.substring(0, 2000);
-                        if (flightInfo.toLowerCase().includes('flight') || flightInfo.includes('$') || flightInfo.includes('hr')) {
-                            data.panel_text = flightInfo;
-                        }
-                    }
+    lines = [f"Google Flights: {origin} to {destination}\n"]
+    if date:
+        lines.append(f"Date: {date}")
+    if return_date:
+        lines.append(f"Return: {return_date}")
+    lines.append("")
 
-                    return data;
-                }
-                """
-            )
+    has_data = False
 
-            lines = [f"Google Flights: {origin} to {destination}\n"]
-            if date:
-                lines.append(f"Date: {date}")
-            if return_date:
-                lines.append(f"Return: {return_date}")
+    if data.get("flights"):
+        for f in data["flights"][:5]:
+            raw = f.get("raw", "")
+            # Clean up and format
+            raw = _BLANK_LINES_RE.sub('\n', raw).strip()
+            lines.append(raw)
             lines.append("")
+        has_data = True
 
-            has_data = False
-
-            if data.get("flights"):
-                for f in data["flights"][:5]:
-                    raw = f.get("raw", "")
-                    # Clean up and format
-                    raw = re.sub(r'\n{2,}', '\n', raw).strip()
-                    lines.append(raw)
-                    lines.append("")
-                has_data = True
-
-            if data.get("widget_text"):
-                text = re.sub(r'\n{3,}', '\n\n', data["widget_text"]).strip()
-                lines.append(text)
-                has_data = True
-
-            if data.get("panel_text") and not has_data:
-                text = re.sub(r'\n{3,}', '\n\n', data["panel_text"]).strip()
-                lines.append(text)
-                has_data = True
-
-            if data.get("flights_url"):
-                lines.append(f"\nView all flights: {data['flights_url']}")
+    if data.get("widget_text"):
+        text = _MULTI_NL_RE.sub('\n\n', data["widget_text"]).strip()
+        lines.append(text)
+        has_data = True
 
-            if not has_data and not data.get("flights_url"):
-                lines.append(f"No flight data found. Try searching directly:")
-                lines.append(f"https://www.google.com/travel/flights")
+    if data.get("panel_text") and not has_data:
+        text = _MULTI_NL_RE.sub('\n\n', data["panel_text"]).strip()
+        lines.append(text)
+        has_data = True
 
-            return "\n".join(lines)
+    if data.get("flights_url"):
+        lines.append(f"\nView all flights: {data['flights_url']}")
 
-        except Exception as e:
-            return f"Flight search failed: {e}"
+    if not has_data and not data.get("flights_url"):
+        lines.append(f"No flight data found. Try searching directly:")
+        lines.append(f"https://www.google.com/travel/flights")
 
-        finally:
-            await browser.close()
+    return "\n".join(lines)
 
 
 @mcp.tool()
@@ -2556,227 +3744,331 @@ async def google_flights(
 # google_hotels
 # ---------------------------------------------------------------------------
 
-async def _do_google_hotels(query: str, num_results: int = 5) -> list:
-    """Search Google for hotel information."""
-    encoded_query = quote_plus(f"hotels {query}")
-    url = f"https://www.google.com/search?q={encoded_query}&hl=en"
+_HOTELS_JS = _page_extractor("hotels", r"""
+(numResults) => {
+    // One array per field rather than one object per card -
+    // rows are zipped back together on the Python side.
+    const names = [], prices = [], ratings = [], reviews = [], urls = [], thumbnails = [];
+    const data = { names, prices, ratings, reviews, urls, thumbnails };
+
+    // Strategy: .BTPx6e elements ARE the hotel name elements.
+    // Walk up to the row container to find price/rating/link/image.
+    // Images are in sibling elements with class "uhHOwf".
+    const nameEls = window.__queryIn('#search', '.BTPx6e');
+
+    // Collect hotel thumbnail images separately — they sit in
+    // .uhHOwf containers as siblings/cousins of the name elements.
+    // Pair them with hotels by index.
+    const thumbImgs = window.__queryIn('#search', '.uhHOwf img, .taJbee img');
+    const thumbSrcs = [];
+    for (const img of thumbImgs) {
+        const src = img.src || img.dataset?.src || '';
+        if (src && !thumbSrcs.includes(src)) thumbSrcs.push(src);
+    }
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    for (const nameEl of nameEls) {
+        if (names.length >= numResults) break;
 
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await _dismiss_consent(page)
-            await page.wait_for_timeout(3000)
-
-            data = await page.evaluate(
-                r"""
-                (numResults) => {
-                    const data = { hotels: [] };
-
-                    // Strategy: .BTPx6e elements ARE the hotel name elements.
-                    // Walk up to the row container to find price/rating/link/image.
-                    // Images are in sibling elements with class "uhHOwf".
-                    const nameEls = document.querySelectorAll('.BTPx6e');
-
-                    // Collect hotel thumbnail images separately — they sit in
-                    // .uhHOwf containers as siblings/cousins of the name elements.
-                    // Pair them with hotels by index.
-                    const thumbImgs = document.querySelectorAll('.uhHOwf img, .taJbee img');
-                    const thumbSrcs = [];
-                    for (const img of thumbImgs) {
-                        const src = img.src || img.dataset?.src || '';
-                        if (src && !thumbSrcs.includes(src)) thumbSrcs.push(src);
-                    }
+        const name = nameEl.innerText.trim();
+        if (!name || name.length < 2) continue;
 
-                    for (const nameEl of nameEls) {
-                        if (data.hotels.length >= numResults) break;
+        // Walk up to find the row container (up to 6 levels)
+        let row = nameEl;
+        for (let i = 0; i < 6; i++) {
+            if (!row.parentElement) break;
+            row = row.parentElement;
+            // Stop when we find a container with a link or price
+            if (row.querySelector('a[href]') && row.querySelector('a[href]') !== nameEl) break;
+        }
 
-                        const name = nameEl.innerText.trim();
-                        if (!name || name.length < 2) continue;
+        // Extract price — look in the row and siblings
+        let price = '';
+        const priceEl = row.querySelector('.kixHKb, .qeiSWe, .priceText, .hVE8ee');
+        if (priceEl) {
+            price = priceEl.innerText.trim();
+        } else {
+            // Search row text for price pattern
+            const rowText = row.innerText || '';
+            const priceMatch = rowText.match(/(?:CHF|USD|\$|€|£)\s*[\d,.]+/i)
+                || rowText.match(/[\d,.]+\s*(?:CHF|USD|EUR|per night)/i);
+            if (priceMatch) price = priceMatch[0].trim();
+        }
 
-                        // Walk up to find the row container (up to 6 levels)
-                        let row = nameEl;
-                        for (let i = 0; i < 6; i++) {
-                            if (!row.parentElement) break;
-                            row = row.parentElement;
-                            // Stop when we find a container with a link or price
-                            if (row.querySelector('a[href]') && row.querySelector('a[href]') !== nameEl) break;
-                        }
+        // Extract rating
+        let rating = '';
+        const ratingEl = row.querySelector('.KFi5wf, .MW4etd, .yi40Hd');
+        if (ratingEl) rating = ratingEl.innerText.trim();
 
-                        // Extract price — look in the row and siblings
-                        let price = '';
-                        const priceEl = row.querySelector('.kixHKb, .qeiSWe, .priceText, .hVE8ee');
-                        if (priceEl) {
-                            price = priceEl.innerText.trim();
-                        } else {
-                            // Search row text for price pattern
-                            const rowText = row.innerText || '';
-                            const priceMatch = rowText.match(/(?:CHF|USD|\$|€|£)\s*[\d,.]+/i)
-                                || rowText.match(/[\d,.]+\s*(?:CHF|USD|EUR|per night)/i);
-                            if (priceMatch) price = priceMatch[0].trim();
-                        }
+        // Extract reviews
+        const reviewsEl = row.querySelector('.jdzyld, .RDApEe');
+        const reviewCount = reviewsEl ? reviewsEl.innerText.trim().replace(/[()]/g, '') : '';
 
-                        // Extract rating
-                        let rating = '';
-                        const ratingEl = row.querySelector('.KFi5wf, .MW4etd, .yi40Hd');
-                        if (ratingEl) rating = ratingEl.innerText.trim();
-
-                        // Extract reviews
-                        let reviews = '';
-                        const reviewsEl = row.querySelector('.jdzyld, .RDApEe');
-                        if (reviewsEl) reviews = reviewsEl.innerText.trim().replace(/[()]/g, '');
-
-                        // Extract link
-                        const bookLink = row.querySelector(
-                            'a[href*="hotel"], a[href*="book"], a[href*="travel"], a[href*="maps"]'
-                        );
-                        const linkEl = bookLink || row.querySelector('a[href]');
-                        let linkUrl = linkEl ? linkEl.href : '';
-                        if (linkUrl.includes('/url?') || linkUrl.includes('google.com/url')) {
-                            try {
-                                const u = new URL(linkUrl);
-                                linkUrl = u.searchParams.get('q') || u.searchParams.get('url') || linkUrl;
-                            } catch(e) {}
-                        }
+        // Extract link
+        const bookLink = row.querySelector(
+            'a[href*="hotel"], a[href*="book"], a[href*="travel"], a[href*="maps"]'
+        );
+        const linkEl = bookLink || row.querySelector('a[href]');
+        let linkUrl = linkEl ? linkEl.href : '';
+        if (linkUrl.includes('/url?') || linkUrl.includes('google.com/url')) {
+            try {
+                const u = new URL(linkUrl);
+                linkUrl = u.searchParams.get('q') || u.searchParams.get('url') || linkUrl;
+            } catch(e) {}
+        }
 
-                        // Image: try within the row first, then pair by index
-                        let thumbnail = '';
-                        // Check row for images
-                        const rowImgs = row.querySelectorAll('img');
-                        for (const img of rowImgs) {
-                            const s = img.src || img.dataset?.src || '';
-                            if (!s) continue;
-                            if (s.startsWith('data:image') && s.length > 500) { thumbnail = s; break; }
-                            if (s.startsWith('http') && !s.includes('gstatic.com/s/i/')) { thumbnail = s; break; }
-                            // Protocol-relative URLs
-                            if (s.startsWith('//')) { thumbnail = 'https:' + s; break; }
-                        }
-                        // Fallback: pair by index from the collected thumbnails
-                        if (!thumbnail) {
-                            const idx = data.hotels.length;
-                            if (idx < thumbSrcs.length) {
-                                let s = thumbSrcs[idx];
-                                if (s.startsWith('//')) s = 'https:' + s;
-                                thumbnail = s;
-                            }
-                        }
+        // Image: try within the row first, then pair by index
+        let thumbnail = '';
+        // Check row for images
+        const rowImgs = row.querySelectorAll('img');
+        for (const img of rowImgs) {
+            const s = img.src || img.dataset?.src || '';
+            if (!s) continue;
+            if (s.startsWith('data:image') && s.length > 500) { thumbnail = s; break; }
+            if (s.startsWith('http') && !s.includes('gstatic.com/s/i/')) { thumbnail = s; break; }
+            // Protocol-relative URLs
+            if (s.startsWith('//')) { thumbnail = 'https:' + s; break; }
+        }
+        // Fallback: pair by index from the collected thumbnails
+        if (!thumbnail) {
+            const idx = names.length;
+            if (idx < thumbSrcs.length) {
+                let s = thumbSrcs[idx];
+                if (s.startsWith('//')) s = 'https:' + s;
+                thumbnail = s;
+            }
+        }
 
-                        data.hotels.push({
-                            name, price, rating, reviews, url: linkUrl, thumbnail,
-                        });
-                    }
+        names.push(name);
+        prices.push(price);
+        ratings.push(rating);
+        reviews.push(reviewCount);
+        urls.push(linkUrl);
+        thumbnails.push(thumbnail);
+    }
 
-                    // Fallback: get the hotel widget text
-                    if (data.hotels.length === 0) {
-                        const widget = document.querySelector(
-                            '[data-attrid*="hotel"], .kp-wholepage, .liYKde'
-                        );
-                        if (widget) {
-                            const text = widget.innerText.substring(0, 3000);
-                            if (text.toLowerCase().includes('hotel') || text.includes('$') || text.includes('/night')) {
-                                data.widget_text = text;
-                            }
-                        }
-                    }
+    // Fallback: get the hotel widget text
+    if (names.length === 0) {
+        const widget = document.querySelector(
+            '[data-attrid*="hotel"], .kp-wholepage, .liYKde'
+        );
+        if (widget) {
+            const text = widget.innerText.substring(0, 3000);
+            if (text.toLowerCase().includes('hotel') || text.includes('$') || text.includes('/night')) {
+                data.widget_text = text;
+            }
+        }
+    }
 
-                    // "View all hotels" link
-                    const viewAll = document.querySelector('a[href*="google.com/travel/hotels"]');
-                    data.hotels_url = viewAll ? viewAll.href : '';
+    // "View all hotels" link
+    const viewAll = document.querySelector('a[href*="google.com/travel/hotels"]');
+    data.hotels_url = viewAll ? viewAll.href : '';
 
-                    return data;
-                }
-                """,
-                num_results,
-            )
+    return data;
+}
+""")
 
-            # Download thumbnail images for inline display
-            import base64 as b64mod
-            if data.get("hotels"):
-                for h in data["hotels"][:num_results]:
-                    thumb_url = h.get("thumbnail", "")
-                    if not thumb_url:
-                        continue
-                    # Handle base64 data URIs from inline images
-                    if thumb_url.startswith("data:image"):
-                        try:
-                            # data:image/jpeg;base64,/9j/4AAQ...
-                            header, b64data = thumb_url.split(",", 1)
-                            body = b64mod.b64decode(b64data)
-                            if len(body) < 500 or len(body) > 5_000_000:
-                                continue
-                            h["image_bytes"] = body
-                            ct = header.split(";")[0].replace("data:", "")
-                            h["content_type"] = ct or "image/jpeg"
-                        except Exception:
-                            pass
-                        continue
-                    # Download HTTP URLs
-                    if not thumb_url.startswith("http"):
-                        continue
-                    try:
-                        resp = await context.request.get(thumb_url, timeout=8000)
-                        if resp.ok:
-                            body = await resp.body()
-                            if len(body) < 1000 or len(body) > 5_000_000:
-                                continue
-                            h["image_bytes"] = body
-                            ct = resp.headers.get("content-type", "image/jpeg")
-                            h["content_type"] = ct.split(";")[0].strip()
-                    except Exception:
+
+def _parse_hotels(tree, num_results: int) -> dict:
+    """Extract the hotel pack from a server-rendered results page, in _HOTELS_JS's parallel-array shape.
+
+    Returns {} when the HTML has no hotel rows, or none with a thumbnail
+    (Google often fills those in with script), so the caller falls back to
+    the browser.
+    """
+    root = tree.css_first("div#search") or tree.body
+    names, prices, ratings, reviews, urls, thumbnails = [], [], [], [], [], []
+
+    thumb_srcs = []
+    for img in root.css(".uhHOwf img, .taJbee img"):
+        src = img.attributes.get("src") or img.attributes.get("data-src") or ""
+        if src and src not in thumb_srcs:
+            thumb_srcs.append(src)
+
+    for name_el in root.css(".BTPx6e"):
+        if len(names) >= num_results:
+            break
+        name = _node_text(name_el)
+        if len(name) < 2:
+            continue
+
+        # Walk up to the row container (up to 6 levels), stopping at the first with a
+        # link inside it; selectolax's css() also matches the node itself, unlike querySelector
+        row = name_el
+        for _ in range(6):
+            if row.parent is None:
+                break
+            row = row.parent
+            if any(a != row for a in row.css("a[href]")):
+                break
+
+        price_el = row.css_first(".kixHKb, .qeiSWe, .priceText, .hVE8ee")
+        if price_el is not None:
+            price = _node_text(price_el)
+        else:
+            row_text = row.text(separator=" ")
+            m = _HOTEL_PRICE_RE.search(row_text) or _HOTEL_PRICE_SUFFIX_RE.search(row_text)
+            price = m.group(0).strip() if m else ""
+
+        link = row.css_first(
+            'a[href*="hotel"], a[href*="book"], a[href*="travel"], a[href*="maps"]'
+        ) or row.css_first("a[href]")
+        link_url = urljoin("https://www.google.com/", link.attributes.get("href") or "") if link is not None else ""
+        if "/url?" in link_url:
+            params = parse_qs(urlparse(link_url).query)
+            link_url = (params.get("q") or params.get("url") or [link_url])[0]
+
+        thumbnail = ""
+        for img in row.css("img"):
+            src = img.attributes.get("src") or img.attributes.get("data-src") or ""
+            if src.startswith("data:image") and len(src) > 500:
+                thumbnail = src
+            elif src.startswith("http") and "gstatic.com/s/i/" not in src:
+                thumbnail = src
+            elif src.startswith("//"):
+                thumbnail = "https:" + src
+            if thumbnail:
+                break
+        if not thumbnail and len(names) < len(thumb_srcs):
+            thumbnail = thumb_srcs[len(names)]
+            if thumbnail.startswith("//"):
+                thumbnail = "https:" + thumbnail
+
+        names.append(name)
+        prices.append(price)
+        ratings.append(_node_text(row.css_first(".KFi5wf, .MW4etd, .yi40Hd")))
+        reviews.append(_node_text(row.css_first(".jdzyld, .RDApEe")).replace("(", "").replace(")", ""))
+        urls.append(link_url)
+        thumbnails.append(thumbnail)
+
+    if not any(thumbnails):
+        return {}
+    view_all = tree.css_first('a[href*="google.com/travel/hotels"], a[href^="/travel/hotels?"]')
+    return {
+        "names": names, "prices": prices, "ratings": ratings,
+        "reviews": reviews, "urls": urls, "thumbnails": thumbnails,
+        "hotels_url": urljoin("https://www.google.com/", view_all.attributes.get("href") or "") if view_all is not None else "",
+    }
+
+
+async def _hotels_content(query: str, data: dict, num_results: int, context) -> list:
+    """Format hotel rows in the extractor's parallel-array shape, with thumbnails inline."""
+    data["hotels"] = [
+        {"name": name, "price": price, "rating": rating,
+         "reviews": review_count, "url": link, "thumbnail": thumb}
+        for name, price, rating, review_count, link, thumb in zip(
+            data["names"], data["prices"], data["ratings"],
+            data["reviews"], data["urls"], data["thumbnails"],
+        )
+    ]
+
+    # Download thumbnail images for inline display
+    import base64 as b64mod
+    if data["hotels"]:
+        remote = []
+        for h in data["hotels"][:num_results]:
+            thumb_url = h.get("thumbnail", "")
+            if not thumb_url:
+                continue
+            # Handle base64 data URIs from inline images
+            if thumb_url.startswith("data:image"):
+                try:
+                    # data:image/jpeg;base64,/9j/4AAQ...
+                    header, b64data = thumb_url.split(",", 1)
+                    body = b64mod.b64decode(b64data)
+                    if len(body) < 500 or len(body) > 5_000_000:
                         continue
+                    h["image_bytes"] = body
+                    ct = header.split(";")[0].replace("data:", "")
+                    h["content_type"] = ct or "image/jpeg"
+                except Exception:
+                    pass
+                continue
+            # HTTP URLs are downloaded together below
+            if thumb_url.startswith("http"):
+                remote.append(h)
+        fetched = await asyncio.gather(*(
+            _fetch_image(context, (h["thumbnail"],)) for h in remote
+        ))
+        for h, img in zip(remote, fetched):
+            if img:
+                h["image_bytes"], h["content_type"] = img
+
+    # Build mixed content: text descriptions + inline images
+    content: list = [f"Google Hotels: {query}\n"]
+    has_data = False
+
+    if data.get("hotels"):
+        for i, h in enumerate(data["hotels"][:num_results], 1):
+            desc = f"{i}. {h['name']}"
+            if h.get("price"):
+                desc += f"\n   Price: {h['price']}"
+            if h.get("rating"):
+                rating_str = f"   Rating: {h['rating']}"
+                if h.get("reviews"):
+                    rating_str += f" ({h['reviews']} reviews)"
+                desc += f"\n{rating_str}"
+            if h.get("url"):
+                desc += f"\n   URL: {h['url']}"
+            content.append(desc)
+
+            if h.get("image_bytes"):
+                try:
+                    ct = h.get("content_type", "image/jpeg")
+                    fmt_map = {
+                        "image/jpeg": "jpeg", "image/png": "png",
+                        "image/gif": "gif", "image/webp": "webp",
+                    }
+                    fmt = fmt_map.get(ct, "jpeg")
+                    content.append(Image(data=h["image_bytes"], format=fmt))
+                except Exception:
+                    pass
+        has_data = True
 
-            # Build mixed content: text descriptions + inline images
-            content: list = [f"Google Hotels: {query}\n"]
-            has_data = False
+    if data.get("widget_text") and not has_data:
+        text = _MULTI_NL_RE.sub('\n\n', data["widget_text"]).strip()
+        content.append(text)
+        has_data = True
 
-            if data.get("hotels"):
-                for i, h in enumerate(data["hotels"][:num_results], 1):
-                    desc = f"{i}. {h['name']}"
-                    if h.get("price"):
-                        desc += f"\n   Price: {h['price']}"
-                    if h.get("rating"):
-                        rating_str = f"   Rating: {h['rating']}"
-                        if h.get("reviews"):
-                            rating_str += f" ({h['reviews']} reviews)"
-                        desc += f"\n{rating_str}"
-                    if h.get("url"):
-                        desc += f"\n   URL: {h['url']}"
-                    content.append(desc)
-
-                    if h.get("image_bytes"):
-                        try:
-                            ct = h.get("content_type", "image/jpeg")
-                            fmt_map = {
-                                "image/jpeg": "jpeg", "image/png": "png",
-                                "image/gif": "gif", "image/webp": "webp",
-                            }
-                            fmt = fmt_map.get(ct, "jpeg")
-                            content.append(Image(data=h["image_bytes"], format=fmt))
-                        except Exception:
-                            pass
-                has_data = True
+    if data.get("hotels_url"):
+        content.append(f"\nView all hotels: {data['hotels_url']}")
 
-            if data.get("widget_text") and not has_data:
-                text = re.sub(r'\n{3,}', '\n\n', data["widget_text"]).strip()
-                content.append(text)
-                has_data = True
+    if not has_data and not data.get("hotels_url"):
+        content.append("No hotel data found. Try searching directly:")
+        content.append("https://www.google.com/travel/hotels")
 
-            if data.get("hotels_url"):
-                content.append(f"\nView all hotels: {data['hotels_url']}")
+    return content
 
-            if not has_data and not data.get("hotels_url"):
-                content.append("No hotel data found. Try searching directly:")
-                content.append("https://www.google.com/travel/hotels")
 
-            return content
+@_cached(_travel_cache)
+@_timed
+async def _do_google_hotels(query: str, num_results: int = 5) -> list:
+    """Search Google for hotel information."""
+    encoded_query = _quote_plus(f"hotels {query}")
+    url = f"https://www.google.com/search?q={encoded_query}&hl=en"
 
+    try:
+        data = await _serp_via_http(url, "div#search", _parse_hotels, num_results)
+    except _NeedsBrowser:
+        data = None
+    if data is not None:
+        try:
+            return await _hotels_content(query, data, num_results, None)
         except Exception as e:
             return f"Hotel search failed: {e}"
 
-        finally:
-            await browser.close()
+    async with _context_pool.acquire(block_resources=False) as (context, page):
+        try:
+            await _goto_until_target(page, url, "hotels")
+            await _dismiss_consent(page)
+            await _wait_for_target(page, "hotels", timeout_ms=3000, rows=".BTPx6e", min_rows=num_results)
+
+            data = await page.evaluate(_HOTELS_JS, num_results)
+            # Thumbnails are downloaded through the page's context, so build
+            # the result before the page goes back to the pool
+            return await _hotels_content(query, data, num_results, context)
+
+        except Exception as e:
+            return f"Hotel search failed: {e}"
 
 
 @mcp.tool()
@@ -2816,43 +4108,268 @@ def _is_base64_image(data: str) -> bool:
             return True
         except Exception:
             pass
-    return False
+    return False
+
+
+def _save_base64_image(data: str) -> str:
+    """Save base64 image data to a temp file and return the path."""
+    import base64
+    import tempfile
+
+    # Strip data URI prefix if present
+    if data.startswith("data:image/"):
+        # data:image/png;base64,<data>
+        header, b64data = data.split(",", 1)
+        mime = header.split(";")[0].split(":")[1]
+        ext = mime.split("/")[1].replace("jpeg", "jpg")
+    else:
+        b64data = data
+        ext = "png"  # default
+
+    img_bytes = base64.b64decode(b64data)
+
+    tmp = tempfile.NamedTemporaryFile(
+        suffix=f".{ext}", prefix="mcp_img_", delete=False,
+        dir=os.path.join(os.path.expanduser("~"), ".cache", "noapi-google-search-mcp"),
+    )
+    tmp.write(img_bytes)
+    tmp.close()
+    return tmp.name
+
+
+def _is_local_file(path: str) -> bool:
+    """Check if the input looks like a local file path rather than a URL."""
+    if path.startswith(("http://", "https://", "data:")):
+        return False
+    # Absolute or relative path, or ~ home path
+    return path.startswith(("/", "~", "./", "../")) or os.path.exists(path)
+
+
+def _lens_cache_key(image_source: str) -> str:
+    """Identify a Lens input by content: a hash of a local file or base64 image, else the URL."""
+    if _is_base64_image(image_source):
+        return hashlib.sha1(image_source.encode()).hexdigest()
+    if _is_local_file(image_source):
+        digest = hashlib.sha1()
+        try:
+            with open(Path(image_source).expanduser(), "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            return image_source
+        return digest.hexdigest()
+    return image_source
+
+
+_LENS_JS = _page_extractor("lens", r"""
+(() => {
+    const SKIP_HEADINGS = new Set([
+        'Choose what you\'re giving feedback on',
+        'Customised date range',
+        'Search Results',
+        'Filters and topics'
+    ]);
+    const AI_END_MARKERS = ['Visual matches', 'Exact matches', 'Products', 'Related links', 'Footer'];
+    const RATING_RE = /(\d\.\d)\([\d,]+\)/;
+    const PRICE_RE = /(?:US?\$|€|£|CHF|MX\$)\s*[\d,.]+/;
+
+    return ({ maxMatches, maxProducts, rawChars }) => {
+        const data = {
+            error: null,
+            ai_overview: '',
+            visual_matches: [],
+            product_results: []
+        };
+
+        // Error pages are recognisable from the top of the body text
+        const bodyText = document.body.innerText;
+        const head = bodyText.substring(0, 500);
+        const lowerHead = head.toLowerCase();
+        if (head.includes('No image at the URL') || head.includes('Something went wrong')) {
+            data.error = 'unprocessable';
+            return data;
+        }
+        if (lowerHead.includes('unusual traffic') || lowerHead.includes('sorry')) {
+            data.error = 'rate_limited';
+        }
+
+        // AI Overview - Google's description of the image
+        const aiIdx = bodyText.indexOf('AI Overview');
+        if (aiIdx !== -1) {
+            // Get text after "AI Overview" until next section
+            const afterAi = bodyText.substring(aiIdx + 11, aiIdx + 1500);
+            let endIdx = afterAi.length;
+            for (const marker of AI_END_MARKERS) {
+                const idx = afterAi.indexOf(marker);
+                if (idx !== -1 && idx < endIdx) endIdx = idx;
+            }
+            data.ai_overview = afterAi.substring(0, endIdx).trim();
+            // Remove "Dive deeper in AI Mode" suffix
+            const diveIdx = data.ai_overview.indexOf('Dive deeper');
+            if (diveIdx !== -1) {
+                data.ai_overview = data.ai_overview.substring(0, diveIdx).trim();
+            }
+        }
+
+        // Visual matches section - all the heading DIVs are visual match titles
+        for (const h of window.__queryIn('[role="main"]', 'div[role="heading"]')) {
+            if (data.visual_matches.length >= maxMatches) break;
+            const text = h.innerText.trim();
+            if (!text || text.length < 3 || SKIP_HEADINGS.has(text)) continue;
+
+            // Find parent link
+            const parentLink = h.closest('a[href]');
+            if (!parentLink) continue;
+            const url = parentLink.href || '';
+            if (!url || url.includes('google.com/search')) continue;
+
+            // Source is usually the first line of the link text
+            let source = '';
+            const linkLines = parentLink.innerText.trim().split('\n');
+            if (linkLines.length > 1 && linkLines[0] !== text) {
+                source = linkLines[0];
+            }
+
+            // Get rating if present nearby
+            let rating = '';
+            const parent = h.parentElement;
+            if (parent) {
+                const rMatch = parent.innerText.match(RATING_RE);
+                if (rMatch) rating = rMatch[0];
+            }
+
+            data.visual_matches.push({ name: text, url, source, rating });
+        }
+
+        // Product results with prices (h3 elements with links)
+        if (maxProducts > 0) {
+            for (const h3 of window.__queryIn('[role="main"]', 'h3')) {
+                if (data.product_results.length >= maxProducts) break;
+                const text = h3.innerText.trim();
+                if (!text || text.length < 5) continue;
+
+                const container = h3.closest('.g') || h3.parentElement?.parentElement?.parentElement;
+                if (!container) continue;
+
+                const linkEl = container.querySelector('a[href^="http"]');
+                if (!linkEl) continue;
+
+                // Look for price patterns
+                const priceMatch = container.innerText.match(PRICE_RE);
+                const snippetEl = container.querySelector('.VwiC3b, [data-sncf]');
+                data.product_results.push({
+                    name: text,
+                    url: linkEl.href,
+                    price: priceMatch ? priceMatch[0] : '',
+                    snippet: snippetEl ? snippetEl.innerText.trim().substring(0, 300) : ''
+                });
+            }
+        }
+
+        // Fallback: get full page text if nothing else worked
+        if (!data.ai_overview && data.visual_matches.length === 0 && data.product_results.length === 0) {
+            const main = document.querySelector('[role="main"]');
+            data.raw_text = (main ? main.innerText : bodyText).substring(0, rawChars);
+        }
+
+        return data;
+    };
+})()
+""")
+
+# Lens result pages offered in another language carry a link back to English
+_ENGLISH_LINK_JS = _page_extractor("lens_english", """
+() => {
+    const links = [...document.querySelectorAll('a[href]')];
+    const link = links.find(a => a.innerText.includes('Change to English'))
+        || links.find(a => /english/i.test(a.innerText));
+    return link ? link.href : null;
+}
+""")
+
+
+# Lens results have rendered once several headings are on the page, or an
+# error or consent page is showing instead
+_LENS_READY_JS = """
+() => document.querySelectorAll('div[role="heading"]').length > 3
+    || !!document.querySelector("form[action*='consent']")
+    || /No image at the URL|Something went wrong|unusual traffic/.test(
+        document.body ? document.body.innerText.substring(0, 500) : '')
+"""
+
+
+async def _wait_for_lens_results(page, timeout_ms: int = 8000):
+    """Wait for Lens to finish processing the image; never raises."""
+    with _Phase("wait_selector"):
+        try:
+            await page.wait_for_function(_LENS_READY_JS, timeout=timeout_ms, polling=250)
+        except Exception:
+            pass
 
 
-def _save_base64_image(data: str) -> str:
-    """Save base64 image data to a temp file and return the path."""
-    import base64
-    import tempfile
+async def _lens_upload(page, file_path: str) -> bool:
+    """Upload a local image through Google Images' search-by-image panel on ``page``.
 
-    # Strip data URI prefix if present
-    if data.startswith("data:image/"):
-        # data:image/png;base64,<data>
-        header, b64data = data.split(",", 1)
-        mime = header.split(";")[0].split(":")[1]
-        ext = mime.split("/")[1].replace("jpeg", "jpg")
+    Returns False if the page offered no way to upload a file.
+    """
+    await page.goto("https://images.google.com/?hl=en", wait_until="domcontentloaded", timeout=30000)
+    await _dismiss_consent(page)
+
+    # Click the camera/lens icon to open image search
+    lens_sel = "[aria-label='Search by image'], .Gdd5U, .nDcEnd, .tdAaF"
+    try:
+        await page.wait_for_selector(lens_sel, state="attached", timeout=3000)
+    except Exception:
+        pass
+    lens_btn = page.locator(lens_sel)
+    if await lens_btn.count() > 0:
+        await lens_btn.first.click()
+        try:
+            await page.wait_for_selector("input[type='file']", state="attached", timeout=3000)
+        except Exception:
+            pass
+
+    # Upload the file - Playwright file chooser approach
+    file_input = page.locator("input[type='file']")
+    if await file_input.count() > 0:
+        await file_input.first.set_input_files(file_path)
     else:
-        b64data = data
-        ext = "png"  # default
+        # Fallback: try drag area upload button
+        upload_btn = page.locator("a:has-text('upload a file'), span:has-text('upload a file'), div:has-text('upload a file')")
+        if await upload_btn.count() == 0:
+            return False
+        async with page.expect_file_chooser() as fc_info:
+            await upload_btn.first.click()
+        file_chooser = await fc_info.value
+        await file_chooser.set_files(file_path)
 
-    img_bytes = base64.b64decode(b64data)
+    # Wait for Lens results to load
+    await page.wait_for_load_state("domcontentloaded", timeout=30000)
+    await _wait_for_lens_results(page)
+    await _dismiss_consent(page)
+    return True
 
-    tmp = tempfile.NamedTemporaryFile(
-        suffix=f".{ext}", prefix="mcp_img_", delete=False,
-        dir=os.path.join(os.path.expanduser("~"), ".cache", "noapi-google-search-mcp"),
-    )
-    tmp.write(img_bytes)
-    tmp.close()
-    return tmp.name
 
+async def _lens_switch_to_english(page) -> bool:
+    """Reload the Lens results in English if they came up in another language.
 
-def _is_local_file(path: str) -> bool:
-    """Check if the input looks like a local file path rather than a URL."""
-    if path.startswith(("http://", "https://", "data:")):
-        return False
-    # Absolute or relative path, or ~ home path
-    return path.startswith(("/", "~", "./", "../")) or os.path.exists(path)
+    One evaluate finds the link; navigating to its href waits properly for the
+    new document, unlike a click fired from page script.  Returns True if the
+    page was reloaded.
+    """
+    try:
+        href = await page.evaluate(_ENGLISH_LINK_JS)
+        if href:
+            await page.goto(href, wait_until="domcontentloaded", timeout=10000)
+            await _dismiss_consent(page)
+            return True
+    except Exception:
+        pass
+    return False
 
 
+@_cached(_lens_cache, key_of=_lens_cache_key)
+@_timed
 async def _do_google_lens(image_source: str) -> str:
     """Reverse image search using Google Lens. Supports URLs, local files, and base64."""
     # Handle base64 input (from drag-and-drop in LM Studio)
@@ -2869,190 +4386,33 @@ async def _do_google_lens(image_source: str) -> str:
         if not os.path.isfile(file_path):
             return f"File not found: {image_source}\nPlease provide a valid file path or a public image URL."
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
-
+    async with _context_pool.acquire(block_resources=False) as (context, page):
         try:
             if is_local:
                 # Local file: go to Google Images and upload via file chooser
-                await page.goto("https://images.google.com/?hl=en", wait_until="domcontentloaded", timeout=30000)
-                await _dismiss_consent(page)
-                await page.wait_for_timeout(1000)
-
-                # Click the camera/lens icon to open image search
-                lens_btn = page.locator("[aria-label='Search by image'], .Gdd5U, .nDcEnd, .tdAaF")
-                if await lens_btn.count() > 0:
-                    await lens_btn.first.click()
-                    await page.wait_for_timeout(1500)
-
-                # Upload the file - Playwright file chooser approach
-                file_input = page.locator("input[type='file']")
-                if await file_input.count() > 0:
-                    await file_input.first.set_input_files(file_path)
-                else:
-                    # Fallback: try drag area upload button
-                    upload_btn = page.locator("a:has-text('upload a file'), span:has-text('upload a file'), div:has-text('upload a file')")
-                    if await upload_btn.count() > 0:
-                        async with page.expect_file_chooser() as fc_info:
-                            await upload_btn.first.click()
-                        file_chooser = await fc_info.value
-                        await file_chooser.set_files(file_path)
-                    else:
-                        return "Could not find the upload button on Google Images. Try providing a public image URL instead."
-
-                # Wait for Lens results to load
-                await page.wait_for_load_state("domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(5000)
-                await _dismiss_consent(page)
+                if not await _lens_upload(page, file_path):
+                    return "Could not find the upload button on Google Images. Try providing a public image URL instead."
 
             else:
                 # URL-based: use uploadbyurl
                 encoded_url = quote_plus(image_source)
                 url = f"https://lens.google.com/uploadbyurl?url={encoded_url}&hl=en"
-                await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+                with _Phase("goto"):
+                    await page.goto(url, wait_until="commit", timeout=45000)
+                # Lens takes time to process the image; a consent form ends the wait too
+                await _wait_for_lens_results(page)
                 await _dismiss_consent(page)
-                await page.wait_for_timeout(2000)
-
-            # Click "Change to English" if present
-            try:
-                eng_link = page.locator("a:has-text('Change to English'), a:has-text('English')")
-                if await eng_link.count() > 0:
-                    await eng_link.first.click()
-                    await page.wait_for_load_state("domcontentloaded", timeout=10000)
-                    await _dismiss_consent(page)
-            except Exception:
-                pass
+                await _wait_for_lens_results(page)
 
-            # Lens takes time to process the image
-            await page.wait_for_timeout(4000)
+            if await _lens_switch_to_english(page):
+                await _wait_for_lens_results(page)
 
-            # Check for error
-            page_text = await page.evaluate("() => document.body.innerText.substring(0, 500)")
-            if "No image at the URL" in page_text or "Something went wrong" in page_text:
+            data = await page.evaluate(_LENS_JS, {"maxMatches": 10, "maxProducts": 8, "rawChars": 5000})
+            if data.get("error") == "unprocessable":
                 if is_local:
                     return f"Google Lens could not process the image: {image_source}\nThe file may be corrupted or in an unsupported format."
                 return f"Google Lens could not access the image at: {image_source}\nThe image URL must be publicly accessible. Try a direct image link (ending in .jpg, .png, etc.)."
 
-            data = await page.evaluate(
-                r"""
-                () => {
-                    const data = {
-                        ai_overview: '',
-                        visual_matches: [],
-                        product_results: [],
-                        exact_matches: []
-                    };
-
-                    // AI Overview - Google's description of the image
-                    const bodyText = document.body.innerText;
-                    const aiIdx = bodyText.indexOf('AI Overview');
-                    if (aiIdx !== -1) {
-                        // Get text after "AI Overview" until next section
-                        const afterAi = bodyText.substring(aiIdx + 11, aiIdx + 1500);
-                        const endMarkers = ['Visual matches', 'Exact matches', 'Products', 'Related links', 'Footer'];
-                        let endIdx = afterAi.length;
-                        for (const marker of endMarkers) {
-                            const idx = afterAi.indexOf(marker);
-                            if (idx !== -1 && idx < endIdx) endIdx = idx;
-                        }
-                        data.ai_overview = afterAi.substring(0, endIdx).trim();
-                        // Clean up
-                        if (data.ai_overview.startsWith('\n')) {
-                            data.ai_overview = data.ai_overview.substring(1).trim();
-                        }
-                        // Remove "Dive deeper in AI Mode" suffix
-                        const diveIdx = data.ai_overview.indexOf('Dive deeper');
-                        if (diveIdx !== -1) {
-                            data.ai_overview = data.ai_overview.substring(0, diveIdx).trim();
-                        }
-                    }
-
-                    // Visual matches section - all the heading DIVs are visual match titles
-                    const allHeadings = document.querySelectorAll('div[role="heading"]');
-                    const skipTexts = new Set([
-                        'Choose what you\'re giving feedback on',
-                        'Customised date range',
-                        'Search Results',
-                        'Filters and topics'
-                    ]);
-                    for (const h of allHeadings) {
-                        if (data.visual_matches.length >= 10) break;
-                        const text = h.innerText.trim();
-                        if (!text || text.length < 3 || skipTexts.has(text)) continue;
-
-                        // Find parent link
-                        const parentLink = h.closest('a[href]');
-                        let url = '';
-                        let source = '';
-                        if (parentLink) {
-                            url = parentLink.href || '';
-                            // Source is usually the first line of the link text
-                            const linkLines = parentLink.innerText.trim().split('\n');
-                            if (linkLines.length > 1 && linkLines[0] !== text) {
-                                source = linkLines[0];
-                            }
-                        }
-
-                        // Get rating if present nearby
-                        const parent = h.parentElement;
-                        let rating = '';
-                        if (parent) {
-                            const rText = parent.innerText;
-                            const rMatch = rText.match(/(\d\.\d)\([\d,]+\)/);
-                            if (rMatch) rating = rMatch[0];
-                        }
-
-                        if (url && !url.includes('google.com/search')) {
-                            data.visual_matches.push({
-                                name: text,
-                                url: url,
-                                source: source,
-                                rating: rating
-                            });
-                        }
-                    }
-
-                    // Product results with prices (h3 elements with links)
-                    const h3s = document.querySelectorAll('h3');
-                    for (const h3 of h3s) {
-                        if (data.product_results.length >= 8) break;
-                        const text = h3.innerText.trim();
-                        if (!text || text.length < 5) continue;
-
-                        const container = h3.closest('.g') || h3.parentElement?.parentElement?.parentElement;
-                        if (!container) continue;
-
-                        const linkEl = container.querySelector('a[href^="http"]');
-                        const containerText = container.innerText;
-
-                        // Look for price patterns
-                        const priceMatch = containerText.match(/(?:US?\$|€|£|CHF|MX\$)\s*[\d,.]+/);
-                        const snippetEl = container.querySelector('.VwiC3b, [data-sncf]');
-
-                        if (linkEl) {
-                            data.product_results.push({
-                                name: text,
-                                url: linkEl.href,
-                                price: priceMatch ? priceMatch[0] : '',
-                                snippet: snippetEl ? snippetEl.innerText.trim().substring(0, 300) : ''
-                            });
-                        }
-                    }
-
-                    // Fallback: get full page text if nothing else worked
-                    if (!data.ai_overview && data.visual_matches.length === 0 && data.product_results.length === 0) {
-                        const main = document.querySelector('[role="main"], body');
-                        if (main) {
-                            data.raw_text = main.innerText.substring(0, 5000);
-                        }
-                    }
-
-                    return data;
-                }
-                """
-            )
-
             lines = [f"Google Lens Results for image: {image_source}\n"]
             has_data = False
 
@@ -3086,12 +4446,15 @@ async def _do_google_lens(image_source: str) -> str:
                 has_data = True
 
             if not has_data and data.get("raw_text"):
-                raw = re.sub(r'\n{3,}', '\n\n', data["raw_text"]).strip()
+                raw = _MULTI_NL_RE.sub('\n\n', data["raw_text"]).strip()
                 lines.append(raw)
                 has_data = True
 
             if not has_data:
-                lines.append("Could not identify the image. Try with a clearer image or a direct product photo.")
+                return (
+                    f"Could not identify the image: {image_source}\n"
+                    "Try with a clearer image or a direct product photo."
+                )
 
             return "\n".join(lines)
 
@@ -3099,7 +4462,6 @@ async def _do_google_lens(image_source: str) -> str:
             return f"Google Lens search failed: {e}"
 
         finally:
-            await browser.close()
             # Clean up base64 temp file
             if tmp_base64_path:
                 try:
@@ -3132,6 +4494,8 @@ async def google_lens(image_source: str) -> str:
 # ---------------------------------------------------------------------------
 
 MAX_OBJECTS = 4
+# Detection only needs coarse boxes, so it runs on a copy no larger than this
+DETECT_MAX_DIM = 800
 
 
 def _detect_objects(image_path: str, min_area_ratio: float = 0.02) -> list[dict]:
@@ -3145,16 +4509,19 @@ def _detect_objects(image_path: str, min_area_ratio: float = 0.02) -> list[dict]
     except ImportError:
         return []
 
-    img = cv2.imread(image_path)
+    # Edges only need luminance, so decode straight to one channel
+    img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
     if img is None:
         return []
 
     h, w = img.shape[:2]
-    total_area = h * w
+    # Edge detection cost grows with pixel count; boxes are scaled back below
+    scale = min(1.0, DETECT_MAX_DIM / max(h, w))
+    gray = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else img
+    total_area = gray.shape[0] * gray.shape[1]
     min_area = total_area * min_area_ratio
 
-    # Convert to grayscale and apply edge detection
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    # Apply edge detection
     blurred = cv2.GaussianBlur(gray, (7, 7), 0)
     edges = cv2.Canny(blurred, 30, 100)
 
@@ -3165,45 +4532,54 @@ def _detect_objects(image_path: str, min_area_ratio: float = 0.02) -> list[dict]
     # Find contours
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-    # Get bounding boxes for significant contours
-    boxes = []
-    for cnt in contours:
-        x, y, bw, bh = cv2.boundingRect(cnt)
-        area = bw * bh
-        if area >= min_area and area < total_area * 0.95:
-            boxes.append((x, y, bw, bh, area))
-
-    if not boxes:
+    # Get bounding boxes for significant contours, as (x0, y0, x1, y1) corner columns
+    rects = np.array([cv2.boundingRect(cnt) for cnt in contours], dtype=np.int64).reshape(-1, 4)
+    areas = rects[:, 2] * rects[:, 3]
+    keep = (areas >= min_area) & (areas < total_area * 0.95)
+    if not keep.any():
         return []
 
     # Sort by area descending
-    boxes.sort(key=lambda b: b[4], reverse=True)
-
-    # Merge overlapping boxes
+    order = np.argsort(-areas[keep], kind="stable")
+    rects, areas = rects[keep][order], areas[keep][order]
+    bx0, by0 = rects[:, 0], rects[:, 1]
+    bx1, by1 = bx0 + rects[:, 2], by0 + rects[:, 3]
+
+    # Merge overlapping boxes: each seed, largest first, absorbs the later
+    # boxes that overlap it by more than 30% of the smaller area, growing as it
+    # goes.  Every scan over the remaining boxes is one vectorised test.
+    n = len(areas)
     merged = []
-    used = set()
-    for i, (x1, y1, w1, h1, a1) in enumerate(boxes):
-        if i in used:
+    used = np.zeros(n, dtype=bool)
+    for i in range(n):
+        if used[i]:
             continue
-        mx, my, mw, mh = x1, y1, w1, h1
-        for j, (x2, y2, w2, h2, a2) in enumerate(boxes):
-            if j <= i or j in used:
-                continue
-            # Check overlap
-            ox = max(0, min(mx + mw, x2 + w2) - max(mx, x2))
-            oy = max(0, min(my + mh, y2 + h2) - max(my, y2))
-            overlap = ox * oy
-            smaller_area = min(mw * mh, w2 * h2)
-            if smaller_area > 0 and overlap / smaller_area > 0.3:
-                # Merge
-                nx = min(mx, x2)
-                ny = min(my, y2)
-                mw = max(mx + mw, x2 + w2) - nx
-                mh = max(my + mh, y2 + h2) - ny
-                mx, my = nx, ny
-                used.add(j)
-        merged.append((mx, my, mw, mh))
-        used.add(i)
+        used[i] = True
+        mx0, my0, mx1, my1 = bx0[i], by0[i], bx1[i], by1[i]
+        start = i + 1
+        while start < n:
+            cand = np.flatnonzero(~used[start:]) + start
+            if not cand.size:
+                break
+            ox = np.clip(np.minimum(mx1, bx1[cand]) - np.maximum(mx0, bx0[cand]), 0, None)
+            oy = np.clip(np.minimum(my1, by1[cand]) - np.maximum(my0, by0[cand]), 0, None)
+            smaller = np.minimum((mx1 - mx0) * (my1 - my0), areas[cand])
+            hits = np.flatnonzero((smaller > 0) & (ox * oy > 0.3 * smaller))
+            if not hits.size:
+                break
+            # Merge the first overlapping box, then rescan the ones after it
+            k = cand[hits[0]]
+            mx0, my0 = min(mx0, bx0[k]), min(my0, by0[k])
+            mx1, my1 = max(mx1, bx1[k]), max(my1, by1[k])
+            used[k] = True
+            start = k + 1
+        merged.append((
+            int(mx0 / scale), int(my0 / scale),
+            min(w, round(mx1 / scale)) - int(mx0 / scale), min(h, round(my1 / scale)) - int(my0 / scale),
+        ))
+        # Later seeds never change earlier merged boxes
+        if len(merged) >= MAX_OBJECTS:
+            break
 
     # Add padding (10%) and generate position labels
     results = []
@@ -3232,96 +4608,18 @@ async def _lens_upload_in_session(page, file_path: str) -> str:
 
     Navigates to images.google.com, uploads, and extracts results.
     """
-    await page.goto("https://images.google.com/?hl=en", wait_until="domcontentloaded", timeout=30000)
-    await _dismiss_consent(page)
-    await page.wait_for_timeout(1000)
-
-    # Click the camera/lens icon
-    lens_btn = page.locator("[aria-label='Search by image'], .Gdd5U, .nDcEnd, .tdAaF")
-    if await lens_btn.count() > 0:
-        await lens_btn.first.click()
-        await page.wait_for_timeout(1500)
-
-    # Upload the file
-    file_input = page.locator("input[type='file']")
-    if await file_input.count() == 0:
+    if not await _lens_upload(page, file_path):
         return "Could not find upload input"
-    await file_input.first.set_input_files(file_path)
-
-    # Wait for results
-    await page.wait_for_load_state("domcontentloaded", timeout=30000)
-    await page.wait_for_timeout(5000)
-    await _dismiss_consent(page)
-
-    # Click "Change to English" if needed
-    try:
-        eng_link = page.locator("a:has-text('Change to English'), a:has-text('English')")
-        if await eng_link.count() > 0:
-            await eng_link.first.click()
-            await page.wait_for_load_state("domcontentloaded", timeout=10000)
-            await _dismiss_consent(page)
-    except Exception:
-        pass
+    if await _lens_switch_to_english(page):
+        await _wait_for_lens_results(page)
 
-    await page.wait_for_timeout(3000)
-
-    # Check for errors
-    page_text = await page.evaluate("() => document.body.innerText.substring(0, 500)")
-    if "unusual traffic" in page_text.lower() or "sorry" in page_text.lower():
+    # Extract results (same scraper as _do_google_lens, with smaller limits)
+    data = await page.evaluate(_LENS_JS, {"maxMatches": 5, "maxProducts": 0, "rawChars": 3000})
+    if data.get("error") == "rate_limited":
         return "Rate limited by Google. Try again later."
-    if "No image at the URL" in page_text or "Something went wrong" in page_text:
+    if data.get("error") == "unprocessable":
         return "Google Lens could not process this image crop."
 
-    # Extract results (same scraper as _do_google_lens)
-    data = await page.evaluate(
-        r"""
-        () => {
-            const data = { ai_overview: '', visual_matches: [], product_results: [] };
-
-            const bodyText = document.body.innerText;
-            const aiIdx = bodyText.indexOf('AI Overview');
-            if (aiIdx !== -1) {
-                const afterAi = bodyText.substring(aiIdx + 11, aiIdx + 1500);
-                const endMarkers = ['Visual matches', 'Exact matches', 'Products', 'Related links', 'Footer'];
-                let endIdx = afterAi.length;
-                for (const marker of endMarkers) {
-                    const idx = afterAi.indexOf(marker);
-                    if (idx !== -1 && idx < endIdx) endIdx = idx;
-                }
-                data.ai_overview = afterAi.substring(0, endIdx).trim();
-                if (data.ai_overview.startsWith('\n')) data.ai_overview = data.ai_overview.substring(1).trim();
-                const diveIdx = data.ai_overview.indexOf('Dive deeper');
-                if (diveIdx !== -1) data.ai_overview = data.ai_overview.substring(0, diveIdx).trim();
-            }
-
-            const allHeadings = document.querySelectorAll('div[role="heading"]');
-            const skipTexts = new Set(['Choose what you\'re giving feedback on', 'Customised date range', 'Search Results', 'Filters and topics']);
-            for (const h of allHeadings) {
-                if (data.visual_matches.length >= 5) break;
-                const text = h.innerText.trim();
-                if (!text || text.length < 3 || skipTexts.has(text)) continue;
-                const parentLink = h.closest('a[href]');
-                let url = '', source = '';
-                if (parentLink) {
-                    url = parentLink.href || '';
-                    const linkLines = parentLink.innerText.trim().split('\n');
-                    if (linkLines.length > 1 && linkLines[0] !== text) source = linkLines[0];
-                }
-                if (url && !url.includes('google.com/search')) {
-                    data.visual_matches.push({ name: text, url: url, source: source });
-                }
-            }
-
-            if (!data.ai_overview && data.visual_matches.length === 0) {
-                const main = document.querySelector('[role="main"], body');
-                if (main) data.raw_text = main.innerText.substring(0, 3000);
-            }
-
-            return data;
-        }
-        """
-    )
-
     lines = []
     if data.get("ai_overview"):
         lines.append(f"Identification: {data['ai_overview']}")
@@ -3335,7 +4633,7 @@ async def _lens_upload_in_session(page, file_path: str) -> str:
             if m.get("url"):
                 lines.append(f"     {m['url']}")
     if not lines and data.get("raw_text"):
-        raw = re.sub(r'\n{3,}', '\n\n', data["raw_text"]).strip()[:1000]
+        raw = _MULTI_NL_RE.sub('\n\n', data["raw_text"]).strip()[:1000]
         lines.append(raw)
     if not lines:
         lines.append("Could not identify this object.")
@@ -3343,6 +4641,7 @@ async def _lens_upload_in_session(page, file_path: str) -> str:
     return "\n".join(lines)
 
 
+@_timed
 async def _do_google_lens_detect(image_path: str) -> str:
     """Detect objects in an image and identify each via Google Lens."""
     try:
@@ -3376,30 +4675,24 @@ async def _do_google_lens_detect(image_path: str) -> str:
             # Fallback: no objects detected, just pass original
             return await _do_google_lens(file_path)
 
-        # Run Lens on original + each crop in a single browser session
-        async with async_playwright() as pw:
-            browser, context = await _launch_browser(pw)
-            page = await context.new_page()
-
-            results = []
-
-            try:
-                # First: original full image
-                og_result = await _lens_upload_in_session(page, file_path)
-                results.append(("Full image (original)", og_result))
-                await page.wait_for_timeout(3000)
-
-                # Then: each detected object crop
-                for crop_path, label in crop_files:
-                    crop_result = await _lens_upload_in_session(page, crop_path)
-                    results.append((f"Object ({label})", crop_result))
-                    await page.wait_for_timeout(3000)
+        # Run Lens on the original and every crop at once, each on its own pooled
+        # page.  The pool bounds how many run together, and the per-host throttle
+        # spaces their page loads in place of the old fixed pauses between uploads
+        uploads = [(file_path, "Full image (original)")] + [
+            (crop_path, f"Object ({label})") for crop_path, label in crop_files
+        ]
 
-            except Exception as e:
-                results.append(("Error", str(e)))
+        async def identify(path):
+            async with _context_pool.acquire(block_resources=False) as (context, page):
+                return await _lens_upload_in_session(page, path)
 
-            finally:
-                await browser.close()
+        outcomes = await asyncio.gather(
+            *(identify(path) for path, _ in uploads), return_exceptions=True
+        )
+        results = [
+            (label, f"Error: {outcome}" if isinstance(outcome, Exception) else outcome)
+            for (_, label), outcome in zip(uploads, outcomes)
+        ]
 
         # Format output
         lines = [
@@ -3618,9 +4911,8 @@ TRANSCRIPT_CACHE_DIR = os.path.join(TRANSCRIBE_CACHE_DIR, "transcripts")
 
 def _format_timestamp(seconds: float) -> str:
     """Format seconds into H:MM:SS or M:SS."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
     if h > 0:
         return f"{h}:{m:02d}:{s:02d}"
     return f"{m}:{s:02d}"
@@ -3677,11 +4969,32 @@ def _download_audio(url: str, cache_dir: str) -> dict:
     }
 
 
+# Loaded Whisper models by size; loading re-reads 75MB-3GB of weights
+_whisper_models: dict = {}
+_whisper_lock = threading.Lock()
+
+
+def _whisper_model(model_size: str):
+    """Return the Whisper model for model_size, loading it once (thread-safe)."""
+    model = _whisper_models.get(model_size)
+    if model is not None:
+        return model
+    with _whisper_lock:
+        model = _whisper_models.get(model_size)
+        if model is None:
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                model_size, device="cpu", compute_type="int8",
+                cpu_threads=os.cpu_count() or 0, num_workers=1,
+            )
+            _whisper_models[model_size] = model
+    return model
+
+
 def _transcribe_audio(audio_path: str, model_size: str, language: str) -> dict:
     """Transcribe audio file (runs in thread). Returns segments + info."""
-    from faster_whisper import WhisperModel
-
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
+    model = _whisper_model(model_size)
 
     transcribe_opts = {"beam_size": 5}
     if language:
@@ -4034,6 +5347,90 @@ def _download_video(url: str) -> dict:
     return {"title": info.get("title", "clip"), "video_path": cached}
 
 
+def _download_video_range(url: str, clip_start: float, clip_end: float) -> dict:
+    """Download only [clip_start, clip_end] of a video (runs in thread).
+
+    yt-dlp fetches just the needed byte ranges and cuts them with ffmpeg, so
+    a short clip from a long video doesn't pull the whole file. The result is
+    not cached; it is the finished clip.
+    """
+    import yt_dlp
+    from yt_dlp.utils import download_range_func
+
+    os.makedirs(VIDEO_CACHE_DIR, exist_ok=True)
+    key = hashlib.md5(f"{url}|{clip_start}|{clip_end}".encode()).hexdigest()
+    part_path = os.path.join(VIDEO_CACHE_DIR, f"{key}.part.mp4")
+
+    ydl_opts = {
+        "format": "best[ext=mp4][height<=480]/best[ext=mp4]/best",
+        "outtmpl": part_path,
+        "quiet": True,
+        "no_warnings": True,
+        "download_ranges": download_range_func(None, [(clip_start, clip_end)]),
+        "force_keyframes_at_cuts": True,
+    }
+
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+        if not os.path.isfile(part_path) or not os.path.getsize(part_path):
+            raise FileNotFoundError("Failed to download clip.")
+    except BaseException:
+        # Don't leave a half-written clip (or yt-dlp's own .part/.ytdl files) behind
+        for leftover in (part_path, part_path + ".part", part_path + ".ytdl"):
+            try:
+                os.remove(leftover)
+            except OSError:
+                pass
+        raise
+
+    duration = info.get("duration") or 0
+    if duration and clip_end > duration:
+        clip_end = duration
+
+    return {
+        "title": info.get("title", "clip"),
+        "clip_path": part_path,
+        "clip_end": clip_end,
+    }
+
+
+def _extract_clip_copy(
+    video_path: str, out_path: str,
+    clip_start: float, clip_end: float,
+) -> dict | None:
+    """Extract clip by ffmpeg stream copy (runs in thread).
+
+    No decode or encode: packets are remuxed from the keyframe at or before
+    clip_start, so the clip may begin slightly early. Returns None when
+    ffmpeg is missing or the streams can't be copied into mp4.
+    """
+    import av
+
+    with av.open(video_path) as inp:
+        total_duration = float(inp.duration / av.time_base) if inp.duration else 0
+    if total_duration and clip_end > total_duration:
+        clip_end = total_duration
+
+    try:
+        proc = subprocess.run(
+            ["ffmpeg", "-y", "-v", "error",
+             "-ss", str(clip_start), "-i", video_path,
+             "-t", str(clip_end - clip_start),
+             "-c", "copy", "-avoid_negative_ts", "make_zero", out_path],
+            capture_output=True, timeout=600,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0 or not os.path.isfile(out_path) or not os.path.getsize(out_path):
+        return None
+
+    return {
+        "size": os.path.getsize(out_path),
+        "clip_end": clip_end,
+    }
+
+
 def _extract_clip_pyav(
     video_path: str, out_path: str,
     clip_start: float, clip_end: float,
@@ -4104,6 +5501,15 @@ def _extract_clip_pyav(
     }
 
 
+def _extract_clip(
+    video_path: str, out_path: str,
+    clip_start: float, clip_end: float,
+) -> dict:
+    """Stream-copy the clip, re-encoding with PyAV only if the copy fails."""
+    return (_extract_clip_copy(video_path, out_path, clip_start, clip_end)
+            or _extract_clip_pyav(video_path, out_path, clip_start, clip_end))
+
+
 @mcp.tool()
 async def extract_video_clip(
     url: str,
@@ -4147,6 +5553,7 @@ async def extract_video_clip(
     clip_end = end_seconds + buffer_seconds
 
     video_path = None
+    range_info = None
     title = "clip"
 
     if os.path.isfile(url):
@@ -4161,16 +5568,29 @@ async def extract_video_clip(
         if ctx:
             await ctx.report_progress(progress=0, total=100, message="Downloading video...")
 
-        try:
-            dl_info = await asyncio.to_thread(_download_video, url)
-            title = dl_info["title"]
-            video_path = dl_info["video_path"]
-        except Exception as e:
-            return f"Failed to download video: {e}"
+        # Without a cached full copy, fetch just the requested range
+        cached = _video_cache_path(url)
+        if not (os.path.isfile(cached) and os.path.getsize(cached) > 0):
+            try:
+                range_info = await asyncio.to_thread(
+                    _download_video_range, url, clip_start, clip_end
+                )
+                title = range_info["title"]
+            except Exception as e:
+                print(f"Range download of {url} failed, downloading the full video: {e}", file=sys.stderr)
+                range_info = None
+
+        if range_info is None:
+            try:
+                dl_info = await asyncio.to_thread(_download_video, url)
+                title = dl_info["title"]
+                video_path = dl_info["video_path"]
+            except Exception as e:
+                return f"Failed to download video: {e}"
 
-    safe_title = re.sub(r'[^\w\s-]', '', title)[:50].strip().replace(' ', '_')
+    safe_title = _UNSAFE_FILENAME_RE.sub('', title)[:50].strip().replace(' ', '_')
     if output_filename:
-        safe_title = re.sub(r'[^\w\s-]', '', output_filename)[:50].strip().replace(' ', '_')
+        safe_title = _UNSAFE_FILENAME_RE.sub('', output_filename)[:50].strip().replace(' ', '_')
 
     start_str = _format_timestamp(clip_start).replace(':', '-')
     end_str = _format_timestamp(clip_end).replace(':', '-')
@@ -4181,9 +5601,17 @@ async def extract_video_clip(
         await ctx.report_progress(progress=40, total=100, message="Extracting clip...")
 
     try:
-        clip_info = await asyncio.to_thread(
-            _extract_clip_pyav, video_path, out_path, clip_start, clip_end
-        )
+        if range_info:
+            import shutil
+            shutil.move(range_info["clip_path"], out_path)
+            clip_info = {
+                "size": os.path.getsize(out_path),
+                "clip_end": range_info["clip_end"],
+            }
+        else:
+            clip_info = await asyncio.to_thread(
+                _extract_clip, video_path, out_path, clip_start, clip_end
+            )
 
         clip_end = clip_info["clip_end"]
         clip_size = clip_info["size"]
@@ -4210,52 +5638,145 @@ async def extract_video_clip(
 # ---------------------------------------------------------------------------
 
 MAX_PAGE_CHARS = 8000
+MAX_BATCH_URLS = 10
+
+# Same boilerplate the browser extractor strips, expressed for selectolax
+_STRIP_TAGS = ["script", "style", "nav", "footer", "header", "iframe", "noscript", "svg"]
+_STRIP_SELECTOR = (
+    '[role="navigation"], [role="banner"], [role="complementary"], '
+    ".sidebar, .ad, .ads, .advertisement"
+)
+_CONTENT_SELECTOR = (
+    'article, main, [role="main"], .post-content, .article-body, '
+    ".entry-content, .content, #content"
+)
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6", "hr",
+    "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+})
+
+# Pages with less readable text than this are probably rendered client-side
+_MIN_STATIC_CHARS = 200
+
+# Only the first MAX_PAGE_CHARS of text are returned, so bodies are read no further
+# than this; anything past it is dropped instead of buffered
+MAX_STATIC_BYTES = 2 * 1024 * 1024
+
+
+def _html_to_text(html: str) -> str:
+    """Extract readable text from HTML, approximating innerText line breaks."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_STRIP_TAGS)
+    for node in tree.css(_STRIP_SELECTOR):
+        node.decompose()
+    source = tree.css_first(_CONTENT_SELECTOR) or tree.body
+    if source is None:
+        return ""
+
+    parts = []
+    for node in source.traverse(include_text=True):
+        if node.tag == "-text":
+            parts.append(_WHITESPACE_RE.sub(" ", node.text_content))
+        elif node.tag in _BLOCK_TAGS:
+            parts.append("\n")
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _looks_static(html: str) -> bool:
+    """Heuristic: enough markup to be a real page and not mostly inline script."""
+    if len(html) < 2048:
+        return False
+    script_chars = sum(len(m) for m in _SCRIPT_BLOCK_RE.findall(html))
+    return script_chars < 0.3 * len(html)
+
+
+# Non-HTML text is returned as-is; anything else (PDFs, archives, media) is refused
+# instead of being downloaded into the browser
+_TEXT_CONTENT_TYPES = ("text/", "application/json", "application/xml", "+json", "+xml")
 
 
+class _UnsupportedContent(Exception):
+    """Raised when a URL serves something visit_page cannot read as text."""
+
+
+async def _fetch_static_text(url: str) -> str | None:
+    """Fetch a page over plain HTTP; return its text, or None if it needs a browser.
+
+    The content type is checked before the body is read, so binary downloads
+    raise _UnsupportedContent without transferring the payload.  Bodies are
+    truncated at MAX_STATIC_BYTES.
+    """
+    try:
+        async with _http.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                return None
+            content_type = resp.headers.get("content-type", "").split(";")[0].strip().lower()
+            if not content_type:
+                return None
+            is_html = "html" in content_type
+            if not is_html and not any(t in content_type for t in _TEXT_CONTENT_TYPES):
+                raise _UnsupportedContent(content_type)
+            body = bytearray()
+            async for chunk in resp.aiter_bytes():
+                body += chunk
+                if len(body) >= MAX_STATIC_BYTES:
+                    del body[MAX_STATIC_BYTES:]
+                    break
+            body = body.decode(resp.charset_encoding or "utf-8", errors="replace")
+            if not is_html:
+                return body.strip() or None
+            html = body
+    except (httpx.HTTPError, LookupError):
+        return None
+    if not _looks_static(html):
+        return None
+    text = await asyncio.to_thread(_html_to_text, html)
+    if len(text) < _MIN_STATIC_CHARS:
+        return None
+    return text
+
+
+@_cached(_page_cache)
 async def _fetch_page_text(url: str) -> str:
-    """Fetch a URL with headless Chromium and extract readable text."""
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    """Fetch a URL and extract readable text, rendering it in Chromium only when needed."""
+    try:
+        text = await _fetch_static_text(url)
+    except _UnsupportedContent as e:
+        return (
+            f"Unsupported content type '{e}' at {url}. visit_page reads web pages and text; "
+            "download other files and use read_document instead."
+        )
+    if text is not None:
+        if len(text) > MAX_PAGE_CHARS:
+            text = text[:MAX_PAGE_CHARS] + f"\n\n... [truncated, showing first {MAX_PAGE_CHARS} characters]"
+        return f"Content from: {url}\n\n{text}"
 
+    async with _context_pool.acquire() as (context, page):
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)
-
-            text = await page.evaluate("""
-                () => {
-                    const remove = document.querySelectorAll(
-                        'script, style, nav, footer, header, iframe, noscript, '
-                        + 'svg, [role="navigation"], [role="banner"], '
-                        + '[role="complementary"], .sidebar, .ad, .ads, .advertisement'
-                    );
-                    remove.forEach(el => el.remove());
-
-                    const article = document.querySelector(
-                        'article, main, [role="main"], .post-content, .article-body, '
-                        + '.entry-content, .content, #content'
-                    );
-                    const source = article || document.body;
-                    return source ? source.innerText : '';
-                }
-            """)
+            await page.goto(url, wait_until="commit", timeout=30000)
+            # Give JS-rendered pages a moment to settle, but don't wait on long-polling sites
+            try:
+                await page.wait_for_load_state("networkidle", timeout=3000)
+            except PlaywrightTimeoutError:
+                # Slow servers may not have delivered the DOM yet
+                await page.wait_for_load_state("domcontentloaded", timeout=30000)
 
-            text = re.sub(r'\n{3,}', '\n\n', text).strip()
+            extracted = await page.evaluate("(n) => window.__extractPage(n)", MAX_PAGE_CHARS)
+            text = extracted["text"]
 
             if not text:
                 return f"Could not extract text content from: {url}"
 
-            if len(text) > MAX_PAGE_CHARS:
-                text = text[:MAX_PAGE_CHARS] + f"\n\n... [truncated, showing first {MAX_PAGE_CHARS} characters]"
+            if extracted["truncated"]:
+                text += f"\n\n... [truncated, showing first {MAX_PAGE_CHARS} characters]"
 
             return f"Content from: {url}\n\n{text}"
 
         except Exception as e:
             return f"Failed to fetch {url}: {e}"
 
-        finally:
-            await browser.close()
-
 
 @mcp.tool()
 async def visit_page(url: str) -> str:
@@ -4273,6 +5794,30 @@ async def visit_page(url: str) -> str:
     return await _fetch_page_text(url)
 
 
+@mcp.tool()
+async def visit_pages(urls: list[str]) -> str:
+    """Fetch several web pages at once and return the text content of each. Use this instead of calling visit_page repeatedly, e.g. to read the top results of a google_search.
+
+    Sample prompts that trigger this tool:
+        - "Read the first three search results and compare them"
+        - "Summarize these articles: https://..., https://..."
+        - "What do these pages say about pricing?"
+
+    Args:
+        urls: List of full URLs to visit (max 10). Pages are fetched in parallel.
+    """
+    urls = [u for u in urls if u][:MAX_BATCH_URLS]
+    if not urls:
+        return "No URLs provided."
+    results = await asyncio.gather(
+        *(_fetch_page_text(u) for u in urls), return_exceptions=True
+    )
+    return "\n\n===\n\n".join(
+        r if isinstance(r, str) else f"Failed to fetch {u}: {r}"
+        for u, r in zip(urls, results)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Local file transcription — audio & video files directly, no download
 # ---------------------------------------------------------------------------
@@ -5458,7 +7003,7 @@ def _strip_html(text: str) -> str:
     """Remove HTML tags from feed content."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", text)).strip()
+    return _WHITESPACE_RE.sub(" ", _HTML_TAG_RE.sub(" ", text)).strip()
 
 
 def _parse_rss_atom(xml_bytes: bytes) -> list[dict]:
@@ -5672,7 +7217,7 @@ async def _check_source_arxiv(
 
 async def _resolve_yt_channel(identifier: str) -> dict:
     """Resolve a YouTube handle/URL/ID to {channel_id, name, feed_url}."""
-    if re.match(r"^UC[\w-]{22}$", identifier):
+    if _YT_CHANNEL_ID_RE.match(identifier):
         return {
             "channel_id": identifier,
             "name": identifier,
@@ -5689,16 +7234,16 @@ async def _resolve_yt_channel(identifier: str) -> dict:
     html = await asyncio.to_thread(_fetch_url_bytes, url)
     text = html.decode("utf-8", errors="ignore")
 
-    m = (
-        re.search(r'"channelId"\s*:\s*"(UC[\w-]{22})"', text)
-        or re.search(r"channel_id=(UC[\w-]{22})", text)
-        or re.search(r"/channel/(UC[\w-]{22})", text)
-    )
+    m = None
+    for pattern in _YT_CHANNEL_REF_RES:
+        m = pattern.search(text)
+        if m:
+            break
     if not m:
         raise ValueError(f"Could not resolve YouTube channel: {identifier}")
 
     channel_id = m.group(1)
-    name_m = re.search(r'"name"\s*:\s*"([^"]{1,100})"', text)
+    name_m = _YT_NAME_RE.search(text)
     name = name_m.group(1) if name_m else identifier
 
     return {
@@ -5870,14 +7415,50 @@ async def _check_source_podcast(feed_url: str) -> list[dict]:
     return items
 
 
+_TWITTER_JS = _page_extractor("twitter", """
+() => {
+    const results = [];
+    const articles = window.__queryIn(
+        'main', 'article[data-testid="tweet"]'
+    );
+    for (const el of articles) {
+        const textEl = el.querySelector(
+            '[data-testid="tweetText"]'
+        );
+        const timeEl = el.querySelector('time');
+        const links = el.querySelectorAll(
+            'a[href*="/status/"]'
+        );
+        let tweetUrl = '';
+        for (const a of links) {
+            if (/\\/status\\/\\d+$/.test(
+                a.getAttribute('href') || ''
+            )) {
+                tweetUrl = a.href;
+                break;
+            }
+        }
+        if (textEl) {
+            results.push({
+                text: textEl.innerText.trim(),
+                time: timeEl
+                    ? timeEl.getAttribute('datetime') || ''
+                    : '',
+                url: tweetUrl,
+            });
+        }
+    }
+    return results;
+}
+""")
+
+
 async def _check_source_twitter(handle: str) -> list[dict]:
     """Scrape recent tweets from a public Twitter/X profile via Playwright."""
     handle = handle.lstrip("@")
     url = f"https://x.com/{handle}"
 
-    async with async_playwright() as pw:
-        browser, context = await _launch_browser(pw)
-        page = await context.new_page()
+    async with _context_pool.acquire() as (context, page):
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
@@ -5897,44 +7478,9 @@ async def _check_source_twitter(handle: str) -> list[dict]:
                 except Exception:
                     continue
 
-            await page.wait_for_timeout(3000)
-
-            tweets = await page.evaluate("""
-                () => {
-                    const results = [];
-                    const articles = document.querySelectorAll(
-                        'article[data-testid="tweet"]'
-                    );
-                    for (const el of articles) {
-                        const textEl = el.querySelector(
-                            '[data-testid="tweetText"]'
-                        );
-                        const timeEl = el.querySelector('time');
-                        const links = el.querySelectorAll(
-                            'a[href*="/status/"]'
-                        );
-                        let tweetUrl = '';
-                        for (const a of links) {
-                            if (/\\/status\\/\\d+$/.test(
-                                a.getAttribute('href') || ''
-                            )) {
-                                tweetUrl = a.href;
-                                break;
-                            }
-                        }
-                        if (textEl) {
-                            results.push({
-                                text: textEl.innerText.trim(),
-                                time: timeEl
-                                    ? timeEl.getAttribute('datetime') || ''
-                                    : '',
-                                url: tweetUrl,
-                            });
-                        }
-                    }
-                    return results;
-                }
-            """)
+            await _wait_for_target(page, "twitter", timeout_ms=6000)
+
+            tweets = await page.evaluate(_TWITTER_JS)
 
             items = []
             for t in tweets:
@@ -5951,8 +7497,6 @@ async def _check_source_twitter(handle: str) -> list[dict]:
 
         except Exception:
             return []  # Twitter scraping is best-effort
-        finally:
-            await browser.close()
 
 
 # ---------------------------------------------------------------------------
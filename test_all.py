@@ -47,6 +47,8 @@ from google_search_mcp.server import (
     _check_source_podcast,
     _transcript_cache_path,
     _IMAP_SERVERS,
+    _TTLCache,
+    _single_flight,
     TRANSCRIPT_CACHE_DIR,
     TRANSCRIBE_CACHE_DIR,
     subscribe,
@@ -155,6 +157,56 @@ async def test_strip_html():
         check(f"strip_html({repr(inp)[:40]}) == {repr(expected)}", result == expected)
 
 
+async def test_ttl_cache():
+    log("    Testing _TTLCache expiry and LRU eviction:")
+    cache = _TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    check("get returns stored value", cache.get("a") == 1)
+    cache.set("c", 3)  # "b" is now least recently used
+    check("LRU entry evicted at maxsize", cache.get("b") is None)
+    check("recently used entry kept", cache.get("a") == 1 and cache.get("c") == 3)
+    cache.ttl = -1
+    cache.set("d", 4)
+    check("expired entry not returned", cache.get("d") is None)
+
+
+async def test_single_flight():
+    log("    Testing _single_flight sharing and leader cancellation:")
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    results = await asyncio.gather(*(_single_flight("k1", factory) for _ in range(3)))
+    check(f"concurrent callers share one run (calls={calls})", calls == 1 and results == [1, 1, 1])
+
+    calls = 0
+    leader = asyncio.create_task(_single_flight("k2", factory))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(_single_flight("k2", factory))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    try:
+        result = await follower
+    except asyncio.CancelledError:
+        result = "CancelledError"
+    check(f"follower survives leader cancellation (got {result!r})", result == 2)
+    check("leader is cancelled", leader.cancelled())
+
+    calls = 0
+    leader = asyncio.create_task(_single_flight("k3", factory))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(_single_flight("k3", factory))
+    await asyncio.sleep(0.01)
+    follower.cancel()
+    check("leader unaffected by follower cancellation", await leader == 1)
+    check("follower is cancelled", follower.cancelled())
+
+
 async def test_rss_parsing():
     log("    Testing RSS 2.0 parsing:")
     rss_xml = b"""<?xml version="1.0"?>
@@ -729,12 +781,13 @@ async def test_tool_count():
     log("    Verifying tool registration:")
     tools = mcp._tool_manager._tools
     count = len(tools)
-    check(f"Tool count == 38 (got {count})", count == 38)
+    check(f"Tool count == 40 (got {count})", count == 40)
     expected = [
         "transcribe_local", "convert_media", "read_document", "fetch_emails",
         "paste_text", "shorten_url", "generate_qr", "archive_webpage",
         "wikipedia", "upload_to_s3", "subscribe", "check_feeds",
         "search_feeds", "get_feed_items", "list_subscriptions", "unsubscribe",
+        "visit_pages", "google_search_batch",
     ]
     for name in expected:
         check(f"Tool registered: {name}", name in tools)
@@ -758,6 +811,8 @@ async def main():
 
     section("UNIT TESTS")
     await run_test("_strip_html — HTML tag removal", test_strip_html, report_sections)
+    await run_test("_TTLCache — expiry and eviction", test_ttl_cache, report_sections)
+    await run_test("_single_flight — shared runs and cancellation", test_single_flight, report_sections)
     await run_test("_parse_rss_atom — RSS 2.0 parsing", test_rss_parsing, report_sections)
     await run_test("_parse_rss_atom — Atom parsing", test_atom_parsing, report_sections)
     await run_test("SQLite + FTS5 database", test_sqlite_fts5, report_sections)